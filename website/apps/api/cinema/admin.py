@@ -1,5 +1,6 @@
 from .audio_tracks.admin import AudioTrackInline
-from .crew.admin import CrewMemberAdmin
+from .crew.admin import CrewMemberAdmin, CrewMemberAliasTabularInline
+from .entitlements.admin import EntitlementAdmin
 from .episodes.admin import EpisodeAdmin, EpisodeTabularInline
 from .genres.admin import GenreAdmin
 from .seasons.admin import SeasonTabularInline
@@ -16,5 +17,7 @@ __all__ = [
     "AudioTrackInline",
     "SeasonTabularInline",
     "CrewMemberAdmin",
+    "CrewMemberAliasTabularInline",
     "GenreAdmin",
+    "EntitlementAdmin",
 ]
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CinemaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.api.cinema'
+
+    def ready(self):
+        from apps.api.cinema import signals as catalogue_signals  # noqa: F401
+        from apps.api.cinema.entitlements import signals as entitlement_signals  # noqa: F401
+        from apps.api.cinema.videos import signals as video_signals  # noqa: F401
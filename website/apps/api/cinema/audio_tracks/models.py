@@ -43,6 +43,20 @@ class AudioTrack(models.Model):
     def __str__(self):
         return str(self.file)
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if (
+            self.pk is not None and
+            (update_fields is None or "file" in update_fields) and
+            AudioTrack.objects.filter(pk=self.pk).exclude(file_id=self.file_id).exists()
+        ):
+            # HLS of the replaced file is stale, whoever replaced it (API, admin inline):
+            # rebuild_audio_tracks encodes tracks without HLS in the current build
+            self.hls_file = ""
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "hls_file"}
+        super().save(*args, **kwargs)
+
     def clean(self):
         if self.is_default and self.video.has_default_audio:
             raise ValidationError(_("Only one audio track can be set as default"))
@@ -0,0 +1,69 @@
+import pytest
+from django.urls import reverse
+
+from apps.api.cinema.audio_tracks.models import AudioTrack
+from apps.core.models import Language
+
+HLS_FILE = "hls/videos/v/build/language-en.m3u8"
+
+
+@pytest.fixture
+def track(make_video, make_upload) -> AudioTrack:
+    return AudioTrack.objects.create(
+        video=make_video(),
+        file=make_upload("mp3"),
+        language=Language.objects.create(code="en", name="English"),
+        hls_file=HLS_FILE,
+    )
+
+
+@pytest.mark.django_db
+class TestReplacedFileClearsHLS:
+    def test_replacing_file(self, track, make_upload):
+        track.file = make_upload("mp3")
+        track.save()
+
+        track.refresh_from_db()
+        assert track.hls_file == ""
+
+    def test_replacing_file_with_update_fields(self, track, make_upload):
+        track.file = make_upload("mp3")
+        track.save(update_fields=["file"])
+
+        track.refresh_from_db()
+        assert track.hls_file == ""
+
+    def test_other_changes_keep_hls(self, track):
+        track.is_default = True
+        track.save()
+        track.save(update_fields=["hls_file"])
+
+        track.refresh_from_db()
+        assert track.hls_file == HLS_FILE
+
+    def test_admin_inline_swap(self, track, make_upload, admin_client):
+        video = track.video
+        replacement = make_upload("mp3")
+
+        response = admin_client.post(
+            reverse("admin:cinema_video_change", args=[video.pk]),
+            {
+                "status": video.status,
+                "visibility": video.visibility,
+                "role": video.role,
+                "file": video.file_id,
+                "audio_tracks-TOTAL_FORMS": "1",
+                "audio_tracks-INITIAL_FORMS": "1",
+                "audio_tracks-0-id": track.pk,
+                "audio_tracks-0-video": video.pk,
+                "audio_tracks-0-file": replacement.pk,
+                "audio_tracks-0-language": track.language_id,
+                "resolutions-TOTAL_FORMS": "0",
+                "resolutions-INITIAL_FORMS": "0",
+            },
+        )
+
+        assert response.status_code == 302
+        track.refresh_from_db()
+        assert track.file == replacement
+        assert track.hls_file == ""
@@ -44,3 +44,14 @@ class AudioTrackViewSet(
 
     def perform_create(self, serializer):
         self._perform_update_and_create(serializer)
+
+    def perform_destroy(self, instance):
+        video = instance.video
+        with transaction.atomic():
+            instance.delete()
+            transaction.on_commit(
+                partial(
+                    VideoStatusService.rebuild_needed,
+                    video,
+                )
+            )
@@ -1,8 +1,14 @@
 from django.contrib import admin
 
-from .models import CrewMember
+from .models import CrewMember, CrewMemberAlias
+
+
+class CrewMemberAliasTabularInline(admin.TabularInline):
+    model = CrewMemberAlias
+    extra = 0
 
 
 @admin.register(CrewMember)
 class CrewMemberAdmin(admin.ModelAdmin):
-    pass
+    search_fields = ["full_name", "aliases__name"]
+    inlines = [CrewMemberAliasTabularInline]
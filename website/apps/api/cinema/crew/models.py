@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.db import models
 
 
@@ -7,5 +9,54 @@ class CrewMember(models.Model):
     # Slug is not unique, use this field as SEO URL with ID
     slug = models.SlugField()
 
+    class Meta:
+        indexes = [
+            # CrewSearchService
+            GinIndex(
+                fields=["full_name"],
+                opclasses=["gin_trgm_ops"],
+                name="crewmember_trgm_search_idx",
+            ),
+            GinIndex(
+                SearchVector("full_name", config="simple"),
+                name="crewmember_name_search_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.full_name
+
+
+class CrewMemberAlias(models.Model):
+    """
+    Alternate names crew members are searched by: birth names, transliterations, stage names.
+    """
+    crew_member = models.ForeignKey(
+        CrewMember,
+        on_delete=models.CASCADE,
+        related_name="aliases",
+    )
+    name = models.CharField(max_length=255)
+
+    class Meta:
+        indexes = [
+            # CrewSearchService
+            GinIndex(
+                fields=["name"],
+                opclasses=["gin_trgm_ops"],
+                name="crewmemberalias_trgm_idx",
+            ),
+            GinIndex(
+                SearchVector("name", config="simple"),
+                name="crewmemberalias_search_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["crew_member", "name"],
+                name="unique_crew_member_alias",
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
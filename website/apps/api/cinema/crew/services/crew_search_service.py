@@ -1,16 +1,106 @@
-from django.contrib.postgres.search import TrigramSimilarity
-from django.db.models import QuerySet
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
 
-from apps.api.cinema.crew.models import CrewMember
+from apps.api.cinema.crew.models import CrewMember, CrewMemberAlias
+from apps.core.services.search_service import SearchService
 
+SIMILARITY_THRESHOLD = 0.3
+
+
+class CrewSearchService(SearchService):
+    """
+    Crew members whose name or an alias resembles the query, most similar first.
+
+    Candidates come from the gin_trgm_ops indexes through % and <% (whole name or one of its words),
+    so they pass pg_trgm.similarity_threshold (0.3) or pg_trgm.word_similarity_threshold (0.6),
+    and from the full text indexes, every query word is a word of the name or alias.
+    Only the candidates are ranked, by the best similarity and full text rank of the name and the aliases.
+    """
+    model = CrewMember
+
+    @classmethod
+    def search(
+        cls,
+        query: str,
+        queryset: QuerySet[CrewMember] = None,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> QuerySet[CrewMember]:
+        """
+        threshold only narrows trigram candidates: they have passed the pg_trgm thresholds already,
+        so values below 0.3 return the same members. Full text matches are kept at any threshold.
+        """
+        queryset = cls.get_queryset(queryset)
+
+        if not query:
+            return queryset.none()
+
+        search_query = SearchQuery(query, search_type="websearch", config="simple")
+        aliases = CrewMemberAlias.objects.filter(cls._match("name", query))
+        full_text_aliases = CrewMemberAlias.objects.annotate(vector=cls._vector("name")).filter(vector=search_query)
+        full_text_members = CrewMember.objects.annotate(vector=cls._vector("full_name")).filter(vector=search_query)
+
+        alias_similarity = (
+            aliases
+            .filter(crew_member=OuterRef("pk"))
+            .annotate(similarity=cls._similarity("name", query))
+            .order_by("-similarity")
+            .values("similarity")[:1]
+        )
+        alias_rank = (
+            full_text_aliases
+            .filter(crew_member=OuterRef("pk"))
+            .annotate(rank=SearchRank(F("vector"), search_query))
+            .order_by("-rank")
+            .values("rank")[:1]
+        )
+        full_text = full_text_members.values("pk").union(full_text_aliases.values("crew_member"))
 
-class CrewSearchService:
-    @staticmethod
-    def search(query: str, queryset: QuerySet[CrewMember] = None) -> QuerySet[CrewMember]:
-        queryset = queryset or CrewMember.objects.all()
         return (
-            queryset.annotate(
-                similarity=TrigramSimilarity("full_name", query),
+            queryset
+            # UNION instead of OR, so every side is read from its index
+            .filter(pk__in=(
+                CrewMember.objects.filter(cls._match("full_name", query)).values("pk")
+                .union(
+                    aliases.values("crew_member"),
+                    full_text_members.values("pk"),
+                    full_text_aliases.values("crew_member"),
+                )
+            ))
+            .annotate(
+                similarity=Greatest(
+                    cls._similarity("full_name", query),
+                    Coalesce(Subquery(alias_similarity), Value(0.0), output_field=FloatField()),
+                ),
+                rank=Greatest(
+                    SearchRank(cls._vector("full_name"), search_query),
+                    Coalesce(Subquery(alias_rank), Value(0.0), output_field=FloatField()),
+                    output_field=FloatField(),
+                ),
             )
-            .order_by("-similarity")
+            .filter(Q(similarity__gte=threshold) | Q(pk__in=full_text))
+            .order_by("-similarity", "-rank", "full_name", "pk")
         )
+
+    @staticmethod
+    def _match(field: str, query: str) -> Q:
+        return Q(**{f"{field}__trigram_similar": query}) | Q(**{f"{field}__trigram_word_similar": query})
+
+    @staticmethod
+    def _similarity(field: str, query: str) -> Greatest:
+        return Greatest(
+            TrigramSimilarity(field, query),
+            TrigramWordSimilarity(query, field),
+            output_field=FloatField(),
+        )
+
+    @staticmethod
+    def _vector(field: str) -> SearchVector:
+        # The expression of the *_search_idx indexes
+        return SearchVector(field, config="simple")
@@ -0,0 +1,76 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.api.cinema.crew.models import CrewMember
+from apps.api.cinema.crew.services.crew_search_service import CrewSearchService
+
+
+def alias_names(member: CrewMember) -> set[str]:
+    return set(member.aliases.values_list("name", flat=True))
+
+
+@pytest.fixture
+def admin_api_client(admin_user) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(admin_user)
+    return client
+
+
+@pytest.mark.django_db
+class TestAliasesAPI:
+    def test_create_with_aliases(self, admin_api_client):
+        response = admin_api_client.post(
+            reverse("api:cinema:crew:crew-list"),
+            {"full_name": "Keanu Reeves", "slug": "keanu-reeves", "alias_names": ["Kianu Rivz", "Neo"]},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert set(response.data["aliases"]) == {"Kianu Rivz", "Neo"}
+        assert [m.full_name for m in CrewSearchService.search("kianu rivz")] == ["Keanu Reeves"]
+
+    def test_update_replaces_aliases(self, admin_api_client):
+        member = CrewMember.objects.create(full_name="Keanu Reeves", slug="keanu-reeves")
+        member.aliases.create(name="Kianu Rivz")
+        member.aliases.create(name="Neo")
+        url = reverse("api:cinema:crew:crew-detail", kwargs={"pk": member.pk})
+
+        response = admin_api_client.patch(url, {"alias_names": ["Neo", "John Wick"]}, format="json")
+
+        assert response.status_code == 200
+        assert alias_names(member) == {"Neo", "John Wick"}
+
+    def test_update_without_alias_names_keeps_aliases(self, admin_api_client):
+        member = CrewMember.objects.create(full_name="Keanu Reeves", slug="keanu-reeves")
+        member.aliases.create(name="Neo")
+        url = reverse("api:cinema:crew:crew-detail", kwargs={"pk": member.pk})
+
+        admin_api_client.patch(url, {"slug": "keanu"}, format="json")
+
+        assert alias_names(member) == {"Neo"}
+
+
+@pytest.mark.django_db
+def test_admin_inline_edits_aliases(admin_client):
+    member = CrewMember.objects.create(full_name="Keanu Reeves", slug="keanu-reeves")
+    alias = member.aliases.create(name="Kianu Rivz")
+
+    response = admin_client.post(
+        reverse("admin:cinema_crewmember_change", args=[member.pk]),
+        {
+            "full_name": member.full_name,
+            "slug": member.slug,
+            "aliases-TOTAL_FORMS": "2",
+            "aliases-INITIAL_FORMS": "1",
+            "aliases-0-id": alias.pk,
+            "aliases-0-crew_member": member.pk,
+            "aliases-0-name": "Kianu Rivz",
+            "aliases-0-DELETE": "on",
+            "aliases-1-crew_member": member.pk,
+            "aliases-1-name": "Neo",
+        },
+    )
+
+    assert response.status_code == 302
+    assert alias_names(member) == {"Neo"}
@@ -0,0 +1,84 @@
+import pytest
+
+from apps.api.cinema.crew.models import CrewMember, CrewMemberAlias
+from apps.api.cinema.crew.services.crew_search_service import SIMILARITY_THRESHOLD, CrewSearchService
+
+
+def names(queryset) -> list[str]:
+    return [member.full_name for member in queryset]
+
+
+@pytest.fixture
+def crew(db):
+    members = {
+        full_name: CrewMember.objects.create(full_name=full_name, slug=full_name.lower().replace(" ", "-"))
+        for full_name in ("Keanu Reeves", "John Ronald Reuel Tolkien", "Bruce Willis", "Laurence Fishburne")
+    }
+    CrewMemberAlias.objects.bulk_create([
+        CrewMemberAlias(crew_member=members["Keanu Reeves"], name="Kianu Rivz"),
+        CrewMemberAlias(crew_member=members["John Ronald Reuel Tolkien"], name="Professor of English at Oxford"),
+        CrewMemberAlias(crew_member=members["Bruce Willis"], name="Walter Bruce Willison"),
+    ])
+    return members
+
+
+@pytest.mark.django_db
+class TestCrewSearchAliases:
+    def test_matches_alias(self, crew):
+        members = CrewSearchService.search("kianu rivz")
+
+        assert names(members) == ["Keanu Reeves"]
+        assert members[0].similarity == pytest.approx(1.0)
+
+    def test_best_of_name_and_aliases(self, crew):
+        by_name = CrewSearchService.search("bruce willis")[0]
+        by_alias = CrewSearchService.search("walter bruce willison")[0]
+
+        assert by_name.full_name == by_alias.full_name == "Bruce Willis"
+        assert by_name.similarity == by_alias.similarity == pytest.approx(1.0)
+
+    def test_alias_full_text(self, crew):
+        members = CrewSearchService.search("oxford professor", threshold=1.0)
+
+        assert names(members) == ["John Ronald Reuel Tolkien"]
+        assert members[0].similarity < 1.0
+        assert members[0].rank > 0
+
+    def test_member_listed_once(self, crew):
+        CrewMemberAlias.objects.create(crew_member=crew["Keanu Reeves"], name="Keanu")
+
+        assert names(CrewSearchService.search("keanu")) == ["Keanu Reeves"]
+
+
+@pytest.mark.django_db
+class TestCrewSearchThreshold:
+    def test_typo_passes_default_threshold(self, crew):
+        member = CrewSearchService.search("keanu reevs").get()
+
+        assert SIMILARITY_THRESHOLD <= member.similarity < 0.9
+
+    def test_threshold_cuts_off(self, crew):
+        assert names(CrewSearchService.search("keanu reevs", threshold=0.9)) == []
+
+    def test_threshold_below_default_does_not_widen(self, crew):
+        default = names(CrewSearchService.search("keanu"))
+
+        assert names(CrewSearchService.search("keanu", threshold=0.0)) == default == ["Keanu Reeves"]
+
+    def test_full_text_match_kept_at_any_threshold(self, crew):
+        member = CrewSearchService.search("tolkien john", threshold=1.0).get()
+
+        assert member.full_name == "John Ronald Reuel Tolkien"
+        assert member.similarity < 1.0
+        assert member.rank > 0
+
+    def test_most_similar_first(self, crew):
+        CrewMember.objects.create(full_name="Keanu Reed", slug="keanu-reed")
+
+        members = CrewSearchService.search("keanu reeves")
+
+        assert names(members) == ["Keanu Reeves", "Keanu Reed"]
+        assert members[0].similarity > members[1].similarity
+
+    def test_empty_query(self, crew):
+        assert names(CrewSearchService.search("")) == []
@@ -1,9 +1,47 @@
+from django.db import transaction
 from rest_framework import serializers
 
-from apps.api.cinema.crew.models import CrewMember
+from apps.api.cinema.crew.models import CrewMember, CrewMemberAlias
 
 
 class CrewMemberSerializer(serializers.ModelSerializer):
+    aliases = serializers.SlugRelatedField(
+        slug_field="name",
+        many=True,
+        read_only=True,
+    )
+    # Replaces all aliases when given
+    alias_names = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        write_only=True,
+        required=False,
+    )
+
     class Meta:
         model = CrewMember
         fields = '__all__'
+
+    @transaction.atomic
+    def create(self, validated_data):
+        alias_names = validated_data.pop("alias_names", [])
+        crew_member = super().create(validated_data)
+        self.set_aliases(crew_member, alias_names)
+        return crew_member
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        alias_names = validated_data.pop("alias_names", None)
+        crew_member = super().update(instance, validated_data)
+        if alias_names is not None:
+            self.set_aliases(crew_member, alias_names)
+        return crew_member
+
+    @staticmethod
+    def set_aliases(crew_member: CrewMember, alias_names: list[str]):
+        names = set(alias_names)
+        crew_member.aliases.exclude(name__in=names).delete()
+        existing = set(crew_member.aliases.values_list("name", flat=True))
+        CrewMemberAlias.objects.bulk_create([
+            CrewMemberAlias(crew_member=crew_member, name=name)
+            for name in names - existing
+        ])
@@ -1,17 +1,18 @@
 from rest_framework.viewsets import ModelViewSet
 
-from apps.api.mixins import VersioningAPIViewMixin
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
 
 from .filters import CrewMemberFilterSet
 from .models import CrewMember
 from .v1.serializers import CrewMemberSerializer
 
 
-class CrewMemberViewSet(VersioningAPIViewMixin, ModelViewSet):
-    queryset = CrewMember.objects.all()
+class CrewMemberViewSet(VersioningAPIViewMixin, CachedResponseMixin, ModelViewSet):
+    queryset = CrewMember.objects.prefetch_related("aliases")
     filterset_class = CrewMemberFilterSet
     version_map = {
         "v1": {
             "serializer_class": CrewMemberSerializer,
         }
     }
+    cache_tags = ("crew",)
@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from .models import Entitlement
+
+
+@admin.register(Entitlement)
+class EntitlementAdmin(admin.ModelAdmin):
+    # Materialized by EntitlementService, read only
+    list_display = ["user", "scope", "title", "season", "episode", "genre", "expires"]
+    list_filter = ["scope"]
+    search_fields = ["user__email"]
+    list_select_related = ["user", "title", "season", "episode", "genre"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
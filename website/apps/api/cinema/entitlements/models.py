@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q, QuerySet
+from django.db.models.manager import BaseManager
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.titles.models import Title
+
+
+class EntitlementQuerySet(QuerySet):
+    def active(self):
+        return self.filter(Q(expires__isnull=True) | Q(expires__gt=timezone.now()))
+
+
+class EntitlementManager(BaseManager.from_queryset(EntitlementQuerySet)):
+    pass
+
+
+class Entitlement(models.Model):
+    """
+    Watch grant of a user, materialized from global, user object and group object permissions.
+    Rows are rebuilt per user by EntitlementService, never edit them by hand.
+    """
+    class Scope(models.TextChoices):
+        # Values are permission codenames the rows are materialized from
+        ALL = "can_watch_all", _("All titles")
+        ALL_MOVIES = "can_watch_all_movies", _("All movies")
+        ALL_SHOWS = "can_watch_all_shows", _("All shows")
+        TITLE = "can_watch_title", _("Title")
+        SEASON = "can_watch_season", _("Season")
+        EPISODE = "can_watch_episode", _("Episode")
+        GENRE = "can_watch_genre", _("Genre")
+        GENRE_MOVIES = "can_watch_genre_movies", _("Movies in genre")
+        GENRE_SHOWS = "can_watch_genre_shows", _("Shows in genre")
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="entitlements",
+    )
+    scope = models.CharField(choices=Scope.choices, max_length=30)
+    # Exactly one is set for object scopes, none for global ones
+    title = models.ForeignKey(Title, on_delete=models.CASCADE, null=True, blank=True)
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, null=True, blank=True)
+    episode = models.ForeignKey(Episode, on_delete=models.CASCADE, null=True, blank=True)
+    genre = models.ForeignKey(Genre, on_delete=models.CASCADE, null=True, blank=True)
+    # Expiration of the subscription the grant comes from, null means no expiration
+    expires = models.DateTimeField(null=True, blank=True)
+
+    objects = EntitlementManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "scope"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {self.scope}"
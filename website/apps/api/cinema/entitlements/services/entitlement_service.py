@@ -0,0 +1,158 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Q
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from apps.api.cinema.entitlements.models import Entitlement
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.videos.services.watch_permission_service import WatchPermissionService
+from apps.api.custom_user.models import UserSubscription
+
+User = get_user_model()
+
+GLOBAL_SCOPES = (
+    Entitlement.Scope.ALL,
+    Entitlement.Scope.ALL_MOVIES,
+    Entitlement.Scope.ALL_SHOWS,
+)
+# Scope -> (model the object permission is assigned on, Entitlement field)
+OBJECT_SCOPES: dict[str, tuple[type[models.Model], str]] = {
+    Entitlement.Scope.TITLE: (Title, "title"),
+    Entitlement.Scope.SEASON: (Season, "season"),
+    Entitlement.Scope.EPISODE: (Episode, "episode"),
+    Entitlement.Scope.GENRE: (Genre, "genre"),
+    Entitlement.Scope.GENRE_MOVIES: (Genre, "genre"),
+    Entitlement.Scope.GENRE_SHOWS: (Genre, "genre"),
+}
+REFRESH_BATCH_SIZE = 500
+
+
+class EntitlementService:
+    """
+    Keeps Entitlement rows in sync with the permissions they are materialized from.
+
+    A refresh recomputes every row of the given users. Grants that come through a
+    subscription group expire with the user's subscription to it; grants from a group
+    the user has no subscription for, or assigned to the user directly, don't expire.
+    """
+
+    @classmethod
+    def refresh_user(cls, user) -> None:
+        cls.refresh([user.pk])
+
+    @classmethod
+    @transaction.atomic
+    def refresh(cls, user_ids: Iterable) -> None:
+        user_ids = set(user_ids)
+        # Permission backends grant nothing to inactive users
+        active_ids = list(User.objects.filter(pk__in=user_ids, is_active=True).values_list("pk", flat=True))
+        group_expires = cls._group_expiration(active_ids)
+        grants: dict[tuple[int, str, str | None], datetime | None] = {}
+
+        def grant(user_id, group_id, scope: str, object_pk: str | None = None):
+            expires = group_expires.get((user_id, group_id)) if group_id is not None else None
+            key = (user_id, scope, object_pk)
+            if key not in grants:
+                grants[key] = expires
+            elif grants[key] is not None:
+                grants[key] = None if expires is None else max(grants[key], expires)
+
+        global_perms = Permission.objects.filter(
+            content_type__app_label=Title._meta.app_label,
+            codename__in=GLOBAL_SCOPES,
+        )
+        for user_id, codename in global_perms.filter(user__in=active_ids).values_list("user", "codename"):
+            grant(user_id, None, codename)
+        for user_id, group_id, codename in (
+            global_perms.filter(group__user__in=active_ids).values_list("group__user", "group", "codename")
+        ):
+            grant(user_id, group_id, codename)
+
+        object_query = Q()
+        for scope, (model, _) in OBJECT_SCOPES.items():
+            object_query |= Q(content_type=ContentType.objects.get_for_model(model), permission__codename=scope)
+        for user_id, codename, object_pk in (
+            UserObjectPermission.objects
+            .filter(object_query, user__in=active_ids)
+            .values_list("user", "permission__codename", "object_pk")
+        ):
+            grant(user_id, None, codename, object_pk)
+        for user_id, group_id, codename, object_pk in (
+            GroupObjectPermission.objects
+            .filter(object_query, group__user__in=active_ids)
+            .values_list("group__user", "group", "permission__codename", "object_pk")
+        ):
+            grant(user_id, group_id, codename, object_pk)
+
+        existing = cls._existing_objects(object_pk for _, scope, object_pk in grants if object_pk is not None)
+        entitlements = []
+        for (user_id, scope, object_pk), expires in grants.items():
+            entitlement = Entitlement(user_id=user_id, scope=scope, expires=expires)
+            if object_pk is not None:
+                # Guardian keeps permissions of deleted objects
+                model, field = OBJECT_SCOPES[scope]
+                if object_pk not in existing[model]:
+                    continue
+                setattr(entitlement, f"{field}_id", existing[model][object_pk])
+            entitlements.append(entitlement)
+
+        Entitlement.objects.filter(user__in=user_ids).delete()
+        Entitlement.objects.bulk_create(entitlements)
+
+        for user_id in user_ids:
+            WatchPermissionService.invalidate_user(user_id)
+
+    @classmethod
+    def refresh_group(cls, group_id) -> None:
+        """
+        Refreshes every member, call when permissions of the group change.
+        """
+        user_ids = list(User.objects.filter(groups=group_id).values_list("pk", flat=True))
+        for start in range(0, len(user_ids), REFRESH_BATCH_SIZE):
+            cls.refresh(user_ids[start:start + REFRESH_BATCH_SIZE])
+
+    @classmethod
+    def rebuild(cls) -> None:
+        user_ids = list(User.objects.values_list("pk", flat=True))
+        for start in range(0, len(user_ids), REFRESH_BATCH_SIZE):
+            cls.refresh(user_ids[start:start + REFRESH_BATCH_SIZE])
+
+    @staticmethod
+    def _group_expiration(user_ids: list) -> dict[tuple, datetime | None]:
+        """
+        (user, subscription group) -> the latest expiration of the user's subscriptions to it.
+        """
+        result: dict[tuple, datetime | None] = {}
+        for user_id, group_id, expires in (
+            UserSubscription.objects
+            .filter(user__in=user_ids, disabled=False)
+            .values_list("user", "subscription__group", "expires")
+        ):
+            key = (user_id, group_id)
+            if key not in result:
+                result[key] = expires
+            elif result[key] is not None:
+                result[key] = None if expires is None else max(result[key], expires)
+        return result
+
+    @staticmethod
+    def _existing_objects(object_pks: Iterable[str]) -> dict[type[models.Model], dict[str, int]]:
+        """
+        object_pk -> primary key of objects that still exist, per model.
+        """
+        object_pks = {object_pk for object_pk in object_pks if object_pk.isdigit()}
+        return {
+            model: {
+                str(pk): pk
+                for pk in model.objects.filter(pk__in=object_pks).values_list("pk", flat=True)
+            }
+            for model in {model for model, _ in OBJECT_SCOPES.values()}
+        }
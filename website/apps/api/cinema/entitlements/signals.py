@@ -0,0 +1,75 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from apps.api.cinema.entitlements.services.entitlement_service import EntitlementService
+from apps.api.cinema.entitlements.tasks import rebuild_entitlements, refresh_group_entitlements
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=UserObjectPermission)
+@receiver(post_delete, sender=UserObjectPermission)
+def refresh_user_object_permission(instance: UserObjectPermission, **kwargs):
+    EntitlementService.refresh([instance.user_id])
+
+
+@receiver(post_save, sender=GroupObjectPermission)
+@receiver(post_delete, sender=GroupObjectPermission)
+def refresh_group_object_permission(instance: GroupObjectPermission, **kwargs):
+    # Subscription groups can have many members
+    transaction.on_commit(partial(refresh_group_entitlements.delay, instance.group_id))
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def refresh_group_permissions(instance, action: str, reverse: bool, pk_set: set | None, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        transaction.on_commit(partial(refresh_group_entitlements.delay, instance.pk))
+    elif pk_set:
+        for pk in pk_set:
+            transaction.on_commit(partial(refresh_group_entitlements.delay, pk))
+    else:
+        # Permission cleared from every group, the groups are unknown by now
+        transaction.on_commit(rebuild_entitlements.delay)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def refresh_user_relations(instance, action: str, reverse: bool, pk_set: set | None, **kwargs):
+    if action == "pre_clear" and reverse:
+        # Members are unknown after clear()
+        instance._entitlement_user_ids = list(instance.user_set.values_list("pk", flat=True))
+        return
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        EntitlementService.refresh([instance.pk])
+    elif action == "post_clear":
+        EntitlementService.refresh(getattr(instance, "_entitlement_user_ids", []))
+    else:
+        EntitlementService.refresh(pk_set or [])
+
+
+@receiver(pre_save, sender=User)
+def remember_user_is_active(instance: User, update_fields: frozenset | None, raw: bool, **kwargs):
+    # Entitlements depend on is_active only, staff and superusers are allowed at request time
+    if raw or instance.pk is None or (update_fields is not None and "is_active" not in update_fields):
+        return
+    instance._entitlement_was_active = (
+        User.objects.filter(pk=instance.pk).values_list("is_active", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=User)
+def refresh_user(instance: User, created: bool, **kwargs):
+    # Logins, profile edits and subscription changes (refreshed by UserSubscriptionService) are skipped
+    was_active = instance.__dict__.pop("_entitlement_was_active", instance.is_active)
+    if created or was_active != instance.is_active:
+        EntitlementService.refresh([instance.pk])
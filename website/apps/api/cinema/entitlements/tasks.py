@@ -0,0 +1,16 @@
+from celery import shared_task
+
+from apps.api.cinema.entitlements.services.entitlement_service import EntitlementService
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def refresh_group_entitlements(self, group_id: int):
+    try:
+        EntitlementService.refresh_group(group_id)
+    except Exception as exc:
+        raise self.retry(exc=exc) from exc
+
+
+@shared_task
+def rebuild_entitlements():
+    EntitlementService.rebuild()
@@ -0,0 +1,55 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.api.cinema.entitlements.services.entitlement_service import EntitlementService
+from apps.api.custom_user import signals as custom_user_signals
+
+
+@pytest.fixture
+def refreshed(monkeypatch) -> list[list]:
+    calls = []
+    monkeypatch.setattr(EntitlementService, "refresh", classmethod(lambda cls, user_ids: calls.append(list(user_ids))))
+    # Saves of existing users queue a Stripe customer update
+    monkeypatch.setattr(custom_user_signals.update_stripe_customer_task, "delay", lambda **kwargs: None)
+    return calls
+
+
+@pytest.fixture
+def user(db):
+    return get_user_model().objects.create_user(email="viewer@example.com", password="viewer")
+
+
+@pytest.mark.django_db
+class TestRefreshUser:
+    def test_created(self, refreshed):
+        user = get_user_model().objects.create_user(email="new@example.com", password="new")
+
+        assert refreshed == [[user.pk]]
+
+    def test_login_is_skipped(self, user, refreshed):
+        user.last_login = timezone.now()
+        user.save(update_fields=["last_login"])
+
+        assert refreshed == []
+
+    def test_profile_edit_is_skipped(self, user, refreshed):
+        user.first_name = "Neo"
+        user.save()
+
+        assert refreshed == []
+
+    def test_deactivation(self, user, refreshed):
+        user.is_active = False
+        user.save()
+        user.last_login = timezone.now()
+        user.save(update_fields=["last_login"])
+
+        assert refreshed == [[user.pk]]
+
+    def test_activation_with_update_fields(self, user, refreshed):
+        get_user_model().objects.filter(pk=user.pk).update(is_active=False)
+        user.is_active = True
+        user.save(update_fields=["is_active"])
+
+        assert refreshed == [[user.pk]]
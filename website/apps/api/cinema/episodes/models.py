@@ -5,7 +5,7 @@ from django.utils.translation import gettext_lazy as _
 from apps.api.cinema.seasons.models import Season
 from apps.api.cinema.titles.models import Title
 from apps.api.cinema.videos.models import ToggleWatchModel, Video
-from apps.core.models import DescriptiveModel, OrderableModel
+from apps.core.models import DescriptiveModel, OrderableModel, TimestampModel
 
 
 class EpisodeManager(models.Manager):
@@ -15,7 +15,7 @@ class EpisodeManager(models.Manager):
         )
 
 
-class Episode(OrderableModel, ToggleWatchModel, DescriptiveModel):
+class Episode(OrderableModel, ToggleWatchModel, DescriptiveModel, TimestampModel):
     season = models.ForeignKey(
         Season,
         on_delete=models.CASCADE,
@@ -35,6 +35,11 @@ class Episode(OrderableModel, ToggleWatchModel, DescriptiveModel):
     public = EpisodeManager()
 
     class Meta(OrderableModel.Meta, ToggleWatchModel.Meta, DescriptiveModel.Meta):
+        indexes = [
+            *DescriptiveModel.Meta.indexes,
+            # Delta export, see CatalogueExportService
+            models.Index(fields=["updated_at"]),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["ordering", "season"],
@@ -2,7 +2,7 @@ from rest_framework import mixins
 from rest_framework.viewsets import GenericViewSet
 
 from apps.api.cinema.videos.mixins import TogglWatchViewSetMixin
-from apps.api.mixins import VersioningAPIViewMixin
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
 
 from .filters import EpisodeFilterSet
 from .models import Episode
@@ -11,6 +11,7 @@ from .v1.serializers import EpisodeSerializer
 
 class EpisodeViewSet(
     VersioningAPIViewMixin,
+    CachedResponseMixin,
     TogglWatchViewSetMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
@@ -25,3 +26,4 @@ class EpisodeViewSet(
             "serializer_class": EpisodeSerializer,
         }
     }
+    cache_tags = ("episode",)
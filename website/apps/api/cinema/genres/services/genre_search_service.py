@@ -1,15 +1,12 @@
-from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import QuerySet
 
 from apps.api.cinema.genres.models import Genre
+from apps.core.services.search_service import SearchService
 
 
-class GenreSearchService:
-    @staticmethod
-    def search(query: str, queryset: QuerySet[Genre] = None) -> QuerySet[Genre]:
-        queryset = queryset or Genre.objects.all()
-        return (
-            queryset
-            .annotate(similarity=TrigramSimilarity("name", query))
-            .order_by("-similarity")
-        )
+class GenreSearchService(SearchService):
+    model = Genre
+
+    @classmethod
+    def search(cls, query: str, queryset: QuerySet[Genre] = None) -> QuerySet[Genre]:
+        return cls.trigram_search("name", query, queryset)
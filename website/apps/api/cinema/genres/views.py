@@ -1,13 +1,13 @@
 from rest_framework.viewsets import ModelViewSet
 
-from apps.api.mixins import VersioningAPIViewMixin
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
 
 from .filters import GenreFilterSet
 from .models import Genre
 from .v1.serializers import GenreSerializer
 
 
-class GenreViewSet(VersioningAPIViewMixin, ModelViewSet):
+class GenreViewSet(VersioningAPIViewMixin, CachedResponseMixin, ModelViewSet):
     queryset = Genre.objects.all()
     filterset_class = GenreFilterSet
     lookup_url_kwarg = "slug"
@@ -17,3 +17,4 @@ class GenreViewSet(VersioningAPIViewMixin, ModelViewSet):
             "serializer_class": GenreSerializer,
         }
     }
+    cache_tags = ("genre",)
@@ -0,0 +1,134 @@
+import os
+import secrets
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from library.aws.client.s3 import S3UploadClient
+
+from apps.api.cinema.videos.tasks import (
+    RENDITIONS,
+    Rendition,
+    fetch_source,
+    ffmpeg_build_rendition_command,
+    run_cmd,
+    write_hls_keyinfo,
+)
+
+MODES = {
+    "download": False,
+    "stream": True,
+}
+
+
+class DiskUsageSampler:
+    """
+    Samples the size of everything under a directory from a background thread
+    and keeps the peak. Deleted files drop out of the next sample.
+    """
+
+    def __init__(self, root: Path, interval: float):
+        self.root = root
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+
+    def __enter__(self) -> "DiskUsageSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        return False
+
+    def sample(self) -> None:
+        size = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                try:
+                    size += os.path.getsize(os.path.join(dirpath, name))
+                except OSError:
+                    # ffmpeg renames temp_file segments while we walk
+                    continue
+        self.peak = max(self.peak, size)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+class Command(BaseCommand):
+    help = (
+        "Transcode one rendition of an S3 source with the source downloaded first "
+        "and streamed from a presigned URL (HLS_SOURCE_STREAMING), "
+        "report job time and peak temporary disk usage of both."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("key", help="S3 key of the source video")
+        parser.add_argument(
+            "--rendition",
+            default=RENDITIONS[0].name,
+            choices=[r.name for r in RENDITIONS],
+        )
+        parser.add_argument("--runs", type=int, default=3)
+        parser.add_argument("--mode", choices=list(MODES), action="append", dest="modes")
+        parser.add_argument("--interval", type=float, default=0.2, help="Disk sampling interval, seconds")
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1:
+            raise CommandError("--runs must be at least 1")
+
+        rendition = next(r for r in RENDITIONS if r.name == options["rendition"])
+        upload_client = S3UploadClient()
+        modes = options["modes"] or list(MODES)
+
+        for mode in modes:
+            timings, peaks = [], []
+            for _ in range(options["runs"]):
+                elapsed, peak = self.run_once(
+                    upload_client, options["key"], rendition, MODES[mode], options["interval"],
+                )
+                timings.append(elapsed)
+                peaks.append(peak)
+
+            self.stdout.write(
+                f"{mode:<8} runs={len(timings)} "
+                f"time median={statistics.median(timings):.2f}s max={max(timings):.2f}s "
+                f"peak disk median={statistics.median(peaks) / 2**20:.1f}MiB max={max(peaks) / 2**20:.1f}MiB"
+            )
+
+    @staticmethod
+    def run_once(
+        upload_client: S3UploadClient,
+        key: str,
+        rendition: Rendition,
+        streaming: bool,
+        interval: float,
+    ) -> tuple[float, int]:
+        """One job as transcode_rendition runs it, segments stay on disk instead of being published."""
+        with tempfile.TemporaryDirectory() as td:
+            tmpdir = Path(td)
+            out_dir = tmpdir / "out"
+            out_dir.mkdir(parents=True, exist_ok=True)
+            _, hls_keyinfo_path = write_hls_keyinfo(
+                out_dir,
+                secrets.token_bytes(16),
+                secrets.token_hex(16),
+                "https://localhost/key",
+            )
+
+            with DiskUsageSampler(tmpdir, interval) as sampler, override_settings(HLS_SOURCE_STREAMING=streaming):
+                started = time.perf_counter()
+                local_src = fetch_source(upload_client, key, tmpdir)
+                run_cmd(ffmpeg_build_rendition_command(local_src, out_dir, rendition, hls_keyinfo_path))
+                elapsed = time.perf_counter() - started
+
+        return elapsed, sampler.peak
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from apps.api.cinema.entitlements.services.entitlement_service import EntitlementService
+from apps.api.cinema.entitlements.tasks import rebuild_entitlements
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Entitlement rows of every user from guardian, auth and subscription tables. "
+        "Run once after migrating to cinema.0005_entitlement, and whenever the rows drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Queue the rebuild_entitlements Celery task instead of running in this process",
+        )
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            result = rebuild_entitlements.delay()
+            self.stdout.write(f"Queued rebuild_entitlements task {result.id}")
+            return
+
+        EntitlementService.rebuild()
+        self.stdout.write(self.style.SUCCESS("Entitlements rebuilt"))
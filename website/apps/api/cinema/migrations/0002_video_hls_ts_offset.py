@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-17 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='hls_ts_offset',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+    ]
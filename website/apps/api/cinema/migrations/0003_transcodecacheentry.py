@@ -0,0 +1,31 @@
+# Generated by Django 4.2.23 on 2026-10-17 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0002_video_hls_ts_offset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscodeCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('hls_build_prefix', models.CharField(max_length=255)),
+                ('hls_decrypt_key', models.CharField(max_length=255)),
+                ('key_uri', models.CharField(max_length=1024)),
+                ('resolutions', models.JSONField(default=dict)),
+                ('audio_tracks', models.JSONField(default=dict)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'abstract': False,
+            },
+        ),
+    ]
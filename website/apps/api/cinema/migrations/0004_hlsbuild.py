@@ -0,0 +1,32 @@
+# Generated by Django 4.2.23 on 2026-10-17 22:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0003_transcodecacheentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HLSBuild',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('prefix', models.CharField(max_length=255, unique=True)),
+                ('decrypt_key', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('building', 'Building'), ('live', 'Live'), ('retired', 'Retired')], default='building', max_length=20)),
+                ('retired_at', models.DateTimeField(blank=True, null=True)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='builds', to='cinema.video')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['status', 'retired_at'], name='cinema_hlsb_status_1fcd17_idx')],
+            },
+        ),
+    ]
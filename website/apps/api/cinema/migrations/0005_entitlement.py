@@ -0,0 +1,32 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('cinema', '0004_hlsbuild'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Entitlement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('can_watch_all', 'All titles'), ('can_watch_all_movies', 'All movies'), ('can_watch_all_shows', 'All shows'), ('can_watch_title', 'Title'), ('can_watch_season', 'Season'), ('can_watch_episode', 'Episode'), ('can_watch_genre', 'Genre'), ('can_watch_genre_movies', 'Movies in genre'), ('can_watch_genre_shows', 'Shows in genre')], max_length=30)),
+                ('expires', models.DateTimeField(blank=True, null=True)),
+                ('episode', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='cinema.episode')),
+                ('genre', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='cinema.genre')),
+                ('season', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='cinema.season')),
+                ('title', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='cinema.title')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entitlements', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'scope'], name='cinema_enti_user_id_6e9a31_idx')],
+            },
+        ),
+    ]
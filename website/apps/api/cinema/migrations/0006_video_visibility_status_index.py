@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0005_entitlement'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['visibility', 'status'], name='cinema_vide_visibil_fe65e6_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:34
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0007_catalogue_timestamps'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='episode',
+            name='episode_gin_search_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='season',
+            name='season_gin_search_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='title',
+            name='title_gin_search_idx',
+        ),
+        migrations.AddField(
+            model_name='episode',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, serialize=False),
+        ),
+        apps.core.operations.SearchVectorTrigger(
+            model_name='episode',
+        ),
+        apps.core.operations.SearchVectorTrigger(
+            model_name='season',
+        ),
+        apps.core.operations.SearchVectorTrigger(
+            model_name='title',
+        ),
+        migrations.AddIndex(
+            model_name='episode',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='episode_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='season_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='title_search_vector_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:37
+
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0008_descriptive_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='title',
+            index=models.Index(django.db.models.functions.comparison.Collate(django.db.models.functions.text.Lower('name'), 'C'), models.F('id'), name='title_name_prefix_idx'),
+        ),
+    ]
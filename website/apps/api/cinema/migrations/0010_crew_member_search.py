@@ -0,0 +1,39 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:42
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0009_title_name_prefix_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrewMemberAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='crewmember',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['full_name'], name='crewmember_trgm_search_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddField(
+            model_name='crewmemberalias',
+            name='crew_member',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='cinema.crewmember'),
+        ),
+        migrations.AddIndex(
+            model_name='crewmemberalias',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='crewmemberalias_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddConstraint(
+            model_name='crewmemberalias',
+            constraint=models.UniqueConstraint(fields=('crew_member', 'name'), name='unique_crew_member_alias'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.23 on 2026-10-18 00:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0010_crew_member_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='crewmember',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('full_name', config='simple'), name='crewmember_name_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='crewmemberalias',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple'), name='crewmemberalias_search_idx'),
+        ),
+    ]
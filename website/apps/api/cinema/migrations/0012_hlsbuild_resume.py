@@ -0,0 +1,23 @@
+# Generated by Django 4.2.23 on 2026-10-18 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0011_crew_member_full_text_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hlsbuild',
+            name='fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='hlsbuild',
+            name='iv',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
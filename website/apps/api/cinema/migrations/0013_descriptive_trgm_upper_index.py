@@ -0,0 +1,27 @@
+# Generated by Django 4.2.23 on 2026-10-18 00:17
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0012_hlsbuild_resume'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='episode',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='episode_trgm_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='season_trgm_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='title',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='title_trgm_upper_idx'),
+        ),
+    ]
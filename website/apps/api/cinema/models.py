@@ -1,8 +1,9 @@
 from .audio_tracks.models import AudioTrack
+from .entitlements.models import Entitlement
 from .genres.models import Genre
 from .seasons.models import Season
 from .titles.models import Title, TitleCrewMember, TitleManager
-from .videos.models import Video, VideoResolution
+from .videos.models import HLSBuild, TranscodeCacheEntry, Video, VideoResolution
 
 __all__ = [
     "Genre",
@@ -12,5 +13,8 @@ __all__ = [
     "Season",
     "Video",
     "VideoResolution",
+    "TranscodeCacheEntry",
+    "HLSBuild",
     "AudioTrack",
+    "Entitlement",
 ]
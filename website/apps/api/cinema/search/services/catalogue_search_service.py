@@ -0,0 +1,107 @@
+from django.db.models import CharField, F, IntegerField, QuerySet, Value
+
+from apps.api.cinema.crew.services.crew_search_service import SIMILARITY_THRESHOLD, CrewSearchService
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.titles.models import Title
+from apps.core.services.descriptive_search_service import DescriptiveSearchService
+
+# Result columns, every type selects all of them in this order for UNION ALL
+COLUMNS = ("type", "id", "name", "slug", "title", "season", "episode", "score")
+
+
+class CatalogueSearchService:
+    """
+    Titles, episodes, crew and genres matching a query in one UNION ALL statement.
+    Each type is ranked with the DescriptiveSearchService weights and limited on its own,
+    weights are passed through to it. Crew is matched by CrewSearchService, aliases included,
+    with trigram_threshold as its threshold, and scored by its best name or alias similarity and rank.
+
+    Episodes carry title, season and episode numbers to build
+    /titles/<title>/seasons/<season>/episodes/<episode>/.
+    """
+    TYPES = ("titles", "episodes", "crew", "genres")
+
+    @classmethod
+    def search(
+        cls,
+        query: str,
+        limit: int,
+        types: tuple[str, ...] = TYPES,
+        public_only: bool = True,
+        **weights,
+    ) -> dict[str, list[dict]]:
+        results = {type_: [] for type_ in types}
+        if not query or not types:
+            return results
+
+        first, *rest = [
+            cls._columns(getattr(cls, f"_{type_}")(query, public_only, **weights), type_)[:limit]
+            for type_ in types
+        ]
+        for row in first.union(*rest, all=True):
+            result = {column: row[f"result_{column}"] for column in COLUMNS}
+            results[result.pop("type")].append(result)
+
+        for rows in results.values():
+            rows.sort(key=lambda result: result["score"], reverse=True)
+        return results
+
+    @staticmethod
+    def _titles(query: str, public_only: bool, **weights) -> QuerySet:
+        titles = Title.public.all() if public_only else Title.objects.all()
+        return DescriptiveSearchService.search(query, titles, **weights).annotate(
+            result_id=F("pk"),
+            result_name=F("name"),
+            result_slug=F("slug"),
+            result_title=Value(None, output_field=IntegerField()),
+            result_season=Value(None, output_field=IntegerField()),
+            result_episode=Value(None, output_field=IntegerField()),
+        )
+
+    @staticmethod
+    def _episodes(query: str, public_only: bool, **weights) -> QuerySet:
+        episodes = Episode.public.all() if public_only else Episode.objects.all()
+        return DescriptiveSearchService.search(query, episodes, **weights).annotate(
+            result_id=F("pk"),
+            result_name=F("name"),
+            result_slug=Value(None, output_field=CharField()),
+            result_title=F("season__title"),
+            result_season=F("season__ordering"),
+            result_episode=F("ordering"),
+        )
+
+    @staticmethod
+    def _crew(query: str, public_only: bool, trigram_threshold: float = SIMILARITY_THRESHOLD, **weights) -> QuerySet:
+        crew = CrewSearchService.search(query, threshold=trigram_threshold)
+        return DescriptiveSearchService.scored(crew, query, "full_name", **weights).annotate(
+            result_id=F("pk"),
+            result_name=F("full_name"),
+            result_slug=F("slug"),
+            result_title=Value(None, output_field=IntegerField()),
+            result_season=Value(None, output_field=IntegerField()),
+            result_episode=Value(None, output_field=IntegerField()),
+        )
+
+    @staticmethod
+    def _genres(query: str, public_only: bool, **weights) -> QuerySet:
+        return DescriptiveSearchService.name_search(query, Genre.objects.all(), **weights).annotate(
+            result_id=F("pk"),
+            result_name=F("name"),
+            result_slug=F("slug"),
+            result_title=Value(None, output_field=IntegerField()),
+            result_season=Value(None, output_field=IntegerField()),
+            result_episode=Value(None, output_field=IntegerField()),
+        )
+
+    @staticmethod
+    def _columns(queryset: QuerySet, type_: str) -> QuerySet:
+        # values() selects annotations in the order they were added, the same for every type
+        return (
+            queryset
+            .annotate(
+                result_score=F("score"),
+                result_type=Value(type_, output_field=CharField()),
+            )
+            .values(*(f"result_{column}" for column in COLUMNS))
+        )
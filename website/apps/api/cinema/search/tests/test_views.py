@@ -0,0 +1,123 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from apps.api.cinema.crew.models import CrewMember, CrewMemberAlias
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.search.views import CatalogueSearchViewSet
+from apps.api.cinema.titles.models import Title
+
+URL = reverse("api:cinema:search:search-list")
+
+
+def search(client, **params) -> dict:
+    response = client.get(URL, params)
+    assert response.status_code == 200
+    # Anonymous responses come from the response cache as plain HttpResponses
+    return json.loads(response.content)
+
+
+@pytest.fixture
+def catalogue(make_title, make_show):
+    make_title("Matrix")
+    make_show("Matrix Stories", seasons=2, episodes=2)
+    make_title("Matrix Draft", status=Title.Status.DRAFT)
+    make_show("Secret Matrix", episodes=2, status=Title.Status.DRAFT)
+    keanu = CrewMember.objects.create(full_name="Keanu Reeves", slug="keanu-reeves")
+    CrewMemberAlias.objects.create(crew_member=keanu, name="Matrix Neo")
+    Genre.objects.create(name="Matrix Fiction", slug="matrix-fiction")
+
+
+@pytest.mark.django_db
+class TestCatalogueSearch:
+    def test_groups_by_type(self, api_client, catalogue, query_budget):
+        with query_budget(CatalogueSearchViewSet.query_budget["list"]):
+            results = search(api_client, q="matrix")
+
+        assert set(results) == {"titles", "episodes", "crew", "genres"}
+        assert [title["name"] for title in results["titles"]] == ["Matrix", "Matrix Stories"]
+        assert [crew["name"] for crew in results["crew"]] == ["Keanu Reeves"]
+        assert [genre["slug"] for genre in results["genres"]] == ["matrix-fiction"]
+
+        episode = results["episodes"][0]
+        show = Title.objects.get(name="Matrix Stories")
+        assert episode["title"] == show.pk
+        assert (episode["season"], episode["episode"]) in {(1, 1), (1, 2), (2, 1), (2, 2)}
+        assert episode["slug"] is None
+
+    def test_groups_are_best_first(self, api_client, catalogue):
+        results = search(api_client, q="matrix")
+
+        for rows in results.values():
+            scores = [row["score"] for row in rows]
+            assert scores == sorted(scores, reverse=True)
+
+    def test_limit_per_type(self, api_client, make_title, make_show):
+        for i in range(8):
+            make_title(f"Star {i}")
+        make_show("Star Show", seasons=1, episodes=8)
+
+        results = search(api_client, q="star", limit=3)
+
+        assert len(results["titles"]) == 3
+        assert len(results["episodes"]) == 3
+
+    def test_types(self, api_client, catalogue):
+        results = search(api_client, q="matrix", types=["crew", "genres"])
+
+        assert set(results) == {"crew", "genres"}
+
+    def test_drafts_hidden_from_customers(self, api_client, catalogue):
+        results = search(api_client, q="matrix")
+
+        names = {title["name"] for title in results["titles"]}
+        assert names.isdisjoint({"Matrix Draft", "Secret Matrix"})
+        draft_show = Title.objects.get(name="Secret Matrix")
+        assert all(episode["title"] != draft_show.pk for episode in results["episodes"])
+
+    def test_drafts_shown_to_staff(self, staff_client, catalogue):
+        response = staff_client.get(URL, {"q": "matrix", "limit": 10})
+
+        names = {title["name"] for title in response.data["titles"]}
+        assert {"Matrix Draft", "Secret Matrix"} <= names
+        draft_show = Title.objects.get(name="Secret Matrix")
+        assert any(episode["title"] == draft_show.pk for episode in response.data["episodes"])
+
+    def test_empty_results(self, api_client, catalogue):
+        results = search(api_client, q="qwxz")
+
+        assert results == {"titles": [], "episodes": [], "crew": [], "genres": []}
+
+    def test_query_required(self, api_client):
+        response = api_client.get(URL)
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestCatalogueSearchCrewWeights:
+    @pytest.fixture(autouse=True)
+    def crew(self, db):
+        CrewMember.objects.create(full_name="Keanu Reeves", slug="keanu-reeves")
+
+    def test_trigram_threshold_narrows_crew(self, api_client):
+        typo = search(api_client, q="keanu reevs", types=["crew"])
+        strict = search(api_client, q="keanu reevs", types=["crew"], trigram_threshold=0.95)
+
+        assert [crew["name"] for crew in typo["crew"]] == ["Keanu Reeves"]
+        assert strict["crew"] == []
+
+    def test_crew_scored_with_weights(self, api_client):
+        default = search(api_client, q="keanu reeves", types=["crew"])["crew"][0]["score"]
+        boosted = search(
+            api_client,
+            q="keanu reeves",
+            types=["crew"],
+            fuzzy_weight=0,
+            prefix_boost=0,
+            exact_boost=2,
+        )["crew"][0]["score"]
+
+        # Exact match: rank + fuzzy_weight * 1.0 + prefix_boost + exact_boost
+        assert boosted - default == pytest.approx(2.0 - (0.35 + 0.4 + 1.0))
@@ -0,0 +1,12 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import CatalogueSearchViewSet
+
+app_name = "search"
+
+router = DefaultRouter()
+router.register("", CatalogueSearchViewSet, basename="search")
+
+urlpatterns = []
+
+urlpatterns += router.urls
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from apps.api.cinema.search.services.catalogue_search_service import CatalogueSearchService
+from apps.core.services.descriptive_search_service import (
+    EXACT_BOOST,
+    FUZZY_WEIGHT,
+    PREFIX_BOOST,
+    TRIGRAM_THRESHOLD,
+)
+
+
+class CatalogueSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
+    # Per type
+    limit = serializers.IntegerField(min_value=1, max_value=20, default=5)
+    # All types when omitted, ?types=titles&types=crew
+    types = serializers.MultipleChoiceField(choices=CatalogueSearchService.TYPES, required=False)
+    fuzzy_weight = serializers.FloatField(min_value=0, max_value=1, default=FUZZY_WEIGHT)
+    prefix_boost = serializers.FloatField(min_value=0, max_value=2, default=PREFIX_BOOST)
+    exact_boost = serializers.FloatField(min_value=0, max_value=2, default=EXACT_BOOST)
+    trigram_threshold = serializers.FloatField(min_value=0, max_value=1, default=TRIGRAM_THRESHOLD)
+
+
+class CatalogueSearchResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    slug = serializers.CharField(allow_null=True)
+    # Episodes only
+    title = serializers.IntegerField(allow_null=True)
+    season = serializers.IntegerField(allow_null=True)
+    episode = serializers.IntegerField(allow_null=True)
+    score = serializers.FloatField()
+
+
+class CatalogueSearchSerializer(serializers.Serializer):
+    titles = CatalogueSearchResultSerializer(many=True, required=False)
+    episodes = CatalogueSearchResultSerializer(many=True, required=False)
+    crew = CatalogueSearchResultSerializer(many=True, required=False)
+    genres = CatalogueSearchResultSerializer(many=True, required=False)
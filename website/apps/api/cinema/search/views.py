@@ -0,0 +1,44 @@
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
+
+from .services.catalogue_search_service import CatalogueSearchService
+from .v1.serializers import CatalogueSearchQuerySerializer, CatalogueSearchSerializer
+
+
+class CatalogueSearchViewSet(VersioningAPIViewMixin, CachedResponseMixin, GenericViewSet):
+    """
+    Titles, episodes, crew and genres for ?q= in one query, grouped by type, best first.
+    """
+    # Read only, drafts are searched for staff only
+    permission_classes = [AllowAny]
+    filterset_class = None
+    pagination_class = None
+    version_map = {
+        "v1": {
+            "serializer_class": CatalogueSearchSerializer,
+        }
+    }
+    cache_tags = ("title", "season", "episode", "genre", "crew")
+    query_budget = {
+        "list": 3,
+    }
+
+    def list(self, request, *args, **kwargs):
+        query = CatalogueSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        # Empty when omitted
+        types = params.pop("types", None) or CatalogueSearchService.TYPES
+        user = request.user
+        results = CatalogueSearchService.search(
+            params.pop("q"),
+            params.pop("limit"),
+            types=tuple(type_ for type_ in CatalogueSearchService.TYPES if type_ in types),
+            public_only=not (user and user.is_authenticated and user.is_staff),
+            **params,
+        )
+        return Response(self.get_serializer(results).data)
@@ -14,4 +14,4 @@ class SeasonFilterSet(filters.FilterSet):
         ]
 
     def filter_search(self, queryset, _, value):
-        return DescriptiveSearchService.search(queryset, value)
+        return DescriptiveSearchService.search(value, queryset)
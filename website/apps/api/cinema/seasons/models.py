@@ -1,29 +1,50 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from apps.api.cinema.titles.models import Title
 from apps.api.cinema.videos.models import ToggleWatchModel
-from apps.core.models import DescriptiveModel, OrderableModel
+from apps.core.models import DescriptiveModel, OrderableModel, TimestampModel
+
+
+class SeasonQuerySet(models.QuerySet):
+    def with_episodes_count(self):
+        episode_model = self.model._meta.get_field("episodes").related_model
+        episodes = (
+            episode_model.objects
+            .filter(season=OuterRef("pk"))
+            .order_by()
+            .values("season")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.annotate(episodes_count=Coalesce(Subquery(episodes), Value(0)))
 
 
-class SeasonManager(models.Manager):
+class SeasonManager(models.Manager.from_queryset(SeasonQuerySet)):
     def get_queryset(self):
         return super().get_queryset().filter(
             title__status=Title.Status.PUBLISHED,
         )
 
 
-class Season(OrderableModel, ToggleWatchModel, DescriptiveModel):
+class Season(OrderableModel, ToggleWatchModel, DescriptiveModel, TimestampModel):
     title = models.ForeignKey(
         Title,
         on_delete=models.CASCADE,
         related_name='seasons',
     )
 
-    objects = models.Manager()
+    objects = SeasonQuerySet.as_manager()
     public = SeasonManager()
 
     class Meta(OrderableModel.Meta, ToggleWatchModel.Meta, DescriptiveModel.Meta):
+        indexes = [
+            *DescriptiveModel.Meta.indexes,
+            # Delta export, see CatalogueExportService
+            models.Index(fields=["updated_at"]),
+        ]
         permissions = (
             # Use this permission as per object assigned
             ("can_watch_season", _("Can watch season")),
@@ -6,7 +6,7 @@ from apps.api.cinema.seasons.models import Season
 
 
 class SeasonSerializer(serializers.ModelSerializer):
-    episodes_count = serializers.IntegerField(source="episodes.count", read_only=True)
+    episodes_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Season
@@ -15,6 +15,11 @@ class SeasonSerializer(serializers.ModelSerializer):
             "allowed_to_watch",
         ]
 
+    def get_episodes_count(self, obj: Season) -> int:
+        # Annotated by TitleViewSet, see SeasonQuerySet.with_episodes_count
+        count = getattr(obj, "episodes_count", None)
+        return obj.episodes.count() if count is None else count
+
     def validate_title(self, value):
         if not value.is_show:
             raise ValidationError(_("Title not show type"))
@@ -3,7 +3,7 @@ from rest_framework.permissions import DjangoModelPermissionsOrAnonReadOnly
 from rest_framework.viewsets import GenericViewSet
 
 from apps.api.cinema.videos.mixins import TogglWatchViewSetMixin
-from apps.api.mixins import VersioningAPIViewMixin
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
 
 from .models import Season
 from .v1.serializers import SeasonSerializer
@@ -11,6 +11,7 @@ from .v1.serializers import SeasonSerializer
 
 class SeasonViewSet(
     VersioningAPIViewMixin,
+    CachedResponseMixin,
     TogglWatchViewSetMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
@@ -25,6 +26,7 @@ class SeasonViewSet(
             "serializer_class": SeasonSerializer,
         }
     }
+    cache_tags = ("season", "episode")
 
     def get_version_map(self):
         if self.action in ("retrieve",):
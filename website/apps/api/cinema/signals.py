@@ -0,0 +1,119 @@
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.api.cinema.crew.models import CrewMember, CrewMemberAlias
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.titles.models import Title, TitleCrewMember
+from apps.api.cinema.videos.models import Video
+from apps.core.models import Language
+from apps.core.services.response_cache_service import ResponseCacheService
+
+# Catalogue response cache tags, see CachedResponseMixin
+TAGS = {
+    Title: "title",
+    Season: "season",
+    Episode: "episode",
+    Genre: "genre",
+    CrewMember: "crew",
+    CrewMemberAlias: "crew",
+    TitleCrewMember: "crew",
+    Language: "language",
+}
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+@receiver(post_save, sender=Episode)
+@receiver(post_delete, sender=Episode)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=CrewMember)
+@receiver(post_delete, sender=CrewMember)
+@receiver(post_save, sender=CrewMemberAlias)
+@receiver(post_delete, sender=CrewMemberAlias)
+@receiver(post_save, sender=TitleCrewMember)
+@receiver(post_delete, sender=TitleCrewMember)
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+def invalidate_catalogue_responses(sender, **kwargs):
+    ResponseCacheService.invalidate(TAGS[sender])
+
+
+@receiver(m2m_changed, sender=Title.genres.through)
+@receiver(m2m_changed, sender=Title.languages.through)
+def invalidate_title_relation_responses(action: str, **kwargs):
+    if action.startswith("post_"):
+        ResponseCacheService.invalidate(TAGS[Title])
+
+
+# updated_at of the exported rows showing a related object, see CatalogueExportService
+
+def touch(queryset):
+    queryset.update(updated_at=timezone.now())
+
+
+@receiver(m2m_changed, sender=Title.genres.through)
+@receiver(m2m_changed, sender=Title.languages.through)
+def touch_title_relations(instance, action: str, reverse: bool, pk_set: set | None, **kwargs):
+    if not reverse:
+        if action.startswith("post_"):
+            touch(Title.objects.filter(pk=instance.pk))
+        return
+    # genre.title_set.clear() doesn't send pk_set, the titles are gone after it
+    if action == "pre_clear":
+        field = "genres" if isinstance(instance, Genre) else "languages"
+        touch(Title.objects.filter(**{field: instance}))
+    elif action in ("post_add", "post_remove") and pk_set:
+        touch(Title.objects.filter(pk__in=pk_set))
+
+
+@receiver(post_save, sender=TitleCrewMember)
+@receiver(post_delete, sender=TitleCrewMember)
+def touch_title_crew(instance: TitleCrewMember, **kwargs):
+    touch(Title.objects.filter(pk=instance.title_id))
+
+
+@receiver(post_save, sender=CrewMember)
+def touch_crew_member_titles(instance: CrewMember, created: bool, **kwargs):
+    if not created:
+        touch(Title.objects.filter(crew_members__crew_member=instance))
+
+
+@receiver(post_save, sender=Genre)
+def touch_genre_titles(instance: Genre, created: bool, **kwargs):
+    if not created:
+        touch(Title.objects.filter(genres=instance))
+
+
+@receiver(post_save, sender=Language)
+def touch_language_titles(instance: Language, created: bool, **kwargs):
+    if not created:
+        touch(Title.objects.filter(languages=instance))
+
+
+@receiver(post_save, sender=Video)
+@receiver(pre_delete, sender=Video)
+def touch_video_rows(instance: Video, **kwargs):
+    touch(Title.objects.filter(Q(video=instance) | Q(trailer=instance)))
+    touch(Episode.objects.filter(video=instance))
+
+
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+def touch_season_title(instance: Season, created: bool = True, **kwargs):
+    # Edits of the season itself are exported by its own updated_at
+    if created:
+        touch(Title.objects.filter(pk=instance.title_id))
+
+
+@receiver(post_save, sender=Episode)
+@receiver(post_delete, sender=Episode)
+def touch_episode_season(instance: Episode, created: bool = True, **kwargs):
+    if created:
+        touch(Season.objects.filter(pk=instance.season_id))
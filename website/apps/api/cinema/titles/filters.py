@@ -84,6 +84,8 @@ class TitleFilterSet(filters.FilterSet):
     # ?crew=124:actor,987:director
     crew_member_to_position = CrewPositionChainFilter()
     released = filters.BooleanFilter(method="filter_released")
+    # Titles the current user can play
+    watchable = filters.BooleanFilter(method="filter_watchable")
 
     class Meta:
         model = Title
@@ -101,3 +103,9 @@ class TitleFilterSet(filters.FilterSet):
         if not value:
             return TitleSearchService.not_released(queryset)
         return TitleSearchService.released(queryset)
+
+    def filter_watchable(self, queryset, _, value):
+        user = getattr(self.request, "user", None)
+        if not value:
+            return TitleSearchService.not_watchable(user, queryset)
+        return TitleSearchService.watchable(user, queryset)
@@ -1,20 +1,37 @@
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Collate, Lower
 from django.utils.translation import gettext_lazy as _
 
 from apps.api.cinema.crew.models import CrewMember
 from apps.api.cinema.genres.models import Genre
 from apps.api.cinema.videos.models import ToggleWatchModel, Video
-from apps.core.models import DescriptiveModel, Language
+from apps.core.models import DescriptiveModel, Language, TimestampModel
+
+
+class TitleQuerySet(models.QuerySet):
+    def with_seasons_count(self):
+        # Subquery instead of Count("seasons"), filters join crew and genres
+        season_model = self.model._meta.get_field("seasons").related_model
+        seasons = (
+            season_model.objects
+            .filter(title=OuterRef("pk"))
+            .order_by()
+            .values("title")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.annotate(seasons_count=Coalesce(Subquery(seasons), Value(0)))
 
 
-class TitleManager(models.Manager):
+class TitleManager(models.Manager.from_queryset(TitleQuerySet)):
     def get_queryset(self):
         return super().get_queryset().filter(status=Title.Status.PUBLISHED)
 
 
-class Title(ToggleWatchModel, DescriptiveModel):
+class Title(ToggleWatchModel, DescriptiveModel, TimestampModel):
     class Status(models.TextChoices):
         # Published means accessible on the website, but not saying it has video files to watch
         PUBLISHED = 'published', _('Published')
@@ -51,10 +68,21 @@ class Title(ToggleWatchModel, DescriptiveModel):
         related_name='as_movie',
     )
 
-    objects = models.Manager()
+    objects = TitleQuerySet.as_manager()
     public = TitleManager()
 
     class Meta(ToggleWatchModel.Meta, DescriptiveModel.Meta):
+        indexes = [
+            *DescriptiveModel.Meta.indexes,
+            # Delta export, see CatalogueExportService
+            models.Index(fields=["updated_at"]),
+            # Typeahead, C collation serves both LIKE 'prefix%' and ORDER BY, see TitleSearchService.suggest
+            models.Index(
+                Collate(Lower("name"), "C"),
+                "id",
+                name="title_name_prefix_idx",
+            ),
+        ]
         permissions = (
             # Use this permission as per object assigned
             ("can_watch_title", _("Can watch title")),
@@ -0,0 +1,114 @@
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from rest_framework.serializers import Serializer
+
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.episodes.v1.serializers import EpisodeSerializer
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.seasons.v1.serializers import SeasonSerializer
+from apps.api.cinema.titles.models import Title, TitleCrewMember
+from apps.api.cinema.titles.v1.serializers import TitleCrewMemberSerializer, TitleSerializer
+from apps.api.cinema.videos.models import Video
+from apps.api.cinema.videos.v1.serializers import VideoExportSerializer
+
+# Rows fetched per server-side cursor round trip, prefetches run per chunk
+CHUNK_SIZE = 2000
+
+
+class CatalogueExportService:
+    """
+    Streams the public catalogue as NDJSON, one {"type": ..., "data": ...} object per line,
+    in the API v1 representation. Querysets are read with server-side cursors, so memory
+    doesn't grow with the catalogue.
+
+    The first line carries generated_at, pass it as updated_since of the next export
+    to get titles, seasons and episodes changed since then, with their crew and videos.
+    Changes of genres, languages, crew and videos touch updated_at of the rows showing them,
+    crew lines of an exported title replace its previous crew.
+    Delta exports end with "ids" lines listing every exported row, rows missing from them were deleted.
+    """
+
+    @classmethod
+    def lines(cls, updated_since: datetime | None = None, context: dict | None = None) -> Iterator[bytes]:
+        context = context or {}
+        yield cls._line("export", {
+            # Before reading, so changes made during the export are in the next delta
+            "generated_at": timezone.now(),
+            "updated_since": updated_since,
+        })
+
+        titles = Title.public.all()
+        seasons = Season.public.all()
+        episodes = Episode.public.all()
+        if updated_since is not None:
+            titles = titles.filter(updated_at__gte=updated_since)
+            seasons = seasons.filter(updated_at__gte=updated_since)
+            episodes = episodes.filter(updated_at__gte=updated_since)
+
+        yield from cls._rows(
+            "title",
+            TitleSerializer,
+            titles.prefetch_related("languages", "genres").with_seasons_count(),
+            context,
+        )
+        yield from cls._rows("season", SeasonSerializer, seasons.with_episodes_count(), context)
+        yield from cls._rows("episode", EpisodeSerializer, episodes, context)
+        yield from cls._rows(
+            "crew",
+            TitleCrewMemberSerializer,
+            TitleCrewMember.objects.filter(title__in=titles).select_related("crew_member"),
+            context,
+        )
+        yield from cls._rows(
+            "video",
+            VideoExportSerializer,
+            Video.objects.filter(
+                Q(pk__in=titles.values("video")) |
+                Q(pk__in=titles.values("trailer")) |
+                Q(pk__in=episodes.values("video"))
+            ).select_related("file"),
+            context,
+        )
+
+        if updated_since is not None:
+            yield from cls._ids("title", Title.public.all())
+            yield from cls._ids("season", Season.public.all())
+            yield from cls._ids("episode", Episode.public.all())
+
+    @classmethod
+    def _rows(
+        cls,
+        type_: str,
+        serializer_class: type[Serializer],
+        queryset: QuerySet,
+        context: dict,
+    ) -> Iterator[bytes]:
+        for chunk in cls._chunks(queryset.order_by("pk").iterator(chunk_size=CHUNK_SIZE)):
+            for data in serializer_class(chunk, many=True, context=context).data:
+                yield cls._line(type_, data)
+
+    @classmethod
+    def _ids(cls, type_: str, queryset: QuerySet) -> Iterator[bytes]:
+        pks = queryset.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=CHUNK_SIZE * 10)
+        for chunk in cls._chunks(pks, CHUNK_SIZE * 10):
+            yield cls._line("ids", {"type": type_, "ids": chunk})
+
+    @staticmethod
+    def _chunks(iterable: Iterable, size: int = CHUNK_SIZE) -> Iterator[list]:
+        chunk = []
+        for item in iterable:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _line(type_: str, data) -> bytes:
+        return json.dumps({"type": type_, "data": data}, cls=DjangoJSONEncoder).encode("utf-8") + b"\n"
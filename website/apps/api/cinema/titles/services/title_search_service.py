@@ -1,11 +1,19 @@
 from datetime import UTC, datetime
 
-from django.db.models import Q, QuerySet
+from django.contrib.auth.models import AbstractUser, AnonymousUser
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.models.functions import Collate, Lower
 
+from apps.api.cinema.entitlements.models import Entitlement
+from apps.api.cinema.episodes.models import Episode
 from apps.api.cinema.titles.models import Title
+from apps.api.cinema.videos.models import Video
+from apps.core.services.search_service import SearchService
 
 
-class TitleSearchService:
+class TitleSearchService(SearchService):
+    model = Title
+
     @classmethod
     def _released_query(cls) -> Q:
         now = datetime.now(UTC)
@@ -18,10 +26,88 @@ class TitleSearchService:
 
     @classmethod
     def released(cls, queryset: QuerySet[Title] = None) -> QuerySet[Title]:
-        queryset = queryset or Title.objects.all()
-        return queryset.filter(cls._released_query())
+        return cls.get_queryset(queryset).filter(cls._released_query())
 
     @classmethod
     def not_released(cls, queryset: QuerySet[Title] = None) -> QuerySet[Title]:
-        queryset = queryset or Title.objects.all()
-        return queryset.exclude(cls._released_query())
+        return cls.get_queryset(queryset).exclude(cls._released_query())
+
+    @classmethod
+    def suggest(cls, prefix: str, limit: int, queryset: QuerySet[Title] = None) -> QuerySet[Title]:
+        """
+        First titles by name starting with the prefix, case-insensitive.
+        Matches title_name_prefix_idx, so Postgres reads the index in order and stops after limit rows.
+        """
+        return (
+            cls.get_queryset(queryset)
+            .annotate(name_lower=Collate(Lower("name"), "C"))
+            .filter(name_lower__startswith=prefix.strip().lower())
+            .order_by("name_lower", "pk")
+            .only("id", "slug", "name")
+        )[:limit]
+
+    @classmethod
+    def watchable(cls, user: AbstractUser | AnonymousUser, queryset: QuerySet[Title] = None) -> QuerySet[Title]:
+        """
+        Titles with a completed movie or episode video the user passes WatchPermission for.
+        """
+        return cls.get_queryset(queryset).filter(cls._watchable_query(user))
+
+    @classmethod
+    def not_watchable(cls, user: AbstractUser | AnonymousUser, queryset: QuerySet[Title] = None) -> QuerySet[Title]:
+        return cls.get_queryset(queryset).exclude(cls._watchable_query(user))
+
+    @classmethod
+    def _watchable_query(cls, user: AbstractUser | AnonymousUser) -> Q:
+        """
+        WatchPermission in SQL. Grants are matched with IN (subquery) rather than correlated
+        EXISTS, so PostgreSQL hashes the user's few entitlements once instead of probing per title.
+        """
+        movie = Q(type=Title.TitleType.MOVIE, video__status=Video.Status.COMPLETED)
+        episodes = Episode.objects.filter(season__title=OuterRef("pk"), video__status=Video.Status.COMPLETED)
+        show = Q(type=Title.TitleType.SHOW)
+
+        if getattr(user, "is_superuser", False) or getattr(user, "is_staff", False):
+            return movie | (show & Exists(episodes))
+
+        published = Q(status=Title.Status.PUBLISHED)
+        public_movie = Q(video__visibility=Video.Visibility.PUBLIC)
+        public_episode = Exists(episodes.filter(video__visibility=Video.Visibility.PUBLIC))
+
+        if not getattr(user, "is_authenticated", False) or not user.is_active:
+            return published & ((movie & public_movie) | (show & public_episode))
+
+        Scope = Entitlement.Scope
+        entitlements = Entitlement.objects.active().filter(user=user)
+        global_scopes = set(
+            entitlements
+            .filter(scope__in=[Scope.ALL, Scope.ALL_MOVIES, Scope.ALL_SHOWS])
+            .values_list("scope", flat=True)
+        )
+
+        def title_grant(all_scope: str, genre_scope: str) -> Q:
+            if global_scopes.intersection([Scope.ALL, all_scope]):
+                return Q()
+            return (
+                Q(pk__in=entitlements.filter(scope=Scope.TITLE).values("title")) |
+                Q(pk__in=Title.genres.through.objects.filter(
+                    genre__in=entitlements.filter(scope__in=[Scope.GENRE, genre_scope]).values("genre"),
+                ).values("title"))
+            )
+
+        allowed_episodes = episodes.filter(allowed_to_watch=True, season__allowed_to_watch=True)
+        granted_episodes = allowed_episodes.filter(
+            Q(season__in=entitlements.filter(scope=Scope.SEASON).values("season")) |
+            Q(pk__in=entitlements.filter(scope=Scope.EPISODE).values("episode"))
+        )
+
+        return published & (
+            (movie & (public_movie | (Q(allowed_to_watch=True) & title_grant(Scope.ALL_MOVIES, Scope.GENRE_MOVIES)))) |
+            (show & (
+                public_episode |
+                Q(allowed_to_watch=True) & (
+                    (title_grant(Scope.ALL_SHOWS, Scope.GENRE_SHOWS) & Exists(allowed_episodes)) |
+                    Exists(granted_episodes)
+                )
+            ))
+        )
@@ -0,0 +1,83 @@
+"""
+p99 latency of /titles/suggest over a seeded titles table, deselected by default:
+
+    pytest -m benchmark -s apps/api/cinema/titles/tests/test_suggest_benchmark.py
+
+SUGGEST_BENCHMARK_TITLES, SUGGEST_BENCHMARK_REQUESTS and SUGGEST_BENCHMARK_P99_MS
+change the table size, the number of timed requests and the allowed p99.
+"""
+import os
+import random
+import statistics
+import string
+import time
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.titles.services.title_search_service import TitleSearchService
+
+TITLES = int(os.getenv("SUGGEST_BENCHMARK_TITLES", 100_000))
+REQUESTS = int(os.getenv("SUGGEST_BENCHMARK_REQUESTS", 1000))
+P99_MS = float(os.getenv("SUGGEST_BENCHMARK_P99_MS", 50))
+SEED = 22
+WARMUP = 20
+
+
+def seed_titles(rng: random.Random, count: int) -> list[str]:
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(2000)]
+    names = [" ".join(rng.choices(words, k=rng.randint(1, 4))).title() for _ in range(count)]
+    Title.objects.bulk_create(
+        (
+            Title(
+                name=name,
+                slug=f"title-{i}",
+                type=Title.TitleType.MOVIE,
+                status=Title.Status.DRAFT if i % 10 == 0 else Title.Status.PUBLISHED,
+            )
+            for i, name in enumerate(names)
+        ),
+        batch_size=5000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Title._meta.db_table}")
+    return names
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_suggest_p99(api_client):
+    rng = random.Random(SEED)
+    names = seed_titles(rng, TITLES)
+    # Prefixes people type: 1 to 6 leading characters of existing names, some matching nothing
+    prefixes = [
+        rng.choice(names)[:rng.randint(1, 6)] if rng.random() < 0.9 else "zzzq"
+        for _ in range(WARMUP + REQUESTS)
+    ]
+    url = reverse("api:cinema:titles:titles-suggest")
+
+    plan = TitleSearchService.suggest("ab", 10, Title.public.all()).explain()
+    assert "title_name_prefix_idx" in plan
+
+    latencies = []
+    for i, prefix in enumerate(prefixes):
+        # Timed without the response cache, every request reaches the database
+        cache.clear()
+        started = time.perf_counter()
+        response = api_client.get(url, {"q": prefix, "limit": 10})
+        elapsed = time.perf_counter() - started
+        assert response.status_code == 200
+        if i >= WARMUP:
+            latencies.append(elapsed * 1000)
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    report = (
+        f"/titles/suggest over {TITLES} titles, {REQUESTS} requests: "
+        f"p50={percentiles[49]:.2f}ms p95={percentiles[94]:.2f}ms p99={percentiles[98]:.2f}ms "
+        f"max={max(latencies):.2f}ms"
+    )
+    print(f"\n{report}")
+    assert percentiles[98] <= P99_MS, report
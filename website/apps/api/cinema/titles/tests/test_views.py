@@ -0,0 +1,133 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.titles.views import TitleViewSet
+
+BUDGET = TitleViewSet.query_budget
+
+
+def titles_url(name: str, **kwargs) -> str:
+    return reverse(f"api:cinema:titles:titles-{name}", kwargs=kwargs)
+
+
+@pytest.mark.django_db
+class TestTitleViewSet:
+    def test_list(self, api_client, make_title, query_budget):
+        for i in range(20):
+            make_title(f"Title {i}", genres=3, languages=2)
+
+        with query_budget(BUDGET["list"]) as stats:
+            response = api_client.get(titles_url("list"))
+
+        assert response.status_code == 200
+        body = json.loads(response.content)
+        assert body["count"] == 20
+        assert all(len(title["genres"]) == 3 and len(title["languages"]) == 2 for title in body["results"])
+        assert stats.duplicates == 0
+
+    def test_list_queries_do_not_grow_with_page(self, api_client, make_title, query_budget):
+        make_title("Title", genres=1, languages=1)
+        with query_budget(BUDGET["list"]) as small:
+            api_client.get(titles_url("list"))
+
+        for i in range(50):
+            make_title(f"Title {i}", genres=3, languages=2)
+        # Tags are invalidated on commit, which never comes inside the test transaction
+        cache.clear()
+        with query_budget(BUDGET["list"]) as large:
+            api_client.get(titles_url("list"))
+
+        assert large.count == small.count
+
+    def test_list_hides_drafts(self, api_client, make_title):
+        make_title("Published")
+        make_title("Draft", status=Title.Status.DRAFT)
+
+        response = api_client.get(titles_url("list"))
+
+        assert [title["name"] for title in json.loads(response.content)["results"]] == ["Published"]
+
+    def test_retrieve(self, api_client, make_show, query_budget):
+        title = make_show("Show", seasons=5, genres=3, languages=2)
+
+        with query_budget(BUDGET["retrieve"]):
+            response = api_client.get(titles_url("detail", pk=title.pk))
+
+        assert response.status_code == 200
+        body = json.loads(response.content)
+        assert body["seasons_count"] == 5
+        assert len(body["genres"]) == 3
+
+    def test_cached_retrieve_runs_no_view_queries(self, api_client, make_title, query_budget):
+        title = make_title("Title", genres=2)
+        api_client.get(titles_url("detail", pk=title.pk))
+
+        with query_budget(0):
+            response = api_client.get(titles_url("detail", pk=title.pk))
+
+        assert response.status_code == 200
+
+    def test_staff_list_bypasses_cache_within_budget(self, staff_client, make_title, query_budget):
+        for i in range(20):
+            make_title(f"Title {i}", genres=3, languages=2, status=Title.Status.DRAFT)
+
+        with query_budget(BUDGET["list"]):
+            response = staff_client.get(titles_url("list"))
+
+        assert response.data["count"] == 20
+
+
+@pytest.mark.django_db
+class TestSeasonsAndEpisodes:
+    def test_seasons_list(self, api_client, make_show, query_budget):
+        title = make_show("Show", seasons=10, episodes=4)
+
+        with query_budget(BUDGET["seasons_list"]) as stats:
+            response = api_client.get(titles_url("seasons-list", pk=title.pk))
+
+        assert response.status_code == 200
+        seasons = json.loads(response.content)["results"]
+        assert [season["ordering"] for season in seasons] == list(range(1, 11))
+        assert all(season["episodes_count"] == 4 for season in seasons)
+        assert stats.duplicates <= 1
+
+    def test_seasons_retrieve(self, api_client, make_show, query_budget):
+        title = make_show("Show", seasons=3, episodes=4)
+
+        with query_budget(BUDGET["seasons_retrieve"]):
+            response = api_client.get(titles_url("seasons-retrieve", pk=title.pk, season_number=2))
+
+        assert response.status_code == 200
+        assert json.loads(response.content)["episodes_count"] == 4
+
+    def test_episodes_list(self, api_client, make_show, query_budget):
+        title = make_show("Show", seasons=2, episodes=25)
+
+        with query_budget(BUDGET["episodes_list"]):
+            response = api_client.get(titles_url("episodes-list", pk=title.pk, season_number=2))
+
+        assert response.status_code == 200
+        episodes = json.loads(response.content)["results"]
+        assert [episode["ordering"] for episode in episodes] == list(range(1, 26))
+
+    def test_episodes_retrieve(self, api_client, make_show, query_budget):
+        title = make_show("Show", seasons=2, episodes=3)
+
+        with query_budget(BUDGET["episodes_retrieve"]):
+            response = api_client.get(
+                titles_url("episodes-retrieve", pk=title.pk, season_number=2, episode_number=3)
+            )
+
+        assert response.status_code == 200
+        assert json.loads(response.content)["name"] == "Show episode 3"
+
+    def test_episodes_of_missing_season(self, api_client, make_show):
+        title = make_show("Show")
+
+        response = api_client.get(titles_url("episodes-list", pk=title.pk, season_number=5))
+
+        assert response.status_code == 404
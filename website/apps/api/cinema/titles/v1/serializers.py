@@ -36,6 +36,26 @@ class TitleCrewMemberSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
+class CatalogueExportQuerySerializer(serializers.Serializer):
+    # generated_at of the previous export
+    updated_since = serializers.DateTimeField(required=False)
+
+
+class TitleSuggestQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
+    limit = serializers.IntegerField(min_value=1, max_value=20, default=10)
+
+
+class TitleSuggestionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Title
+        fields = [
+            "id",
+            "slug",
+            "name",
+        ]
+
+
 class TitleSerializer(serializers.ModelSerializer):
     languages = LanguageSerializer(many=True, read_only=True)
     languages_codes = serializers.SlugRelatedField(
@@ -55,7 +75,7 @@ class TitleSerializer(serializers.ModelSerializer):
         queryset=Genre.objects.all(),
         source="genres",
     )
-    seasons_count = serializers.IntegerField(source="seasons.count", read_only=True)
+    seasons_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Title
@@ -88,6 +108,11 @@ class TitleSerializer(serializers.ModelSerializer):
 
         return attrs
 
+    def get_seasons_count(self, obj: Title) -> int:
+        # Annotated by TitleViewSet, see TitleQuerySet.with_seasons_count
+        count = getattr(obj, "seasons_count", None)
+        return obj.seasons.count() if count is None else count
+
     def validate_video(self, value):
         if (
             value is not None and
@@ -1,8 +1,13 @@
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
 from django.utils.translation import gettext_lazy as _
 from rest_framework import mixins
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
 from apps.api.cinema.episodes.filters import EpisodeFilterSet
@@ -12,19 +17,25 @@ from apps.api.cinema.seasons.filters import SeasonFilterSet
 from apps.api.cinema.seasons.models import Season
 from apps.api.cinema.seasons.v1.serializers import SeasonSerializer
 from apps.api.cinema.videos.mixins import TogglWatchViewSetMixin
-from apps.api.mixins import VersioningAPIViewMixin
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
 
 from .filters import TitleCrewMemberFilterSet, TitleFilterSet
 from .models import Title
+from .services.catalogue_export_service import CatalogueExportService
+from .services.title_search_service import TitleSearchService
 from .v1.serializers import (
+    CatalogueExportQuerySerializer,
     TitleCrewMember,
     TitleCrewMemberSerializer,
     TitleSerializer,
+    TitleSuggestionSerializer,
+    TitleSuggestQuerySerializer,
 )
 
 
 class TitleViewSet(
     VersioningAPIViewMixin,
+    CachedResponseMixin,
     TogglWatchViewSetMixin,
     ModelViewSet,
 ):
@@ -35,6 +46,21 @@ class TitleViewSet(
             "serializer_class": TitleSerializer,
         }
     }
+    # Keyset pagination with ?pagination=cursor, new titles come last
+    cursor_ordering = ("id",)
+    cache_tags = ("title", "season", "episode", "genre", "crew", "language")
+    cache_bypass_params = ("watchable",)
+    query_budget = {
+        # Session and user lookups included
+        "list": 8,
+        "retrieve": 5,
+        "suggest": 3,
+        "crew_list": 4,
+        "seasons_list": 5,
+        "seasons_retrieve": 4,
+        "episodes_list": 6,
+        "episodes_retrieve": 5,
+    }
 
     def get_queryset(self):
         pk = self.kwargs.get("pk")
@@ -47,13 +73,19 @@ class TitleViewSet(
             return model.public.all() if public_only else model.objects.all()
 
         if self.action in {"list", "retrieve"}:
+            return self.with_title_relations(base_qs(Title))
+
+        if self.action == "suggest":
             return base_qs(Title)
 
+        if self.action in {"update", "partial_update"}:
+            return self.with_title_relations(Title.objects.all())
+
         if self.action == "crew_list":
-            return TitleCrewMember.objects.filter(title=pk)
+            return TitleCrewMember.objects.filter(title=pk).select_related("crew_member")
 
         if self.action in {"seasons_list", "seasons_retrieve"}:
-            return base_qs(Season).filter(title=pk)
+            return base_qs(Season).filter(title=pk).with_episodes_count()
 
         if self.action in {"episodes_list", "episodes_retrieve"}:
             filters = {"season__title": pk}
@@ -63,6 +95,70 @@ class TitleViewSet(
 
         return super().get_queryset()
 
+    @staticmethod
+    def with_title_relations(queryset):
+        """
+        Everything TitleSerializer reads, so a page costs the same number of queries at any size.
+        """
+        return queryset.prefetch_related("languages", "genres").with_seasons_count()
+
+    @action(
+        methods=['GET'],
+        detail=False,
+        url_path="export",
+        permission_classes=[IsAuthenticated],
+        filterset_class=None,
+        version_map=None,
+    )
+    def export(self, request, *args, **kwargs):
+        """
+        NDJSON stream of the public catalogue, gzipped for clients accepting it.
+        ?updated_since= exports changes only, see CatalogueExportService.
+        """
+        query = CatalogueExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        lines = CatalogueExportService.lines(
+            query.validated_data.get("updated_since"),
+            context={"request": request},
+        )
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            response = StreamingHttpResponse(compress_sequence(lines), content_type="application/x-ndjson")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = StreamingHttpResponse(lines, content_type="application/x-ndjson")
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
+
+    @action(
+        methods=['GET'],
+        detail=False,
+        url_path="suggest",
+        filterset_class=None,
+        pagination_class=None,
+        version_map={
+            "v1": {
+                "serializer_class": TitleSuggestionSerializer,
+            }
+        }
+    )
+    def suggest(self, request, *args, **kwargs):
+        """
+        Typeahead, up to ?limit= titles with names starting with ?q=.
+        """
+        return self.cached_response(self.suggest_response, request, *args, **kwargs)
+
+    def suggest_response(self, request, *args, **kwargs):
+        query = TitleSuggestQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        titles = TitleSearchService.suggest(
+            query.validated_data["q"],
+            query.validated_data["limit"],
+            self.get_queryset(),
+        )
+        return Response(self.get_serializer(titles, many=True).data)
+
     @action(
         methods=['GET'],
         detail=True,
@@ -169,7 +265,7 @@ class TitleCrewViewSet(
     mixins.UpdateModelMixin,
     GenericViewSet,
 ):
-    queryset = TitleCrewMember.objects.all()
+    queryset = TitleCrewMember.objects.select_related("crew_member")
     version_map = {
         "v1": {
             "serializer_class": TitleCrewMemberSerializer,
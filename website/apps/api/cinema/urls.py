@@ -10,4 +10,5 @@ urlpatterns = [
     path("videos/", include("apps.api.cinema.videos.urls")),
     path("crew/", include("apps.api.cinema.crew.urls")),
     path("genres/", include("apps.api.cinema.genres.urls")),
+    path("search/", include("apps.api.cinema.search.urls")),
 ]
@@ -12,6 +12,9 @@ class VideoResolutionInline(admin.TabularInline):
 
 @admin.register(Video)
 class VideoAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "status", "role", "visibility"]
+    list_filter = ["status", "role", "visibility", "file__height", "file__video_codec"]
+    list_select_related = ["file"]
     readonly_fields = ["hls_decrypt_key"]
     inlines = [
         AudioTrackInline,
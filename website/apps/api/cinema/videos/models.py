@@ -1,14 +1,11 @@
 import uuid
-from functools import partial
-from pathlib import Path
 
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
+from django.db import models
 from django.utils.translation import gettext_lazy as _
-from library.aws.client.s3 import S3UploadClient
 
 from apps.api.uploads.models import LazyLoadFile
-from apps.core.models import Language
+from apps.core.models import Language, TimestampModel
 
 
 class ToggleWatchModel(models.Model):
@@ -63,23 +60,19 @@ class Video(models.Model):
         related_name="video_languages",
     )
     rebuild_needed = models.BooleanField(default=False, editable=False)
+    # PTS offset of the current HLS build, null for builds made before it was recorded.
+    # Audio tracks can be added to a build incrementally only when it is known.
+    hls_ts_offset = models.FloatField(null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Public playable videos, see TitleSearchService.watchable
+            models.Index(fields=["visibility", "status"]),
+        ]
 
     def __str__(self):
         return str(self.file)
 
-    @transaction.atomic
-    def delete(self, *args, **kwargs):
-        if self.hls_master_playlist:
-            # Cleaning all files
-            upload_client = S3UploadClient()
-            # Removing all in video directory, including a url version
-            video_directory_path = str(Path(str(self.hls_master_playlist)).parent.parent)
-            transaction.on_commit(partial(
-                upload_client.delete_prefix,
-                video_directory_path,
-            ))
-        super().delete(*args, **kwargs)
-
     def clean(self):
         if (
             self.attached_as_movie and
@@ -105,6 +98,18 @@ class Video(models.Model):
     def has_default_audio(self) -> bool:
         return self.audio_tracks.filter(is_default=True).exists()
 
+    @property
+    def audio_rebuild_available(self) -> bool:
+        """
+        Audio tracks can be re-encoded into the current build without touching video segments
+        """
+        return (
+            self.completed and
+            bool(self.hls_master_playlist) and
+            self.encrypted and
+            self.hls_ts_offset is not None
+        )
+
     @property
     def encrypted(self) -> bool:
         return bool(self.hls_decrypt_key)
@@ -164,3 +169,61 @@ class VideoResolution(models.Model):
 
     def __str__(self):
         return self.get_resolution_display()
+
+
+class HLSBuild(TimestampModel):
+    """
+    One published (or in-progress) HLS build of a video under its own S3 prefix.
+    Builds are never overwritten: a new build goes live by switching Video.hls_master_playlist,
+    the previous one is retired and removed by the sweeper after a grace period.
+    """
+    class Status(models.TextChoices):
+        # Being encoded or copied, not referenced by the video yet
+        BUILDING = "building"
+        # Referenced by Video.hls_master_playlist
+        LIVE = "live"
+        # Replaced by a newer build, kept for viewers that still play it
+        RETIRED = "retired"
+
+    video = models.ForeignKey(
+        Video,
+        on_delete=models.CASCADE,
+        related_name="builds",
+    )
+    prefix = models.CharField(max_length=255, unique=True)
+    # Per-build AES key, served by the key endpoint for ?build=<build_id>
+    decrypt_key = models.CharField(max_length=255)
+    # Inputs and IV of an encoding build: a retry with the same inputs resumes it
+    # with the same key and IV, so segments uploaded by the failed attempt stay valid
+    fingerprint = models.CharField(max_length=64, blank=True)
+    iv = models.CharField(max_length=32, blank=True)
+    status = models.CharField(choices=Status.choices, default=Status.BUILDING, max_length=20)
+    retired_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta(TimestampModel.Meta):
+        indexes = [
+            models.Index(fields=["status", "retired_at"]),
+        ]
+
+    def __str__(self):
+        return self.prefix
+
+
+class TranscodeCacheEntry(TimestampModel):
+    """
+    Published HLS build addressed by its inputs: source and audio ETags, rendition ladder and codec args.
+    A build with the same fingerprint reuses these playlists and segments instead of encoding again.
+    """
+    fingerprint = models.CharField(max_length=64, unique=True)
+    hls_build_prefix = models.CharField(max_length=255)
+    # Per-build AES key the segments are encrypted with
+    hls_decrypt_key = models.CharField(max_length=255)
+    # Key URI written into media playlists, rewritten when the build is reused under another URL
+    key_uri = models.CharField(max_length=1024)
+    # {"360": "360p.m3u8"}
+    resolutions = models.JSONField(default=dict)
+    # {"en": "language-en.m3u8"}
+    audio_tracks = models.JSONField(default=dict)
+
+    def __str__(self):
+        return self.fingerprint
@@ -0,0 +1,155 @@
+import logging
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from library.aws.client.s3 import S3UploadClient
+
+from apps.api.cinema.videos.models import HLSBuild, TranscodeCacheEntry, Video
+from apps.api.cinema.videos.services.hls_key_service import HLSKeyService
+from apps.api.cinema.videos.services.transcode_cache_service import TranscodeCacheService
+
+
+class HLSBuildService:
+    """
+    Blue/green publication of HLS builds: a build is written under its own prefix,
+    goes live in the same transaction that points the video at it, and previous builds
+    are deleted by sweep() only after HLS_BUILD_GRACE_HOURS.
+    """
+
+    @staticmethod
+    def start(video: Video, prefix: str, decrypt_key: str, fingerprint: str = "", iv: str = "") -> HLSBuild:
+        build, _ = HLSBuild.objects.get_or_create(
+            prefix=prefix,
+            defaults={
+                "video": video,
+                "decrypt_key": decrypt_key,
+                "fingerprint": fingerprint,
+                "iv": iv,
+            },
+        )
+        return build
+
+    @staticmethod
+    def resume(video: Video, fingerprint: str) -> HLSBuild | None:
+        """
+        Unfinished build of the same inputs (a failed or retried attempt), or None.
+        Reusing its prefix, key and IV keeps the segments it has uploaded already.
+        Builds the sweeper may be deleting (older than HLS_BUILD_STALE_HOURS) are not resumed.
+        """
+        build = (
+            video.builds
+            .filter(
+                status=HLSBuild.Status.BUILDING,
+                fingerprint=fingerprint,
+                updated_at__gte=timezone.now() - timedelta(hours=settings.HLS_BUILD_STALE_HOURS),
+            )
+            .exclude(iv="")
+            .order_by("-created_at")
+            .first()
+        )
+        if build is not None:
+            # Keeps it away from the sweeper while it is being encoded again
+            build.save(update_fields=["updated_at"])
+        return build
+
+    @staticmethod
+    @transaction.atomic
+    def publish(video: Video, prefix: str, decrypt_key: str) -> HLSBuild:
+        """
+        Marks the build live and retires the previous one. Call in the transaction that switches the video.
+        """
+        now = timezone.now()
+        live_prefix = str(Path(str(video.hls_master_playlist)).parent) if video.hls_master_playlist else None
+
+        # Builds published before builds were tracked
+        if live_prefix and live_prefix != prefix and video.hls_decrypt_key:
+            HLSBuild.objects.get_or_create(
+                prefix=live_prefix,
+                defaults={
+                    "video": video,
+                    "decrypt_key": str(video.hls_decrypt_key),
+                    "status": HLSBuild.Status.RETIRED,
+                    "retired_at": now,
+                },
+            )
+
+        (
+            HLSBuild.objects
+            .filter(video=video, status=HLSBuild.Status.LIVE)
+            .exclude(prefix=prefix)
+            .update(status=HLSBuild.Status.RETIRED, retired_at=now)
+        )
+        build, _ = HLSBuild.objects.update_or_create(
+            prefix=prefix,
+            defaults={
+                "video": video,
+                "decrypt_key": decrypt_key,
+                "status": HLSBuild.Status.LIVE,
+                "retired_at": None,
+            },
+        )
+        # Requests without a build get the live key
+        HLSKeyService.invalidate_live(video.pk)
+        return build
+
+    @staticmethod
+    def decrypt_key(video: Video, build_id: str | None) -> str | None:
+        """
+        Key of a specific build (players of a retired build keep asking for it), or of the live one.
+        """
+        if not build_id:
+            return str(video.hls_decrypt_key) if video.hls_decrypt_key else None
+        build = (
+            video.builds
+            .filter(prefix__endswith=f"/{build_id}")
+            .exclude(status=HLSBuild.Status.BUILDING)
+            .first()
+        )
+        return build.decrypt_key if build else None
+
+    @staticmethod
+    def purge(prefixes: list[str], client: S3UploadClient = None) -> None:
+        """
+        Deletes every object under the prefixes of a deleted video (its builds and build keys).
+        HLSBuild rows are deleted with the video, so sweep() can't find these objects anymore.
+        """
+        client = client or S3UploadClient()
+        for prefix in prefixes:
+            prefix = prefix.rstrip("/") + "/"
+            # Cache entries would restore from the deleted objects
+            TranscodeCacheEntry.objects.filter(hls_build_prefix__startswith=prefix).delete()
+            client.delete_prefix(prefix)
+
+    @staticmethod
+    def sweep(client: S3UploadClient = None) -> int:
+        """
+        Deletes builds retired longer than HLS_BUILD_GRACE_HOURS ago and builds that never went live
+        (failed or abandoned) within HLS_BUILD_STALE_HOURS. Returns the number of deleted builds.
+        """
+        client = client or S3UploadClient()
+        now = timezone.now()
+        expired = HLSBuild.objects.filter(
+            Q(status=HLSBuild.Status.RETIRED, retired_at__lt=now - timedelta(hours=settings.HLS_BUILD_GRACE_HOURS)) |
+            Q(status=HLSBuild.Status.BUILDING, updated_at__lt=now - timedelta(hours=settings.HLS_BUILD_STALE_HOURS))
+        ).select_related("video")
+
+        deleted = 0
+        for build in expired:
+            # Never delete what the video currently points at, whatever the bookkeeping says
+            if str(build.video.hls_master_playlist).startswith(build.prefix.rstrip("/") + "/"):
+                continue
+            try:
+                TranscodeCacheService.invalidate(build.prefix)
+                client.delete_prefix(build.prefix.rstrip("/") + "/")
+                if build.decrypt_key != str(build.video.hls_decrypt_key):
+                    client.delete(build.decrypt_key)
+            except Exception as e:
+                logging.warning("Failed to delete HLS build %s: %s", build.prefix, e)
+                continue
+            build.delete()
+            deleted += 1
+        return deleted
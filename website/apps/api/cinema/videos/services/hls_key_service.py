@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser, AnonymousUser
+from django.core import signing
+from django.core.cache import cache
+from django.db import transaction
+from library.aws.client.s3 import S3StorageClient
+
+from apps.api.cinema.videos.models import Video
+
+CACHE_PREFIX = "hls-key"
+TOKEN_SALT = "apps.api.cinema.videos.hls-key"
+
+
+class HLSKeyService:
+    """
+    Token key delivery: the playback endpoint issues a signed token after WatchPermission,
+    the key endpoint accepts it instead of checking permissions again and serves the key
+    from Redis. A fetch with a valid token and a cached key touches neither the database nor S3.
+
+    Keys of a build never change, so they are cached by build. The key requested without
+    a build (playlists made before builds were tracked) is the live one and is dropped on publish.
+    """
+    # Scoped to the key endpoint path, set by the playback endpoint
+    TOKEN_COOKIE = "hls_key_token"
+
+    def __init__(self, client: S3StorageClient = None):
+        self.client = client
+
+    @staticmethod
+    def issue_token(video: Video, user: AbstractUser | AnonymousUser) -> str:
+        return signing.dumps(
+            {
+                "video": str(video.pk),
+                "user": user.pk if getattr(user, "is_authenticated", False) else None,
+            },
+            salt=TOKEN_SALT,
+        )
+
+    @staticmethod
+    def verify_token(token: str | None, video_id) -> bool:
+        if not token:
+            return False
+        try:
+            payload = signing.loads(token, salt=TOKEN_SALT, max_age=settings.HLS_KEY_TOKEN_MAX_AGE)
+        except signing.BadSignature:
+            return False
+        return payload.get("video") == str(video_id)
+
+    @staticmethod
+    def cached(video_id, build_id: str | None) -> bytes | None:
+        return cache.get(_cache_key(video_id, build_id))
+
+    def load(self, video_id, build_id: str | None, key: str) -> bytes:
+        """
+        Reads the key of the build from S3 and caches it, see HLSBuildService.decrypt_key.
+        """
+        key_bytes = self.client.read(key)
+        cache.set(_cache_key(video_id, build_id), key_bytes, settings.HLS_KEY_CACHE_SECONDS)
+        return key_bytes
+
+    @staticmethod
+    def invalidate_live(video_id) -> None:
+        transaction.on_commit(lambda: cache.delete(_cache_key(video_id, None)))
+
+    @property
+    def client(self) -> S3StorageClient:
+        return self._client
+
+    @client.setter
+    def client(self, client: S3StorageClient = None):
+        if client is None:
+            client = S3StorageClient()
+        self._client = client
+
+
+def _cache_key(video_id, build_id: str | None) -> str:
+    return f"{CACHE_PREFIX}:{video_id}:{build_id or 'live'}"
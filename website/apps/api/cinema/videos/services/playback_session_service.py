@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser, AnonymousUser
+from django.utils import timezone
+from library.aws.client.s3 import S3StorageClient
+
+from apps.api.cinema.videos.models import Video
+from apps.api.cinema.videos.services.hls_key_service import HLSKeyService
+
+
+@dataclass(frozen=True)
+class PlaybackSession:
+    hls_master_playlist: str
+    # Path the CloudFront cookies are scoped to, the build prefix
+    path: str
+    expires: datetime
+    # CloudFront-Policy / CloudFront-Signature / CloudFront-Key-Pair-Id
+    cookies: dict[str, str]
+    hls_key_token: str | None
+
+
+class PlaybackSessionService:
+    """
+    One WatchPermission check grants CloudFront access to the whole build prefix for
+    HLS_PLAYBACK_SESSION_SECONDS, so the player fetches playlists and segments straight from the CDN.
+    """
+
+    def __init__(self, client: S3StorageClient = None):
+        self.client = client
+
+    def start(self, video: Video, user: AbstractUser | AnonymousUser) -> PlaybackSession:
+        master_playlist = str(video.hls_master_playlist)
+        prefix = str(Path(master_playlist).parent)
+        expires = timezone.now() + timedelta(seconds=settings.HLS_PLAYBACK_SESSION_SECONDS)
+        return PlaybackSession(
+            hls_master_playlist=self.client.cdn_url(master_playlist),
+            path=f"/{prefix}/",
+            expires=expires,
+            cookies=self.client.cloudfront_policy(prefix, expires),
+            hls_key_token=(
+                HLSKeyService.issue_token(video, user)
+                if settings.HLS_KEY_DELIVERY == "token" and video.encrypted
+                else None
+            ),
+        )
+
+    @property
+    def client(self) -> S3StorageClient:
+        return self._client
+
+    @client.setter
+    def client(self, client: S3StorageClient = None):
+        if client is None:
+            client = S3StorageClient()
+        self._client = client
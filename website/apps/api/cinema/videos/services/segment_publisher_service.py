@@ -0,0 +1,103 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from library.aws.client.s3 import S3UploadClient
+from utils.posix import posix_join
+
+
+class SegmentPublisherService:
+    """
+    Uploads finished HLS segments to S3 while ffmpeg is still encoding.
+
+    with SegmentPublisherService(out_dir, prefix, pattern="360p_*.ts"):
+        run_cmd(ffmpeg_args)
+
+    ffmpeg must run with hls_flags=temp_file, so a file matching the pattern
+    is always a complete segment. Segments that already exist under the prefix
+    with the same size (published by a previous attempt) are not uploaded again.
+    """
+
+    def __init__(
+        self,
+        out_dir: Path,
+        prefix: str,
+        pattern: str = "*.ts",
+        client: S3UploadClient = None,
+        max_workers: int = settings.HLS_UPLOAD_CONCURRENCY,
+        poll_interval: float = 1.0,
+    ):
+        self.client = client
+        self.out_dir = out_dir
+        self.prefix = prefix
+        self.pattern = pattern
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.uploaded = 0
+        self.skipped = 0
+        self._published: dict[str, int] = {}
+        self._seen: set[str] = set()
+        self._futures: list[Future] = []
+        self._stop = threading.Event()
+        self._executor: ThreadPoolExecutor | None = None
+        self._watcher: threading.Thread | None = None
+
+    def __enter__(self) -> "SegmentPublisherService":
+        self._published = self.client.list_sizes(self.prefix.rstrip("/") + "/")
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hls-publisher")
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._stop.set()
+        self._watcher.join()
+
+        if exc_type is None:
+            # ffmpeg finished: everything left on disk is complete
+            self.scan()
+
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+        if exc_type is None:
+            for future in self._futures:
+                future.result()
+            self.uploaded = len(self._futures)
+            logging.info(
+                "Published %s segments to %s (%s already uploaded)",
+                self.uploaded, self.prefix, self.skipped,
+            )
+        return False
+
+    def scan(self) -> None:
+        for path in sorted(self.out_dir.glob(self.pattern)):
+            if path.name in self._seen:
+                continue
+            self._seen.add(path.name)
+
+            key = posix_join(self.prefix, path.name)
+            if self._published.get(key) == path.stat().st_size:
+                self.skipped += 1
+                continue
+
+            self._futures.append(self._executor.submit(self.client.upload_file, key, path))
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.scan()
+            except Exception as e:
+                # Final scan in __exit__ picks up whatever was missed here
+                logging.warning("Segment scan failed in %s: %s", self.out_dir, e)
+
+    @property
+    def client(self) -> S3UploadClient:
+        return self._client
+
+    @client.setter
+    def client(self, client: S3UploadClient = None):
+        if client is None:
+            client = S3UploadClient()
+        self._client = client
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from library.aws.client.s3 import S3UploadClient
+from utils.posix import posix_join
+
+from apps.api.cinema.videos.models import TranscodeCacheEntry
+
+
+class TranscodeCacheService:
+    """
+    Content-addressed cache of published HLS builds.
+
+    The fingerprint covers everything that affects the encoded output, so an entry
+    can be reused by any video with the same inputs: segments are copied server-side
+    and only the key URI in media playlists is rewritten.
+    """
+
+    def __init__(self, client: S3UploadClient = None):
+        self.client = client
+
+    @staticmethod
+    def fingerprint(payload: dict) -> str:
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def lookup(self, fingerprint: str) -> TranscodeCacheEntry | None:
+        entry = TranscodeCacheEntry.objects.filter(fingerprint=fingerprint).first()
+        if entry is None:
+            return None
+
+        # The build may have been deleted together with its video
+        if not self.client.list_sizes(entry.hls_build_prefix.rstrip("/") + "/"):
+            logging.info("Transcode cache entry %s points to a missing build, dropping it", fingerprint)
+            entry.delete()
+            return None
+        return entry
+
+    def restore(
+        self,
+        entry: TranscodeCacheEntry,
+        hls_build_prefix: str,
+        hls_decrypt_key: str,
+        key_uri: str,
+    ) -> None:
+        """
+        Copies a cached build to hls_build_prefix with its key at hls_decrypt_key.
+        """
+        copied = self.client.copy_prefix(
+            entry.hls_build_prefix,
+            hls_build_prefix,
+            max_workers=settings.HLS_UPLOAD_CONCURRENCY,
+        )
+        self.client.copy(entry.hls_decrypt_key, hls_decrypt_key)
+
+        if entry.key_uri == key_uri:
+            return
+
+        with tempfile.TemporaryDirectory() as td:
+            for key in copied:
+                if not key.endswith(".m3u8"):
+                    continue
+                text = self.client.read(key).decode("utf-8")
+                if entry.key_uri not in text:
+                    continue
+                local_path = Path(td) / Path(key).name
+                local_path.write_text(text.replace(entry.key_uri, key_uri), encoding="utf-8")
+                self.client.upload_file(key, local_path)
+
+    @staticmethod
+    def store(
+        fingerprint: str,
+        hls_build_prefix: str,
+        hls_decrypt_key: str,
+        key_uri: str,
+        resolutions: dict[int, str],
+        audio_tracks: dict[str, str],
+    ) -> TranscodeCacheEntry:
+        """
+        Points the fingerprint at the latest build, which is the one most likely to be kept.
+        resolutions/audio_tracks map to S3 keys of playlists inside hls_build_prefix.
+        """
+        entry, _ = TranscodeCacheEntry.objects.update_or_create(
+            fingerprint=fingerprint,
+            defaults={
+                "hls_build_prefix": hls_build_prefix,
+                "hls_decrypt_key": hls_decrypt_key,
+                "key_uri": key_uri,
+                "resolutions": {str(height): Path(key).name for height, key in resolutions.items()},
+                "audio_tracks": {code: Path(key).name for code, key in audio_tracks.items()},
+            },
+        )
+        return entry
+
+    @staticmethod
+    def invalidate(hls_build_prefix: str) -> None:
+        """
+        Call when a build is changed in place, it no longer matches its fingerprint.
+        """
+        TranscodeCacheEntry.objects.filter(hls_build_prefix=hls_build_prefix).delete()
+
+    @staticmethod
+    def playlists(entry: TranscodeCacheEntry, hls_build_prefix: str) -> tuple[dict[int, str], dict[str, str]]:
+        """
+        S3 keys of the entry's playlists relative to hls_build_prefix: (resolutions, audio tracks).
+        """
+        resolutions = {int(height): posix_join(hls_build_prefix, name) for height, name in entry.resolutions.items()}
+        audio_tracks = {code: posix_join(hls_build_prefix, name) for code, name in entry.audio_tracks.items()}
+        return resolutions, audio_tracks
+
+    @property
+    def client(self) -> S3UploadClient:
+        return self._client
+
+    @client.setter
+    def client(self, client: S3UploadClient = None):
+        if client is None:
+            client = S3UploadClient()
+        self._client = client
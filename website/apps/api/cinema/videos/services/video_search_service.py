@@ -1,16 +1,12 @@
-from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import QuerySet
 
 from apps.api.cinema.videos.models import Video
+from apps.core.services.search_service import SearchService
 
 
-class VideoSearchService:
-    @staticmethod
-    def search(value: str, queryset: QuerySet[Video] = None) -> QuerySet[Video]:
-        queryset = queryset or Video.objects.all()
+class VideoSearchService(SearchService):
+    model = Video
 
-        return (
-            queryset
-            .annotate(similarity=TrigramSimilarity("file__name", value))
-            .order_by("-similarity")
-        )
+    @classmethod
+    def search(cls, value: str, queryset: QuerySet[Video] = None) -> QuerySet[Video]:
+        return cls.trigram_search("file__name", value, queryset)
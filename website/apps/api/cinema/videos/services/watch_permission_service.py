@@ -0,0 +1,175 @@
+import uuid
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser, AnonymousUser
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from apps.api.cinema.entitlements.models import Entitlement
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.videos.models import Video
+
+CACHE_PREFIX = "watch-permission"
+
+
+class WatchReason(models.TextChoices):
+    STAFF = "staff", _("Staff member")
+    BROKEN_BINDING = "broken_binding", _("Video is not attached to a title")
+    DRAFT = "draft", _("Title is a draft")
+    PUBLIC = "public", _("Video is public")
+    ANONYMOUS = "anonymous", _("Authentication required")
+    NOT_ALLOWED_TO_WATCH = "not_allowed_to_watch", _("Watching is disabled")
+    GLOBAL_PERMISSION = "global_permission", _("Global permission")
+    TITLE_PERMISSION = "title_permission", _("Title permission")
+    EPISODE_PERMISSION = "episode_permission", _("Episode permission")
+    SEASON_PERMISSION = "season_permission", _("Season permission")
+    GENRE_PERMISSION = "genre_permission", _("Genre permission")
+    NO_PERMISSION = "no_permission", _("No permission to watch")
+
+
+@dataclass(frozen=True)
+class WatchDecision:
+    allowed: bool
+    reason: WatchReason
+
+    @property
+    def message(self) -> str:
+        return str(self.reason.label)
+
+
+class WatchPermissionService:
+    """
+    Resolves whether a user can watch a video, see WatchPermission for the rules.
+
+    A decision costs at most two queries (the video with its bindings, then an indexed lookup
+    of the user's entitlements, see EntitlementService) and is cached per (user, video).
+    Cached decisions are dropped by bumping a version: per user on permission, group and
+    subscription changes, per video on video changes, globally on catalogue and group changes.
+    """
+    @classmethod
+    def resolve(cls, user: AbstractUser | AnonymousUser, video: Video) -> WatchDecision:
+        if getattr(user, "is_superuser", False) or getattr(user, "is_staff", False):
+            return WatchDecision(True, WatchReason.STAFF)
+
+        user_id = user.pk if getattr(user, "is_authenticated", False) else None
+        version_keys = [
+            cls._version_key(),
+            cls._version_key("user", user_id),
+            cls._version_key("video", video.pk),
+        ]
+        versions = cache.get_many(version_keys)
+        key = ":".join([
+            CACHE_PREFIX,
+            *(str(versions.get(version_key, 0)) for version_key in version_keys),
+            str(user_id),
+            str(video.pk),
+        ])
+
+        decision = cache.get(key)
+        if decision is None:
+            decision = cls.decide(user, video)
+            cache.set(key, decision, settings.WATCH_PERMISSION_CACHE_SECONDS)
+        return decision
+
+    @classmethod
+    def decide(cls, user: AbstractUser | AnonymousUser, video: Video) -> WatchDecision:
+        """
+        Uncached decision.
+        """
+        if getattr(user, "is_superuser", False) or getattr(user, "is_staff", False):
+            return WatchDecision(True, WatchReason.STAFF)
+
+        video = (
+            Video.objects
+            .select_related("as_movie", "as_trailer", "as_episode__season__title")
+            .filter(pk=video.pk)
+            .first()
+        )
+        if video is None:
+            return WatchDecision(False, WatchReason.BROKEN_BINDING)
+
+        title: Title | None = None
+        season: Season | None = None
+        episode: Episode | None = None
+        is_episode = video.attached_as_episode
+        if video.attached_as_movie:
+            title = video.as_movie
+        elif is_episode:
+            episode = video.as_episode
+            season = episode.season
+            title = season.title
+        elif video.attached_as_trailer:
+            title = video.as_trailer
+
+        if title is None:
+            return WatchDecision(False, WatchReason.BROKEN_BINDING)
+
+        if title.draft:
+            return WatchDecision(False, WatchReason.DRAFT)
+
+        if video.public:
+            return WatchDecision(True, WatchReason.PUBLIC)
+
+        if not getattr(user, "is_authenticated", False):
+            return WatchDecision(False, WatchReason.ANONYMOUS)
+
+        if not all(obj.allowed_to_watch for obj in (title, season, episode) if obj is not None):
+            return WatchDecision(False, WatchReason.NOT_ALLOWED_TO_WATCH)
+
+        # Permission backends grant nothing to inactive users
+        if not user.is_active:
+            return WatchDecision(False, WatchReason.NO_PERMISSION)
+
+        Scope = Entitlement.Scope
+        global_scopes = [Scope.ALL, Scope.ALL_SHOWS if is_episode else Scope.ALL_MOVIES]
+        genre_scopes = [Scope.GENRE, Scope.GENRE_SHOWS if is_episode else Scope.GENRE_MOVIES]
+        query = (
+            Q(scope__in=global_scopes) |
+            Q(scope=Scope.TITLE, title=title) |
+            Q(
+                scope__in=genre_scopes,
+                genre__in=Title.genres.through.objects.filter(title_id=title.pk).values("genre_id"),
+            )
+        )
+        if is_episode:
+            query |= Q(scope=Scope.EPISODE, episode=episode) | Q(scope=Scope.SEASON, season=season)
+
+        granted = set(Entitlement.objects.active().filter(query, user=user).values_list("scope", flat=True))
+
+        if granted.intersection(global_scopes):
+            return WatchDecision(True, WatchReason.GLOBAL_PERMISSION)
+        if Scope.TITLE in granted:
+            return WatchDecision(True, WatchReason.TITLE_PERMISSION)
+        if Scope.EPISODE in granted:
+            return WatchDecision(True, WatchReason.EPISODE_PERMISSION)
+        if Scope.SEASON in granted:
+            return WatchDecision(True, WatchReason.SEASON_PERMISSION)
+        if granted.intersection(genre_scopes):
+            return WatchDecision(True, WatchReason.GENRE_PERMISSION)
+        return WatchDecision(False, WatchReason.NO_PERMISSION)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        cls._bump(cls._version_key())
+
+    @classmethod
+    def invalidate_user(cls, user_id) -> None:
+        cls._bump(cls._version_key("user", user_id))
+
+    @classmethod
+    def invalidate_video(cls, video_id) -> None:
+        cls._bump(cls._version_key("video", video_id))
+
+    @staticmethod
+    def _version_key(*parts) -> str:
+        return ":".join([CACHE_PREFIX, "version", *map(str, parts)])
+
+    @staticmethod
+    def _bump(version_key: str) -> None:
+        # After commit, so a concurrent request can't cache the old state under the new version
+        transaction.on_commit(lambda: cache.set(version_key, uuid.uuid4().hex, None))
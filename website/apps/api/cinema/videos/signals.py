@@ -0,0 +1,52 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.videos.models import Video
+from apps.api.cinema.videos.services.watch_permission_service import WatchPermissionService
+from apps.api.cinema.videos.tasks import delete_video_hls
+
+User = get_user_model()
+
+# Permission, group and subscription changes are handled by entitlement signals,
+# refreshing entitlements invalidates cached decisions of the affected users.
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+@receiver(post_save, sender=Episode)
+@receiver(post_delete, sender=Episode)
+def invalidate_watch_permissions(**kwargs):
+    WatchPermissionService.invalidate_all()
+
+
+@receiver(m2m_changed, sender=Title.genres.through)
+def invalidate_watch_permissions_on_genres(action: str, **kwargs):
+    if action.startswith("post_"):
+        WatchPermissionService.invalidate_all()
+
+
+@receiver(post_save, sender=Video)
+@receiver(post_delete, sender=Video)
+def invalidate_video_watch_permissions(instance: Video, **kwargs):
+    WatchPermissionService.invalidate_video(instance.pk)
+
+
+@receiver(post_delete, sender=Video)
+def delete_video_hls_files(instance: Video, **kwargs):
+    # Queryset deletes (admin bulk delete) included, builds never published included
+    transaction.on_commit(partial(delete_video_hls.delay, str(instance.pk)))
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_watch_permissions(instance: User, **kwargs):
+    # Staff flags
+    WatchPermissionService.invalidate_user(instance.pk)
@@ -1,12 +1,15 @@
-import json
 import logging
+import math
+import re
 import secrets
 import subprocess
 import tempfile
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 
-from celery import shared_task
+from celery import chord, shared_task
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
@@ -17,7 +20,12 @@ from utils.posix import posix_join
 
 from apps.api.cinema.audio_tracks.models import AudioTrack
 from apps.api.cinema.videos.models import Video, VideoResolution
+from apps.api.cinema.videos.services.hls_build_service import HLSBuildService
+from apps.api.cinema.videos.services.segment_publisher_service import SegmentPublisherService
+from apps.api.cinema.videos.services.transcode_cache_service import TranscodeCacheService
 from apps.api.cinema.videos.services.video_status_service import VideoStatusService
+from apps.api.uploads.models import LazyLoadFile
+from apps.api.uploads.services.media_probe_service import MediaProbeService
 from apps.core.models import Language
 
 
@@ -37,6 +45,7 @@ RENDITIONS: list[Rendition] = [
     Rendition("1080p",1920, 1080, 5350,  7500),
 ]
 
+
 VIDEO_CODEC_ARGS = [
     "-c:v", "h264",
     "-profile:v", "main",
@@ -54,9 +63,12 @@ AUDIO_CODEC_ARGS = [
     "-b:a", "128k",
 ]
 
+HLS_SEGMENT_SECONDS = 6
+
 HLS_ARGS = [
-    "-hls_time", "6",
-    "-hls_flags", "independent_segments",
+    "-hls_time", str(HLS_SEGMENT_SECONDS),
+    # temp_file: сегмент появляется под своим именем только когда дописан (см. SegmentPublisherService)
+    "-hls_flags", "independent_segments+temp_file",
     "-hls_playlist_type", "vod",
 ]
 
@@ -67,6 +79,21 @@ FFMPEG_COMMON_ARGS = [
 
 BUCKET = settings.AWS_STORAGE_BUCKET_NAME
 HLS_BASE = "hls"
+MASTER_PLAYLIST_NAME = "master.m3u8"
+HLS_AUDIO_GROUP = "aud"
+# HLS_SOURCE_STREAMING: ffmpeg читает исходник по presigned URL всё время кодирования
+SOURCE_STREAM_URL_EXPIRES = 60 * 60 * 12
+HTTP_INPUT_ARGS = [
+    "-reconnect", "1",
+    "-reconnect_on_network_error", "1",
+    "-reconnect_delay_max", "30",
+]
+STREAM_INF_ATTR_RE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+# Общий сдвиг PTS всех сборок. Параллельные задачи (и инкрементальные аудиодорожки)
+# муксятся независимо: без сдвига ffmpeg по-разному подтягивает отрицательные DTS
+# (задержка B-кадров, AAC priming) в разных процессах, и видео с аудио (и куски
+# между собой) разъезжаются на десятки миллисекунд. Сохраняется в Video.hls_ts_offset
+HLS_TS_OFFSET = 1
 
 
 def run_cmd(args: list[str]) -> subprocess.CompletedProcess:
@@ -75,35 +102,120 @@ def run_cmd(args: list[str]) -> subprocess.CompletedProcess:
     return subprocess.run(args, check=True, capture_output=True, text=True)
 
 
-def ffprobe_json(path: Path) -> dict:
-    """Безопасный ffprobe в JSON."""
-    args = [
-        "ffprobe", "-v", "error",
-        "-print_format", "json",
-        "-show_format",
-        "-show_streams",
-        str(path),
-    ]
-    cp = run_cmd(args)
-    data = json.loads(cp.stdout or "{}")
-    # при желании можно фильтровать по select, но оставим полный JSON — полезно для дебага
-    return data
+def audio_pad_filter(in_spec: str, duration: float, out_lbl: str) -> str:
+    """Дотягиваем/обрезаем аудио ровно под длительность видео."""
+    return f"[{in_spec}]apad=pad_dur={duration},atrim=end={duration},asetpts=PTS-STARTPTS[{out_lbl}]"
 
 
-def get_video_duration_seconds(path: Path) -> float:
-    data = ffprobe_json(path)
-    try:
-        return float(data.get("format", {}).get("duration", 0.0))
-    except (TypeError, ValueError):
-        return 0.0
+def hls_video_prefix(video_id) -> str:
+    """S3 префикс всех сборок видео: hls/videos/<video_id>/<build_id>/..."""
+    return posix_join(HLS_BASE, "videos", str(video_id))
+
+
+def hls_keys_prefix(video_id) -> str:
+    """S3 префикс ключей всех сборок видео: hls/keys/<video_id>/<build_id>.key"""
+    return posix_join(HLS_BASE, "keys", str(video_id))
+
+
+def hls_key_url(base_url: str, video_id, build_id: str) -> str:
+    """
+    URL ключа, который пишется в плейлисты сборки. build_id в запросе: пока старая сборка
+    доигрывает у зрителей после переключения, её плейлисты продолжают получать свой ключ.
+    """
+    key_public_local_url = reverse("api:cinema:videos:hls-key", kwargs={"pk": video_id})
+    return f"{base_url.rstrip('/')}{key_public_local_url}?build={build_id}"
+
+
+def write_hls_keyinfo(out_dir: Path, key_bytes: bytes, iv_hex: str, key_public_url: str) -> tuple[Path, Path]:
+    """
+    Пишем AES-128 ключ и keyinfo для ffmpeg.
+    Возвращаем (путь к ключу, путь к keyinfo).
+    """
+    key_local_path = out_dir / "decrypt.key"
+    key_local_path.write_bytes(key_bytes)
+
+    hls_keyinfo_path = out_dir / "hls.keyinfo"
+    hls_keyinfo_path.write_text("\n".join([key_public_url, str(key_local_path), iv_hex]), encoding="utf-8")
+    return key_local_path, hls_keyinfo_path
+
+
+def build_rendition_ladder(source: LazyLoadFile) -> list[Rendition]:
+    """
+    Лестница под конкретный исходник:
+    - без апскейла: берём rendition, если вписывание исходника в его рамку не увеличивает кадр
+      (по ширине или по высоте рамка не больше исходника — так проходят и 4:3, и широкие 2.39:1);
+    - исходник меньше самой нижней ступени -> одна нижняя ступень;
+    - размеры неизвестны -> вся лестница;
+    - HLS_PER_TITLE_BITRATE: maxrate/bufsize не выше битрейта видео исходника,
+      перекодирование дороже оригинала качества не добавит.
+    """
+    if not source.width or not source.height:
+        return list(RENDITIONS)
+
+    ladder = [r for r in RENDITIONS if r.width <= source.width or r.height <= source.height]
+    ladder = ladder or RENDITIONS[:1]
+
+    source_kbps = source_video_bitrate(source) // 1000
+    if settings.HLS_PER_TITLE_BITRATE and source_kbps:
+        ladder = [
+            replace(
+                r,
+                maxrate_k=min(r.maxrate_k, source_kbps),
+                bufsize_k=min(r.bufsize_k, source_kbps * r.bufsize_k // r.maxrate_k),
+            )
+            for r in ladder
+        ]
+    return ladder
+
+
+def source_video_bitrate(source: LazyLoadFile) -> int:
+    """Битрейт видеопотока (bit/s), иначе общий битрейт контейнера, иначе 0."""
+    for st in source.streams:
+        if st.get("codec_type") == "video" and st.get("bit_rate"):
+            return st["bit_rate"]
+    return source.bit_rate or 0
+
+
+def ffmpeg_input_args(src: Path | str) -> list[str]:
+    """-i для локального файла или presigned URL (с переподключением при обрывах)."""
+    if isinstance(src, str) and src.startswith(("http://", "https://")):
+        return [*HTTP_INPUT_ARGS, "-i", src]
+    return ["-i", str(src)]
+
+
+def fetch_source(
+    upload_client: S3UploadClient,
+    key: str,
+    tmpdir: Path,
+    local_name: str | None = None,
+    stream: bool = False,
+) -> Path | str:
+    """
+    Вход для ffmpeg:
+    - по умолчанию скачиваем объект во временную папку;
+    - с HLS_SOURCE_STREAMING (или stream=True) отдаём presigned URL: без локальной копии и места под неё,
+      ffmpeg сам читает нужные байты (seek по Range запросам).
+    """
+    if stream or settings.HLS_SOURCE_STREAMING:
+        return upload_client.get_presigned_url(key, expires=SOURCE_STREAM_URL_EXPIRES)
+
+    local_path = tmpdir / (local_name or Path(key).name)
+    upload_client.download_to(key, local_path, progress=download_progress_logger(key))
+    return local_path
+
 
+def download_progress_logger(key: str, step: int = 10) -> Callable[[int, int], None]:
+    """Колбэк для S3StorageClient.download_to: пишет в лог каждые step процентов."""
+    reported = -step
 
-def has_audio_stream(path: Path) -> bool:
-    data = ffprobe_json(path)
-    for st in data.get("streams", []):
-        if st.get("codec_type") == "audio":
-            return True
-    return False
+    def log_progress(downloaded: int, total: int) -> None:
+        nonlocal reported
+        percent = downloaded * 100 // total if total else 100
+        if percent >= reported + step:
+            reported = percent - percent % step
+            logging.info("Downloading %s: %s%% (%s/%s bytes)", key, reported, downloaded, total)
+
+    return log_progress
 
 
 @dataclass
@@ -111,7 +223,7 @@ class AudioSource:
     is_builtin: bool
     language_code: str  # ISO, e.g. 'en', 'ru', 'und'
     is_default: bool
-    tmp_path: Path | None  # None для встроенной дорожки
+    tmp_path: Path | str | None  # None для встроенной дорожки
 
 
 def build_var_stream_map(renditions: list[Rendition], audio_sources: list[AudioSource]) -> str:
@@ -142,29 +254,28 @@ def build_var_stream_map(renditions: list[Rendition], audio_sources: list[AudioS
 
 
 def ffmpeg_build_command(
-    local_src: Path,
-    audio_files: list[Path],
+    local_src: Path | str,
+    audio_files: list[Path | str],
     out_dir: Path,
     renditions: list[Rendition],
     audio_sources: list[AudioSource],
     hls_keyinfo_path: Path,
     master_name: str,
+    duration: float,
 ) -> list[str]:
     """
     Строим аргументы ffmpeg (без shell), с:
     - входами: 1 видео + N внешних аудио
     - 1 видеофильтр scale на каждый rendition
-    - аудио-graph apad/atrim под длительность исходника
+    - аудио-graph apad/atrim под длительность исходника (duration из метаданных LazyLoadFile)
     - корректным var_stream_map + шаблонами имен
     """
-    duration = get_video_duration_seconds(local_src)
-
     args: list[str] = ["ffmpeg", *FFMPEG_COMMON_ARGS]
 
-    # inputs
-    args += ["-i", str(local_src)]
+    # inputs (локальные файлы или presigned URL)
+    args += ffmpeg_input_args(local_src)
     for f in audio_files:
-        args += ["-i", str(f)]
+        args += ffmpeg_input_args(f)
 
     # video mapping (по числу rendition'ов)
     for _ in renditions:
@@ -179,9 +290,7 @@ def ffmpeg_build_command(
         if not src.is_builtin:
             next_ext_input_idx += 1
         out_lbl = f"a{i}p"
-        filter_parts.append(
-            f"[{in_spec}]apad=pad_dur={duration},atrim=end={duration},asetpts=PTS-STARTPTS[{out_lbl}]"
-        )
+        filter_parts.append(audio_pad_filter(in_spec, duration, out_lbl))
         audio_out_labels.append(out_lbl)
 
     if filter_parts:
@@ -210,6 +319,8 @@ def ffmpeg_build_command(
     # HLS
     seg_tmpl = str(out_dir / "%v_%03d.ts")
     var_pl_tmpl = str(out_dir / "%v.m3u8")
+    # тот же сдвиг, что и у отдельно кодируемых аудиодорожек (инкрементальная пересборка)
+    args += ["-output_ts_offset", str(HLS_TS_OFFSET)]
     args += ["-hls_key_info_file", str(hls_keyinfo_path)]
     args += HLS_ARGS
     args += ["-master_pl_name", master_name]
@@ -218,11 +329,640 @@ def ffmpeg_build_command(
     return args
 
 
+def ffmpeg_build_rendition_command(
+    local_src: Path | str,
+    out_dir: Path,
+    rendition: Rendition,
+    hls_keyinfo_path: Path,
+    chunk: dict | None = None,
+) -> list[str]:
+    """
+    Параллельный режим: один видеорендер без аудио -> <name>.m3u8 + <name>_%03d.ts
+    Для chunk={"index", "start", "length"} кодируем только кусок исходника:
+    - точный seek + -t, ключевые кадры принудительно на границах сегментов,
+      поэтому куски склеиваются без перекрытий;
+    - -output_ts_offset сохраняет непрерывные PTS между кусками (без DISCONTINUITY)
+      и совпадает с аудиозадачами (см. HLS_TS_OFFSET).
+    """
+    name = rendition_output_name(rendition, chunk)
+
+    args: list[str] = ["ffmpeg", *FFMPEG_COMMON_ARGS]
+    if chunk is not None:
+        args += ["-ss", str(chunk["start"]), "-t", str(chunk["length"])]
+    args += ffmpeg_input_args(local_src)
+    args += ["-map", "0:v:0", "-an"]
+    args += VIDEO_CODEC_ARGS
+    args += [
+        "-filter:v",
+        f"scale=w={rendition.width}:h={rendition.height}:force_original_aspect_ratio=decrease",
+        "-maxrate:v", f"{rendition.maxrate_k}k",
+        "-bufsize:v", f"{rendition.bufsize_k}k",
+    ]
+    if chunk is not None:
+        args += ["-force_key_frames", f"expr:gte(t,n_forced*{HLS_SEGMENT_SECONDS})"]
+    start = chunk["start"] if chunk is not None else 0
+    args += ["-output_ts_offset", str(start + HLS_TS_OFFSET)]
+    args += ["-hls_key_info_file", str(hls_keyinfo_path)]
+    args += HLS_ARGS
+    # мини-мастер нужен только чтобы забрать RESOLUTION/CODECS, которые ffmpeg знает из SPS
+    args += ["-master_pl_name", f"{name}_{MASTER_PLAYLIST_NAME}"]
+    args += [
+        "-hls_segment_filename", str(out_dir / f"{name}_%03d.ts"),
+        str(out_dir / f"{name}.m3u8"),
+    ]
+    return args
+
+
+def rendition_output_name(rendition: Rendition, chunk: dict | None = None) -> str:
+    if chunk is None:
+        return rendition.name
+    return f"{rendition.name}_c{chunk['index']:04d}"
+
+
+def plan_chunks(duration: float, chunk_seconds: int) -> list[dict]:
+    """
+    Режем исходник на куски, кратные длине HLS-сегмента (а значит и границам GOP
+    после -force_key_frames), чтобы все сегменты кроме последнего были ровно hls_time.
+    Один кусок (или chunk_seconds <= 0) -> пустой список, кодируем целиком.
+    """
+    if chunk_seconds <= 0 or duration <= 0:
+        return []
+
+    length = max(1, math.ceil(chunk_seconds / HLS_SEGMENT_SECONDS)) * HLS_SEGMENT_SECONDS
+    count = math.ceil(duration / length)
+    if count < 2:
+        return []
+
+    return [
+        {"index": i, "start": i * length, "length": length}
+        for i in range(count)
+    ]
+
+
+def ffmpeg_build_audio_command(
+    local_src: Path | str,
+    duration: float,
+    out_dir: Path,
+    name: str,
+    hls_keyinfo_path: Path,
+) -> list[str]:
+    """
+    Параллельный режим: одна аудиодорожка -> <name>.m3u8 + <name>_%03d.ts
+    """
+    args: list[str] = ["ffmpeg", *FFMPEG_COMMON_ARGS, *ffmpeg_input_args(local_src)]
+    args += ["-filter_complex", audio_pad_filter("0:a", duration, "aout")]
+    args += ["-map", "[aout]", "-vn"]
+    args += AUDIO_CODEC_ARGS
+    args += ["-output_ts_offset", str(HLS_TS_OFFSET)]
+    args += ["-hls_key_info_file", str(hls_keyinfo_path)]
+    args += HLS_ARGS
+    args += [
+        "-hls_segment_filename", str(out_dir / f"{name}_%03d.ts"),
+        str(out_dir / f"{name}.m3u8"),
+    ]
+    return args
+
+
+def read_media_playlist(playlist: Path) -> tuple[list[str], list[tuple[float, str]]]:
+    """
+    Разбираем медиаплейлист ffmpeg: (строки #EXT-X-KEY, [(длительность, имя сегмента)]).
+    """
+    key_lines: list[str] = []
+    segments: list[tuple[float, str]] = []
+    seg_duration = 0.0
+    for line in playlist.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line.startswith("#EXT-X-KEY:"):
+            if not segments:
+                key_lines.append(line)
+        elif line.startswith("#EXTINF:"):
+            try:
+                seg_duration = float(line[len("#EXTINF:"):].split(",", 1)[0])
+            except ValueError:
+                seg_duration = 0.0
+        elif line and not line.startswith("#"):
+            segments.append((seg_duration, line))
+            seg_duration = 0.0
+    return key_lines, segments
+
+
+def build_media_playlist(key_lines: list[str], segments: list[tuple[float, str]]) -> str:
+    """VOD медиаплейлист из склеенных кусков: сквозной MEDIA-SEQUENCE с нуля."""
+    target = max((math.ceil(d) for d, _ in segments), default=HLS_SEGMENT_SECONDS)
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:6",
+        f"#EXT-X-TARGETDURATION:{target}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+        "#EXT-X-INDEPENDENT-SEGMENTS",
+        *key_lines,
+    ]
+    for seg_duration, name in segments:
+        lines.append(f"#EXTINF:{seg_duration:.6f},")
+        lines.append(name)
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def playlist_peak_bandwidth(playlist: Path) -> int:
+    """Пиковый битрейт (бит/с) по сегментам медиаплейлиста — для BANDWIDTH в мастере."""
+    _, segments = read_media_playlist(playlist)
+    peak = 0
+    for seg_duration, name in segments:
+        if seg_duration > 0:
+            size = (playlist.parent / name).stat().st_size
+            peak = max(peak, int(size * 8 / seg_duration))
+    return peak
+
+
+def read_stream_inf(master: Path) -> dict[str, str]:
+    """Атрибуты первого #EXT-X-STREAM-INF из мастер-плейлиста ffmpeg."""
+    if not master.exists():
+        return {}
+    for line in master.read_text(encoding="utf-8").splitlines():
+        if line.startswith("#EXT-X-STREAM-INF:"):
+            attrs = STREAM_INF_ATTR_RE.findall(line.split(":", 1)[1])
+            return {k: v.strip('"') for k, v in attrs}
+    return {}
+
+
+def build_audio_media_lines(audios: list[dict], group: str = HLS_AUDIO_GROUP) -> list[str]:
+    """
+    #EXT-X-MEDIA строки аудиогруппы.
+    Как и в build_var_stream_map: ровно одна аудиодорожка default, иначе первая.
+    URI по умолчанию <name>.m3u8 рядом с мастером.
+    """
+    lines = []
+    default_idx = next((i for i, a in enumerate(audios) if a["is_default"]), 0)
+    for i, a in enumerate(audios):
+        uri = a.get("uri") or f"{a['name']}.m3u8"
+        lines.append(
+            f'#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="{group}",NAME="{a["name"]}",'
+            f'LANGUAGE="{a["language_code"]}",DEFAULT={"YES" if i == default_idx else "NO"},'
+            f'AUTOSELECT=YES,URI="{uri}"'
+        )
+    return lines
+
+
+def build_master_playlist(variants: list[dict], audios: list[dict]) -> str:
+    """
+    Склеиваем мастер-плейлист из результатов параллельных задач.
+    """
+    lines = ["#EXTM3U", "#EXT-X-VERSION:6", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    lines += build_audio_media_lines(audios)
+
+    audio_bandwidth = max((a["bandwidth"] for a in audios), default=0)
+    for v in sorted(variants, key=lambda item: item["bandwidth"]):
+        codecs = v["codecs"] + (",mp4a.40.2" if audios else "")
+        attrs = [
+            f"BANDWIDTH={v['bandwidth'] + audio_bandwidth}",
+            f"RESOLUTION={v['resolution']}",
+            f'CODECS="{codecs}"',
+        ]
+        if audios:
+            attrs.append(f'AUDIO="{HLS_AUDIO_GROUP}"')
+        lines.append("#EXT-X-STREAM-INF:" + ",".join(attrs))
+        lines.append(f"{v['name']}.m3u8")
+
+    return "\n".join(lines) + "\n"
+
+
+def master_audio_group(master_text: str) -> str | None:
+    """GROUP-ID аудиогруппы, на которую ссылаются видеоварианты мастера (None — вариантов с аудио нет)."""
+    for line in master_text.splitlines():
+        if line.startswith("#EXT-X-STREAM-INF:"):
+            attrs = {k: v.strip('"') for k, v in STREAM_INF_ATTR_RE.findall(line.split(":", 1)[1])}
+            if "AUDIO" in attrs:
+                return attrs["AUDIO"]
+    return None
+
+
+def rewrite_master_audio(master_text: str, audios: list[dict]) -> str:
+    """
+    Пересобираем в существующем мастере только аудиогруппу, видеоварианты остаются как есть.
+    BANDWIDTH вариантов не меняется: все аудиодорожки кодируются одним AUDIO_CODEC_ARGS битрейтом.
+    """
+    group = master_audio_group(master_text) or HLS_AUDIO_GROUP
+    lines = [line for line in master_text.splitlines() if not line.startswith("#EXT-X-MEDIA:TYPE=AUDIO")]
+    first_variant = next((i for i, line in enumerate(lines) if line.startswith("#EXT-X-STREAM-INF:")), len(lines))
+    lines[first_variant:first_variant] = build_audio_media_lines(audios, group)
+    return "\n".join(lines) + "\n"
+
+
+def upload_playlist(upload_client: S3UploadClient, out_dir: Path, hls_build_prefix: str, name: str) -> str:
+    """
+    Заливаем плейлист одного варианта, возвращаем его S3 ключ.
+    Сегменты к этому моменту уже опубликованы SegmentPublisherService.
+    """
+    playlist_key = posix_join(hls_build_prefix, f"{name}.m3u8")
+    upload_client.upload_file(playlist_key, out_dir / f"{name}.m3u8")
+    return playlist_key
+
+
+def merge_chunk_results(results: list[dict], upload_client: S3UploadClient, hls_build_prefix: str) -> list[dict]:
+    """
+    Склеиваем куски rendition'ов (kind=video_chunk) в обычные video-результаты:
+    единый VOD плейлист на rendition, сегменты кусков идут подряд.
+    """
+    merged: list[dict] = [r for r in results if r["kind"] != "video_chunk"]
+    chunks: dict[str, list[dict]] = defaultdict(list)
+    for r in results:
+        if r["kind"] == "video_chunk":
+            chunks[r["name"]].append(r)
+
+    if not chunks:
+        return merged
+
+    with tempfile.TemporaryDirectory() as td:
+        tmpdir = Path(td)
+        for name, parts in chunks.items():
+            parts.sort(key=lambda item: item["chunk"])
+            segments = [tuple(seg) for part in parts for seg in part["segments"]]
+
+            playlist = tmpdir / f"{name}.m3u8"
+            playlist.write_text(build_media_playlist(parts[0]["key_lines"], segments), encoding="utf-8")
+            playlist_key = posix_join(hls_build_prefix, playlist.name)
+            upload_client.upload_file(playlist_key, playlist)
+
+            merged.append({
+                "kind": "video",
+                "name": name,
+                "bandwidth": max(part["bandwidth"] for part in parts),
+                "resolution": parts[0]["resolution"],
+                "codecs": parts[0]["codecs"],
+                "playlist": playlist_key,
+            })
+
+    return merged
+
+
+def collect_audio_specs(video: Video, source: LazyLoadFile) -> list[dict]:
+    """
+    Аудиовходы сборки: встроенная дорожка исходника (под original_language), затем внешние
+    от дефолтных к остальным. Для встроенной заводим AudioTrack, если его ещё нет.
+    """
+    audio_specs: list[dict] = []
+    if source.has_audio and video.original_language:
+        try:
+            AudioTrack.objects.get_or_create(
+                video=video,
+                language=video.original_language,
+                defaults={"is_default": True},
+            )
+        except Exception as e:
+            logging.warning("AudioTrack get_or_create failed: %s", e)
+
+        audio_specs.append({
+            "s3_key": str(source.file),
+            "is_builtin": True,
+            "language_code": video.original_language.code,
+            "is_default": True,
+        })
+
+    ext_qs = (
+        video.audio_tracks.select_related("file", "language")
+        .filter(file__isnull=False)
+        .order_by("-is_default", "id")
+    )
+    for at in ext_qs:
+        audio_specs.append({
+            "s3_key": str(at.file.file),
+            "is_builtin": False,
+            "language_code": at.language.code if at.language else "und",
+            "is_default": bool(at.is_default),
+        })
+    return audio_specs
+
+
+def build_fingerprint(
+    upload_client: S3UploadClient,
+    source: LazyLoadFile,
+    renditions: list[Rendition],
+    audio_specs: list[dict],
+) -> str:
+    """
+    Отпечаток всего, от чего зависит результат кодирования (ключ TranscodeCacheEntry).
+    Исходники адресуются по ETag: перезалитый под тем же именем файл даст другой отпечаток.
+    """
+    payload = {
+        "source": upload_client.get_etag(str(source.file)),
+        "renditions": [asdict(r) for r in renditions],
+        "video_codec_args": VIDEO_CODEC_ARGS,
+        "audio_codec_args": AUDIO_CODEC_ARGS,
+        "hls_args": HLS_ARGS,
+        "ts_offset": HLS_TS_OFFSET,
+        "audio": [
+            {
+                "source": "builtin" if spec["is_builtin"] else upload_client.get_etag(spec["s3_key"]),
+                "language_code": spec["language_code"],
+                "is_default": spec["is_default"],
+            }
+            for spec in audio_specs
+        ],
+    }
+    return TranscodeCacheService.fingerprint(payload)
+
+
+def finalize_build(
+    video: Video,
+    hls_build_prefix: str,
+    hls_key_s3_key: str,
+    resolutions: dict[int, str],
+    audio_playlists: dict[str, str],
+) -> None:
+    """
+    Переключаем Video на готовую сборку: AudioTrack/VideoResolution и поля Video в одной транзакции.
+    Прошлая сборка не удаляется, а уходит в RETIRED (её удалит sweep_hls_builds после grace-периода).
+    resolutions: высота -> S3 ключ плейлиста, audio_playlists: код языка -> S3 ключ плейлиста.
+    """
+    with transaction.atomic():
+        HLSBuildService.publish(video, hls_build_prefix, hls_key_s3_key)
+
+        for lang_code, playlist in audio_playlists.items():
+            lang: Language | None = Language.objects.filter(code__iexact=lang_code).first()
+            if lang is None:
+                logging.warning("Unknown language code from playlist: %s", lang_code)
+                continue
+            AudioTrack.objects.update_or_create(
+                video=video,
+                language=lang,
+                defaults={"hls_file": playlist},
+            )
+
+        for height, playlist in resolutions.items():
+            VideoResolution.objects.update_or_create(
+                video=video,
+                resolution=height,
+                defaults={"file": playlist},
+            )
+        # ступени, которых нет в новой лестнице, остались бы ссылками на удалённую сборку
+        video.resolutions.exclude(resolution__in=list(resolutions)).delete()
+
+        video.hls_master_playlist = posix_join(hls_build_prefix, MASTER_PLAYLIST_NAME)
+        video.hls_decrypt_key = hls_key_s3_key
+        video.hls_ts_offset = HLS_TS_OFFSET
+        video.save()
+
+
+def resume_or_start_build(
+    upload_client: S3UploadClient,
+    video: Video,
+    fingerprint: str,
+    base_url: str,
+    hls_build_prefix: str,
+    hls_key_s3_key: str,
+) -> tuple[str, str, str, bytes, str]:
+    """
+    Ретрай (или перезапуск) упавшей сборки с теми же входами продолжает её BUILDING HLSBuild:
+    тот же префикс, ключ и IV, поэтому сегменты, выгруженные прошлой попыткой,
+    SegmentPublisherService не выгружает заново, а префикс не остаётся брошенным.
+    Иначе начинаем новую сборку под hls_build_prefix. Ключ выгружаем сразу, чтобы ретрай мог его прочитать
+    (key endpoint не отдаёт ключи BUILDING сборок).
+    Возвращаем (префикс, S3 ключ AES-ключа, URL ключа, AES-ключ, IV hex).
+    """
+    build = HLSBuildService.resume(video, fingerprint)
+    if build is not None:
+        logging.info("Video %s: resuming build %s", video.id, build.prefix)
+        return (
+            build.prefix,
+            build.decrypt_key,
+            hls_key_url(base_url, video.id, Path(build.prefix).name),
+            upload_client.read(build.decrypt_key),
+            build.iv,
+        )
+
+    key_bytes = secrets.token_bytes(16)         # AES-128
+    iv_hex = secrets.token_hex(16)              # 16 байт -> 32 hex-символа
+    with tempfile.TemporaryDirectory() as td:
+        key_local_path = Path(td) / "hls.key"
+        key_local_path.write_bytes(key_bytes)
+        upload_client.upload_file(hls_key_s3_key, key_local_path)
+    # недостроенную (упавшую) сборку подберёт sweep_hls_builds
+    HLSBuildService.start(video, hls_build_prefix, hls_key_s3_key, fingerprint, iv_hex)
+    return (
+        hls_build_prefix,
+        hls_key_s3_key,
+        hls_key_url(base_url, video.id, Path(hls_build_prefix).name),
+        key_bytes,
+        iv_hex,
+    )
+
+
+def start_parallel_build(
+    video: Video,
+    source: LazyLoadFile,
+    renditions: list[Rendition],
+    audio_specs: list[dict],
+    key_public_url: str,
+    hls_build_prefix: str,
+    hls_key_s3_key: str,
+    key_bytes: bytes,
+    iv_hex: str,
+    fingerprint: str,
+) -> None:
+    """
+    Координатор параллельного режима: без скачивания исходника
+    (метаданные уже сохранены на LazyLoadFile), раскладываем работу в chord:
+    по задаче на rendition и на аудиодорожку + финальная склейка мастера.
+    """
+    src_key = str(source.file)
+    duration = source.duration or 0.0
+
+    context = {
+        "video_id": str(video.id),
+        "src_key": src_key,
+        "duration": duration,
+        # лестница с учётом исходника (и per-title битрейтов), задачи берут rendition отсюда
+        "renditions": {r.name: asdict(r) for r in renditions},
+        "hls_build_prefix": hls_build_prefix,
+        "hls_key_s3_key": hls_key_s3_key,
+        "key_public_url": key_public_url,
+        "fingerprint": fingerprint,
+        # ключ обязан быть общим для всех вариантов сборки
+        "key_hex": key_bytes.hex(),
+        "iv_hex": iv_hex,
+    }
+
+    chunks = plan_chunks(duration, settings.HLS_TRANSCODE_CHUNK_SECONDS)
+    if chunks:
+        header = [transcode_rendition.s(context, r.name, chunk) for r in renditions for chunk in chunks]
+    else:
+        header = [transcode_rendition.s(context, r.name) for r in renditions]
+    header += [transcode_audio_track.s(context, spec) for spec in audio_specs]
+    callback = publish_master_playlist.s(context).on_error(mark_build_failed.si(context["video_id"]))
+    chord(header)(callback)
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=60)
+def transcode_rendition(self, context: dict, rendition_name: str, chunk: dict | None = None) -> dict:
+    """
+    Параллельный режим: кодируем один rendition и публикуем его вариативный плейлист.
+    С chunk кодируем только временной кусок: сегменты публикуем сразу,
+    а плейлист склеит publish_master_playlist.
+    """
+    rendition = Rendition(**context["renditions"][rendition_name])
+    name = rendition_output_name(rendition, chunk)
+    upload_client = S3UploadClient()
+
+    with tempfile.TemporaryDirectory() as td:
+        tmpdir = Path(td)
+        out_dir = tmpdir / "out"
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            # кусок читает по URL только свой отрезок (-ss/-t перед -i): скачивание исходника целиком
+            # в каждой задаче дало бы куски x renditions полных загрузок
+            local_src = fetch_source(upload_client, context["src_key"], tmpdir, stream=chunk is not None)
+            _, hls_keyinfo_path = write_hls_keyinfo(
+                out_dir,
+                bytes.fromhex(context["key_hex"]),
+                context["iv_hex"],
+                context["key_public_url"],
+            )
+            with SegmentPublisherService(
+                out_dir,
+                context["hls_build_prefix"],
+                pattern=f"{name}_*.ts",
+                client=upload_client,
+            ):
+                run_cmd(ffmpeg_build_rendition_command(local_src, out_dir, rendition, hls_keyinfo_path, chunk))
+        except subprocess.CalledProcessError as e:
+            logging.error("ffmpeg failed: %s\nstdout:\n%s\nstderr:\n%s", e, e.stdout, e.stderr)
+            raise self.retry(exc=e) from e
+        except Exception as e:
+            logging.exception("transcode_rendition %s failed for video %s: %s", rendition_name, context["video_id"], e)
+            raise self.retry(exc=e) from e
+
+        # сегменты уже зашифрованы, поэтому параметры потока берём из мини-мастера ffmpeg
+        stream_inf = read_stream_inf(out_dir / f"{name}_{MASTER_PLAYLIST_NAME}")
+        playlist = out_dir / f"{name}.m3u8"
+        result = {
+            "kind": "video",
+            "name": rendition.name,
+            "bandwidth": playlist_peak_bandwidth(playlist) or rendition.maxrate_k * 1000,
+            "resolution": stream_inf.get("RESOLUTION", f"{rendition.width}x{rendition.height}"),
+            "codecs": stream_inf.get("CODECS", "avc1.4d401f"),
+        }
+        if chunk is not None:
+            # плейлист куска не публикуем: его склеит publish_master_playlist
+            key_lines, segments = read_media_playlist(playlist)
+            result.update({
+                "kind": "video_chunk",
+                "chunk": chunk["index"],
+                "key_lines": key_lines,
+                "segments": segments,
+            })
+        else:
+            result["playlist"] = upload_playlist(upload_client, out_dir, context["hls_build_prefix"], name)
+
+    return result
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=60)
+def transcode_audio_track(self, context: dict, spec: dict) -> dict:
+    """
+    Параллельный режим: кодируем одну аудиодорожку (встроенную или внешнюю) в language-<code>.m3u8
+    """
+    name = f"language-{spec['language_code']}"
+    upload_client = S3UploadClient()
+
+    with tempfile.TemporaryDirectory() as td:
+        tmpdir = Path(td)
+        out_dir = tmpdir / "out"
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            local_src = fetch_source(upload_client, spec["s3_key"], tmpdir)
+            _, hls_keyinfo_path = write_hls_keyinfo(
+                out_dir,
+                bytes.fromhex(context["key_hex"]),
+                context["iv_hex"],
+                context["key_public_url"],
+            )
+            with SegmentPublisherService(
+                out_dir,
+                context["hls_build_prefix"],
+                pattern=f"{name}_*.ts",
+                client=upload_client,
+            ):
+                run_cmd(ffmpeg_build_audio_command(local_src, context["duration"], out_dir, name, hls_keyinfo_path))
+        except subprocess.CalledProcessError as e:
+            logging.error("ffmpeg failed: %s\nstdout:\n%s\nstderr:\n%s", e, e.stdout, e.stderr)
+            raise self.retry(exc=e) from e
+        except Exception as e:
+            logging.exception("transcode_audio_track %s failed for video %s: %s", name, context["video_id"], e)
+            raise self.retry(exc=e) from e
+
+        result = {
+            "kind": "audio",
+            "name": name,
+            "language_code": spec["language_code"],
+            "is_default": spec["is_default"],
+            "bandwidth": playlist_peak_bandwidth(out_dir / f"{name}.m3u8"),
+        }
+        result["playlist"] = upload_playlist(upload_client, out_dir, context["hls_build_prefix"], name)
+
+    return result
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=60)
+def publish_master_playlist(self, results: list[dict], context: dict):
+    """
+    Финал chord'а: склеиваем мастер и синхронизируем VideoResolution/AudioTrack (ключ выгружен при старте сборки).
+    """
+    try:
+        video = Video.objects.get(id=context["video_id"])
+    except ObjectDoesNotExist:
+        logging.error("Video %s not found", context["video_id"])
+        return
+
+    hls_build_prefix = context["hls_build_prefix"]
+    master_key = posix_join(hls_build_prefix, MASTER_PLAYLIST_NAME)
+
+    try:
+        upload_client = S3UploadClient()
+        results = merge_chunk_results(results, upload_client, hls_build_prefix)
+        variants = [r for r in results if r["kind"] == "video"]
+        audios = [r for r in results if r["kind"] == "audio"]
+
+        with tempfile.TemporaryDirectory() as td:
+            tmpdir = Path(td)
+            master_path = tmpdir / MASTER_PLAYLIST_NAME
+            master_path.write_text(build_master_playlist(variants, audios), encoding="utf-8")
+            upload_client.upload_file(master_key, master_path)
+
+        resolutions = {int(v["name"].replace("p", "")): v["playlist"] for v in variants}
+        audio_playlists = {a["language_code"]: a["playlist"] for a in audios}
+        finalize_build(video, hls_build_prefix, context["hls_key_s3_key"], resolutions, audio_playlists)
+        TranscodeCacheService.store(
+            context["fingerprint"],
+            hls_build_prefix,
+            context["hls_key_s3_key"],
+            context["key_public_url"],
+            resolutions,
+            audio_playlists,
+        )
+    except Exception as e:
+        logging.exception("publish_master_playlist failed for video %s: %s", context["video_id"], e)
+        raise self.retry(exc=e) from e
+
+    VideoStatusService.completed(video)
+
+
+@shared_task
+def mark_build_failed(video_id: str):
+    video = Video.objects.filter(id=video_id).first()
+    if video is not None:
+        VideoStatusService.failed(video)
+
+
 @shared_task(bind=True, max_retries=2, default_retry_delay=60)
 def create_master_playlist(self, base_url: str, video_id: int):
     """
     Генерим HLS-мастер и вариативные плейлисты с несколькими аудиодорожками.
     Паблишим в S3 под версионированной директорией build_id.
+    Сборку с теми же входами (см. build_fingerprint) не кодируем, а берём из TranscodeCacheEntry.
     """
     try:
         video = Video.objects.select_related("file", "original_language").get(id=video_id)
@@ -236,154 +976,158 @@ def create_master_playlist(self, base_url: str, video_id: int):
     build_id = timezone.now().strftime("%d-%m-%Y-%H-%M-%S")
 
     # S3 ключи (POSIX!)
-    hls_key_s3_key = posix_join(HLS_BASE, "keys", str(video.id), "hls.key")
-    hls_video_prefix = posix_join(HLS_BASE, "videos", str(video.id))
-    # подчистим старые сборки для этого видео
+    # Сборка пишется рядом с текущей и не трогает её: зрители досматривают старую,
+    # пока finalize_build не переключит Video, а при падении остаётся рабочая старая
+    video_prefix = hls_video_prefix(video.id)
+    hls_build_prefix = posix_join(video_prefix, build_id)
+    # ключ у каждой сборки свой: кэш переиспользует сборку вместе с её ключом
+    hls_key_s3_key = posix_join(hls_keys_prefix(video.id), f"{build_id}.key")
+
+    # публичный (или полу-публичный) URL до key endpoint
+    key_public_url = hls_key_url(base_url, video.id, build_id)
+
+    cache = TranscodeCacheService(upload_client)
     try:
-        upload_client.delete_prefix(hls_video_prefix)
+        # метаданные исходника: пробуем один раз после загрузки, тут только читаем
+        source = MediaProbeService(upload_client).ensure(video.file)
+        renditions = build_rendition_ladder(source)
+        audio_specs = collect_audio_specs(video, source)
+        fingerprint = build_fingerprint(upload_client, source, renditions, audio_specs)
+
+        entry = cache.lookup(fingerprint)
+        if entry is not None:
+            entry_build_id = Path(entry.hls_build_prefix).name
+            if (
+                entry.hls_build_prefix.startswith(video_prefix + "/") and
+                entry.key_uri == hls_key_url(base_url, video.id, entry_build_id)
+            ):
+                # входы не менялись с текущей сборки этого же видео: перекодировать и копировать нечего
+                hls_build_prefix, hls_key_s3_key = entry.hls_build_prefix, entry.hls_decrypt_key
+                key_public_url = entry.key_uri
+            else:
+                HLSBuildService.start(video, hls_build_prefix, hls_key_s3_key)
+                cache.restore(entry, hls_build_prefix, hls_key_s3_key, key_public_url)
+            resolutions, audio_playlists = cache.playlists(entry, hls_build_prefix)
+            finalize_build(video, hls_build_prefix, hls_key_s3_key, resolutions, audio_playlists)
+            cache.store(fingerprint, hls_build_prefix, hls_key_s3_key, key_public_url, resolutions, audio_playlists)
     except Exception as e:
-        # не фатально: продолжим, новая сборка будет в подпапке build_id
-        logging.warning("Failed to clean S3 prefix %s: %s", hls_video_prefix, e)
+        logging.exception("create_master_playlist failed for video %s: %s", video_id, e)
+        VideoStatusService.failed(video)
+        raise self.retry(exc=e) from e
 
-    hls_build_prefix = posix_join(hls_video_prefix, build_id)
+    if entry is not None:
+        logging.info("Video %s: reused cached build %s", video_id, entry.hls_build_prefix)
+        VideoStatusService.completed(video)
+        return
+
+    try:
+        hls_build_prefix, hls_key_s3_key, key_public_url, key_bytes, iv_hex = resume_or_start_build(
+            upload_client,
+            video,
+            fingerprint,
+            base_url,
+            hls_build_prefix,
+            hls_key_s3_key,
+        )
+    except Exception as e:
+        logging.exception("create_master_playlist failed for video %s: %s", video_id, e)
+        VideoStatusService.failed(video)
+        raise self.retry(exc=e) from e
+
+    if settings.HLS_PARALLEL_TRANSCODE:
+        try:
+            start_parallel_build(
+                video,
+                source,
+                renditions,
+                audio_specs,
+                key_public_url,
+                hls_build_prefix,
+                hls_key_s3_key,
+                key_bytes,
+                iv_hex,
+                fingerprint,
+            )
+        except Exception as e:
+            logging.exception("create_master_playlist failed for video %s: %s", video_id, e)
+            VideoStatusService.failed(video)
+            raise self.retry(exc=e) from e
+        # статус completed выставит publish_master_playlist
+        return
 
     try:
         with tempfile.TemporaryDirectory() as td:
             tmpdir = Path(td)
 
-            src_key = str(video.file.file)
-            local_src = tmpdir / Path(src_key).name
-            upload_client.download_to(src_key, local_src)
+            src_key = str(source.file)
+            local_src = fetch_source(upload_client, src_key, tmpdir)
 
             # папка результатов
-            out_dir = tmpdir / local_src.stem
+            out_dir = tmpdir / Path(src_key).stem
             out_dir.mkdir(parents=True, exist_ok=True)
 
-            # --- HLS ключ и keyinfo ---
-            key_bytes = secrets.token_bytes(16)         # AES-128
-            iv_hex = secrets.token_hex(16)              # 16 байт -> 32 hex-символа
-            key_filename = "decrypt.key"
-            key_local_path = out_dir / key_filename
-            key_local_path.write_bytes(key_bytes)
+            # --- HLS keyinfo (ключ и IV сборки, см. resume_or_start_build) ---
+            _, hls_keyinfo_path = write_hls_keyinfo(out_dir, key_bytes, iv_hex, key_public_url)
 
-            # публичный (или полу-публичный) URL до key endpoint
-            key_public_local_url = reverse("api:cinema:videos:hls-key", kwargs={"pk": video.id})
-            key_public_url = (base_url.rstrip("/") + key_public_local_url)
-
-            hls_keyinfo_path = out_dir / "hls.keyinfo"
-            hls_keyinfo_path.write_text("\n".join([key_public_url, str(key_local_path), iv_hex]), encoding="utf-8")
-
-            # --- аудио-источники ---
+            # --- аудио-источники (встроенная + внешние, см. collect_audio_specs) ---
             audio_sources: list[AudioSource] = []
-            audio_files: list[Path] = []
-
-            builtin_audio = has_audio_stream(local_src)
-            if builtin_audio and video.original_language:
-                lang_code = video.original_language.code
-                # Создадим/обновим дефолтную аудиодорожку под оригинал
-                try:
-                    AudioTrack.objects.get_or_create(
-                        video=video,
-                        language=video.original_language,
-                        defaults={"is_default": True} if video.original_language else {},
-                    )
-                except Exception as e:
-                    logging.warning("AudioTrack get_or_create failed: %s", e)
-
+            audio_files: list[Path | str] = []
+            for spec in audio_specs:
+                local_audio = None
+                if not spec["is_builtin"]:
+                    local_audio = fetch_source(upload_client, spec["s3_key"], tmpdir)
+                    audio_files.append(local_audio)
                 audio_sources.append(
                     AudioSource(
-                        is_builtin=True,
-                        language_code=lang_code,
-                        is_default=bool(video.original_language),
-                        tmp_path=None,
-                    )
-                )
-
-            # внешние аудиодорожки (от дефолтных к остальным)
-            ext_qs = (
-                video.audio_tracks.select_related("file", "language")
-                .filter(file__isnull=False)
-                .order_by("-is_default", "id")
-            )
-            for at in ext_qs:
-                s3_key = str(at.file.file)
-                local_audio = tmpdir / Path(getattr(at.file, "file_name", Path(s3_key).name)).name
-                upload_client.download_to(s3_key, local_audio)
-                audio_files.append(local_audio)
-                audio_sources.append(
-                    AudioSource(
-                        is_builtin=False,
-                        language_code=at.language.code if at.language else "und",
-                        is_default=bool(at.is_default),
+                        is_builtin=spec["is_builtin"],
+                        language_code=spec["language_code"],
+                        is_default=spec["is_default"],
                         tmp_path=local_audio,
                     )
                 )
 
             # --- ffmpeg ---
-            master_name = "master.m3u8"
+            master_name = MASTER_PLAYLIST_NAME
             ffmpeg_args = ffmpeg_build_command(
                 local_src=local_src,
                 audio_files=audio_files,
                 out_dir=out_dir,
-                renditions=RENDITIONS,
+                renditions=renditions,
                 audio_sources=audio_sources,
                 hls_keyinfo_path=hls_keyinfo_path,
                 master_name=master_name,
+                duration=source.duration or 0.0,
             )
             try:
                 # если ffmpeg отвалится — дадим Celery шанс на retry
-                run_cmd(ffmpeg_args)
+                # 1) .ts публикуются по мере готовности, параллельно с кодированием
+                with SegmentPublisherService(out_dir, hls_build_prefix, client=upload_client):
+                    run_cmd(ffmpeg_args)
             except subprocess.CalledProcessError as e:
                 logging.error("ffmpeg failed: %s\nstdout:\n%s\nstderr:\n%s", e, e.stdout, e.stderr)
                 raise self.retry(exc=e) from e
 
             # --- публикация результатов в S3 ---
-            # 1) .ts
-            for ts in sorted(out_dir.glob("*.ts")):
-                upload_client.upload_file(posix_join(hls_build_prefix, ts.name), ts)
 
-            # 2) аудио-плейлисты language-*.m3u8 + синхронизация с AudioTrack
+            # 2) аудио-плейлисты language-*.m3u8
+            audio_playlists: dict[str, str] = {}
             for pl in out_dir.glob("language-*.m3u8"):
-                lang_code = pl.stem.split("-", 1)[-1]
-                lang: Language | None = Language.objects.filter(code__iexact=lang_code).first()
-                if lang is None:
-                    logging.warning("Unknown language code from playlist: %s", lang_code)
-                else:
-                    AudioTrack.objects.update_or_create(
-                        video=video,
-                        language=lang,
-                        defaults={
-                            "hls_file": posix_join(hls_build_prefix, pl.name),
-                        },
-                    )
+                audio_playlists[pl.stem.split("-", 1)[-1]] = posix_join(hls_build_prefix, pl.name)
                 upload_client.upload_file(posix_join(hls_build_prefix, pl.name), pl)
 
-            # 3) вариативные видео-плейлисты %v.m3u8
-            variant_playlists = sorted(out_dir.glob("[0-9]*.m3u8"))
-            for pl in variant_playlists:
-                upload_client.upload_file(posix_join(hls_build_prefix, pl.name), pl)
+            # 3) вариативные видео-плейлисты %v.m3u8 (имя = rendition.name)
+            resolutions: dict[int, str] = {}
+            for r in renditions:
+                resolutions[r.height] = posix_join(hls_build_prefix, f"{r.name}.m3u8")
+                upload_client.upload_file(resolutions[r.height], out_dir / f"{r.name}.m3u8")
 
-            # 4) мастер и ключ
+            # 4) мастер (ключ выгружен при старте сборки)
             master_path = out_dir / master_name
             upload_client.upload_file(posix_join(hls_build_prefix, master_name), master_path)
-            upload_client.upload_file(hls_key_s3_key, key_local_path)
-
-            # 5) сведения о доступных разрешениях
-            # маппинг индекса плейлиста на «360/480/720/1080»
-            with transaction.atomic():
-                for idx, pl in enumerate(variant_playlists):
-                    if idx < len(RENDITIONS):
-                        res_short = RENDITIONS[idx].name.replace("p", "")  # "360" из "360p"
-                        VideoResolution.objects.update_or_create(
-                            video=video,
-                            resolution=res_short,
-                            defaults={"file": posix_join(hls_build_prefix, pl.name)},
-                        )
-
-                # обновим сам Video
-                video.hls_master_playlist = posix_join(hls_build_prefix, master_name)
-                video.hls_decrypt_key = hls_key_s3_key
-                video.save()
+
+            # 5) переключаем Video на сборку и запоминаем её в кэше
+            finalize_build(video, hls_build_prefix, hls_key_s3_key, resolutions, audio_playlists)
+            cache.store(fingerprint, hls_build_prefix, hls_key_s3_key, key_public_url, resolutions, audio_playlists)
 
     except Exception as e:
         logging.exception("create_master_playlist failed for video %s: %s", video_id, e)
@@ -399,3 +1143,126 @@ def create_master_playlist(self, base_url: str, video_id: int):
         VideoStatusService.completed(video)
     except Exception as e:
         logging.warning("VideoStatusService.completed failed: %s", e)
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=60)
+def rebuild_audio_tracks(self, base_url: str, video_id: int):
+    """
+    Инкрементальная пересборка: кодируем только аудиодорожки без HLS в текущей сборке
+    (новые или с заменённым файлом) тем же ключом и с тем же сдвигом PTS,
+    затем переписываем аудиогруппу мастера. Видеосегменты не трогаем.
+    Если сборка для этого не годится — полная пересборка через create_master_playlist.
+    """
+    try:
+        video = Video.objects.select_related("file").get(id=video_id)
+    except ObjectDoesNotExist:
+        logging.error("Video %s not found", video_id)
+        return
+
+    if not video.audio_rebuild_available:
+        logging.info("Video %s has no incremental-ready build, running full rebuild", video_id)
+        create_master_playlist.delay(base_url=base_url, video_id=video_id)
+        return
+
+    upload_client = S3UploadClient()
+    master_key = str(video.hls_master_playlist)
+    hls_build_prefix = str(Path(master_key).parent)
+
+    master_text = upload_client.read(master_key).decode("utf-8")
+    if master_audio_group(master_text) is None:
+        # варианты собраны без аудиогруппы: добавить её можно только полной пересборкой
+        logging.info("Video %s master has no audio group, running full rebuild", video_id)
+        create_master_playlist.delay(base_url=base_url, video_id=video_id)
+        return
+
+    VideoStatusService.processing(video)
+
+    try:
+        source = MediaProbeService(upload_client).ensure(video.file)
+        tracks = list(
+            video.audio_tracks.select_related("file", "language").order_by("-is_default", "id")
+        )
+        stale = [t for t in tracks if not str(t.hls_file).startswith(hls_build_prefix + "/")]
+
+        with tempfile.TemporaryDirectory() as td:
+            tmpdir = Path(td)
+            out_dir = tmpdir / "out"
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            _, hls_keyinfo_path = write_hls_keyinfo(
+                out_dir,
+                upload_client.read(str(video.hls_decrypt_key)),
+                secrets.token_hex(16),
+                hls_key_url(base_url, video.id, Path(hls_build_prefix).name),
+            )
+
+            for track in stale:
+                if track.file is None and not source.has_audio:
+                    logging.warning("AudioTrack %s has no file and source has no audio, skipping", track.id)
+                    continue
+                # встроенная дорожка (без файла) кодируется из исходника видео
+                src_key = str(track.file.file) if track.file else str(source.file)
+                # уникальное имя: не перезаписываем сегменты, которые сейчас кто-то смотрит
+                name = f"language-{track.language.code}-{secrets.token_hex(4)}"
+                local_src = fetch_source(upload_client, src_key, tmpdir, f"{name}{Path(src_key).suffix}")
+                with SegmentPublisherService(
+                    out_dir,
+                    hls_build_prefix,
+                    pattern=f"{name}_*.ts",
+                    client=upload_client,
+                ):
+                    duration = source.duration or 0.0
+                    run_cmd(ffmpeg_build_audio_command(local_src, duration, out_dir, name, hls_keyinfo_path))
+                track.hls_file = upload_playlist(upload_client, out_dir, hls_build_prefix, name)
+                track.save(update_fields=["hls_file"])
+
+            audios = [
+                {
+                    "name": f"language-{t.language.code}",
+                    "language_code": t.language.code,
+                    "is_default": t.is_default,
+                    "uri": Path(str(t.hls_file)).name,
+                }
+                for t in tracks
+                if str(t.hls_file).startswith(hls_build_prefix + "/")
+            ]
+            # мастер кэшируется как immutable: пишем новый объект и переключаем на него Video
+            master_path = out_dir / f"{Path(MASTER_PLAYLIST_NAME).stem}-{secrets.token_hex(4)}.m3u8"
+            master_path.write_text(rewrite_master_audio(master_text, audios), encoding="utf-8")
+            upload_client.upload_file(posix_join(hls_build_prefix, master_path.name), master_path)
+            video.hls_master_playlist = posix_join(hls_build_prefix, master_path.name)
+            video.save(update_fields=["hls_master_playlist"])
+        # сборка изменена на месте и больше не соответствует своему отпечатку
+        TranscodeCacheService.invalidate(hls_build_prefix)
+    except subprocess.CalledProcessError as e:
+        logging.error("ffmpeg failed: %s\nstdout:\n%s\nstderr:\n%s", e, e.stdout, e.stderr)
+        VideoStatusService.failed(video)
+        raise self.retry(exc=e) from e
+    except Exception as e:
+        logging.exception("rebuild_audio_tracks failed for video %s: %s", video_id, e)
+        VideoStatusService.failed(video)
+        raise self.retry(exc=e) from e
+
+    logging.info("Video %s: re-encoded %s audio track(s), video segments kept", video_id, len(stale))
+    VideoStatusService.completed(video)
+
+
+@shared_task
+def delete_video_hls(video_id: str):
+    """
+    После удаления Video: все его сборки и их ключи. HLSBuild удаляются вместе с видео,
+    поэтому sweep_hls_builds эти объекты уже не найдёт.
+    """
+    HLSBuildService.purge([hls_video_prefix(video_id), hls_keys_prefix(video_id)])
+    logging.info("Deleted HLS files of video %s", video_id)
+
+
+@shared_task
+def sweep_hls_builds():
+    """
+    Периодически (CELERY_BEAT_SCHEDULE): удаляем сборки, отработавшие grace-период после замены,
+    и сборки, которые так и не вышли в LIVE.
+    """
+    deleted = HLSBuildService.sweep()
+    if deleted:
+        logging.info("Swept %s HLS build(s)", deleted)
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+
+class MemoryS3Client:
+    """
+    Objects of S3UploadClient calls kept in a dict, enough for build bookkeeping without a bucket
+    """
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.downloads: list[str] = []
+
+    def get_presigned_url(self, key: str, expires: int = 3600) -> str:
+        return f"https://bucket.s3.amazonaws.com/{key}?X-Amz-Expires={expires}"
+
+    def download_to(self, key: str, path: Path, progress=None) -> None:
+        self.downloads.append(key)
+        Path(path).write_bytes(self.objects[key])
+
+    def upload_file(self, key: str, path: Path) -> None:
+        self.objects[key] = Path(path).read_bytes()
+
+    def read(self, key: str) -> bytes:
+        return self.objects[key]
+
+    def list_sizes(self, prefix: str) -> dict[str, int]:
+        return {key: len(body) for key, body in self.objects.items() if key.startswith(prefix)}
+
+    def delete(self, key: str) -> None:
+        self.objects.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self.objects if key.startswith(prefix)]:
+            del self.objects[key]
+
+
+@pytest.fixture
+def s3() -> MemoryS3Client:
+    return MemoryS3Client()
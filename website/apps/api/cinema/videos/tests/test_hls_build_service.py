@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from utils.posix import posix_join
+
+from apps.api.cinema.videos.models import HLSBuild, TranscodeCacheEntry, Video
+from apps.api.cinema.videos.services import hls_build_service
+from apps.api.cinema.videos.services.hls_build_service import HLSBuildService
+from apps.api.cinema.videos.tasks import hls_keys_prefix, hls_video_prefix, resume_or_start_build
+
+IV = "0" * 32
+
+
+@pytest.mark.django_db
+class TestResume:
+    def test_resumes_building_build_of_same_inputs(self, make_video):
+        video = make_video()
+        build = HLSBuildService.start(video, "hls/videos/v/1", "hls/keys/v/1.key", "abc", IV)
+
+        assert HLSBuildService.resume(video, "abc") == build
+        assert HLSBuildService.resume(video, "other") is None
+
+    def test_skips_published_and_stale_builds(self, make_video, settings):
+        video = make_video()
+        HLSBuildService.start(video, "hls/videos/v/1", "hls/keys/v/1.key", "abc", IV)
+        HLSBuildService.publish(video, "hls/videos/v/1", "hls/keys/v/1.key")
+        stale = HLSBuildService.start(video, "hls/videos/v/2", "hls/keys/v/2.key", "abc", IV)
+        HLSBuild.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now() - timedelta(hours=settings.HLS_BUILD_STALE_HOURS + 1),
+        )
+
+        assert HLSBuildService.resume(video, "abc") is None
+
+    def test_skips_builds_without_iv(self, make_video):
+        video = make_video()
+        HLSBuildService.start(video, "hls/videos/v/1", "hls/keys/v/1.key", "abc")
+
+        assert HLSBuildService.resume(video, "abc") is None
+
+
+@pytest.mark.django_db
+class TestResumeOrStartBuild:
+    def test_retry_keeps_prefix_key_and_iv(self, make_video, s3):
+        video = make_video()
+        first = resume_or_start_build(
+            s3, video, "abc", "https://api.example.com", "hls/videos/v/first", "hls/keys/v/first.key",
+        )
+        # Segments of the failed attempt
+        s3.objects["hls/videos/v/first/360p_000.ts"] = b"segment"
+
+        retry = resume_or_start_build(
+            s3, video, "abc", "https://api.example.com", "hls/videos/v/retry", "hls/keys/v/retry.key",
+        )
+
+        assert retry == first
+        prefix, key_s3_key, key_url, key_bytes, iv_hex = retry
+        assert prefix == "hls/videos/v/first"
+        assert key_url.endswith("?build=first")
+        assert s3.read(key_s3_key) == key_bytes
+        assert list(s3.list_sizes("hls/videos/v/retry/")) == []
+        assert video.builds.count() == 1
+
+    def test_new_inputs_start_new_build(self, make_video, s3):
+        video = make_video()
+        first = resume_or_start_build(
+            s3, video, "abc", "https://api.example.com", "hls/videos/v/first", "hls/keys/v/first.key",
+        )
+        changed = resume_or_start_build(
+            s3, video, "def", "https://api.example.com", "hls/videos/v/second", "hls/keys/v/second.key",
+        )
+
+        assert changed[0] == "hls/videos/v/second"
+        assert changed[3] != first[3]
+        assert video.builds.count() == 2
+
+
+@pytest.mark.django_db
+class TestDeletedVideo:
+    @pytest.fixture
+    def videos(self, make_video, s3, monkeypatch):
+        # Without hls_master_playlist: django-cleanup would delete it from the real bucket
+        monkeypatch.setattr(hls_build_service, "S3UploadClient", lambda: s3)
+        videos = [make_video(), make_video()]
+        for video in videos:
+            live = posix_join(hls_video_prefix(video.pk), "live")
+            s3.objects[posix_join(live, "master.m3u8")] = b"#EXTM3U"
+            s3.objects[posix_join(live, "360p_000.ts")] = b"segment"
+            # A build that never went live
+            s3.objects[posix_join(hls_video_prefix(video.pk), "failed", "360p_000.ts")] = b"segment"
+            s3.objects[posix_join(hls_keys_prefix(video.pk), "live.key")] = b"key"
+            s3.objects[posix_join(hls_keys_prefix(video.pk), "failed.key")] = b"key"
+            TranscodeCacheEntry.objects.create(
+                fingerprint=str(video.pk),
+                hls_build_prefix=live,
+                hls_decrypt_key=posix_join(hls_keys_prefix(video.pk), "live.key"),
+                key_uri="https://api.example.com/key",
+            )
+        return videos
+
+    def remaining(self, s3, video) -> list[str]:
+        return [
+            key for key in s3.objects
+            if key.startswith((hls_video_prefix(video.pk), hls_keys_prefix(video.pk)))
+        ]
+
+    def test_delete_removes_builds_and_keys(self, videos, s3, django_capture_on_commit_callbacks):
+        deleted, kept = videos
+
+        with django_capture_on_commit_callbacks(execute=True):
+            deleted.delete()
+
+        assert self.remaining(s3, deleted) == []
+        assert len(self.remaining(s3, kept)) == 5
+        assert list(TranscodeCacheEntry.objects.values_list("fingerprint", flat=True)) == [str(kept.pk)]
+
+    def test_queryset_delete(self, videos, s3, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            Video.objects.all().delete()
+
+        assert all(self.remaining(s3, video) == [] for video in videos)
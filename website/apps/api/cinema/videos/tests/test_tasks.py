@@ -0,0 +1,79 @@
+from dataclasses import asdict
+from pathlib import Path
+
+from apps.api.cinema.videos import tasks
+from apps.api.cinema.videos.tasks import (
+    RENDITIONS,
+    fetch_source,
+    ffmpeg_build_rendition_command,
+    plan_chunks,
+    transcode_rendition,
+)
+
+
+class TestFetchSource:
+    def test_downloads_by_default(self, s3, tmp_path, settings):
+        settings.HLS_SOURCE_STREAMING = False
+        s3.objects["uploads/source.mp4"] = b"video"
+
+        src = fetch_source(s3, "uploads/source.mp4", tmp_path)
+
+        assert src == tmp_path / "source.mp4"
+        assert s3.downloads == ["uploads/source.mp4"]
+
+    def test_stream_reads_presigned_url(self, s3, tmp_path, settings):
+        settings.HLS_SOURCE_STREAMING = False
+
+        src = fetch_source(s3, "uploads/source.mp4", tmp_path, stream=True)
+
+        assert src.startswith("https://")
+        assert s3.downloads == []
+        assert list(tmp_path.iterdir()) == []
+
+
+def test_chunk_seeks_before_url_input(tmp_path):
+    chunk = plan_chunks(60, 12)[2]
+
+    args = ffmpeg_build_rendition_command(
+        "https://bucket.s3.amazonaws.com/uploads/source.mp4",
+        tmp_path,
+        RENDITIONS[0],
+        tmp_path / "hls.keyinfo",
+        chunk,
+    )
+
+    # Input options: ffmpeg requests only the chunk's byte ranges
+    assert args[args.index("-ss") + 1] == str(chunk["start"])
+    assert args.index("-ss") < args.index("-t") < args.index("-i")
+    assert "-reconnect" in args
+
+
+def test_chunk_task_does_not_download_source(s3, monkeypatch, settings):
+    settings.HLS_SOURCE_STREAMING = False
+    commands = []
+
+    def fake_ffmpeg(args: list[str]) -> None:
+        # What ffmpeg leaves in out_dir: one segment and its playlist
+        commands.append(args)
+        playlist = Path(args[-1])
+        (playlist.parent / f"{playlist.stem}_000.ts").write_bytes(b"segment")
+        playlist.write_text(f"#EXTM3U\n#EXTINF:6.0,\n{playlist.stem}_000.ts\n", encoding="utf-8")
+
+    monkeypatch.setattr(tasks, "S3UploadClient", lambda: s3)
+    monkeypatch.setattr(tasks, "run_cmd", fake_ffmpeg)
+    context = {
+        "video_id": "v",
+        "src_key": "uploads/source.mp4",
+        "renditions": {RENDITIONS[0].name: asdict(RENDITIONS[0])},
+        "hls_build_prefix": "hls/videos/v/build",
+        "key_hex": "00" * 16,
+        "iv_hex": "00" * 16,
+        "key_public_url": "https://api.example.com/key",
+    }
+
+    for chunk in plan_chunks(60, 12):
+        transcode_rendition.run(context, RENDITIONS[0].name, chunk)
+
+    assert s3.downloads == []
+    assert all(args[args.index("-i") + 1].startswith("https://") for args in commands)
+    assert len(s3.list_sizes("hls/videos/v/build/")) == len(commands) == 5
@@ -1,8 +1,12 @@
+from urllib.parse import urlencode
+
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from apps.api.cinema.videos.models import Video
+from apps.api.cinema.videos.services.hls_key_service import HLSKeyService
 from apps.api.languages.v1.serializers import LanguageSerializer
 from apps.api.uploads.models import LazyLoadFile
 from apps.core.models import Language
@@ -14,6 +18,12 @@ class VideoLazyFileSerializer(serializers.ModelSerializer):
         fields = [
             "id",
             "name",
+            "duration",
+            "bit_rate",
+            "width",
+            "height",
+            "video_codec",
+            "audio_codec",
         ]
         read_only_fields = [
             "name",
@@ -77,9 +87,47 @@ class VideoCreateSerializer(VideoSerializer):
     file = None
 
 
+class VideoExportSerializer(serializers.ModelSerializer):
+    duration = serializers.FloatField(source="file.duration", read_only=True)
+
+    class Meta:
+        model = Video
+        fields = [
+            "id",
+            "role",
+            "status",
+            "visibility",
+            "duration",
+        ]
+
+
 class PlaybackSerializer(serializers.ModelSerializer):
+    # Accepted by the key endpoint instead of a permission check, see HLSKeyService
+    hls_key_token = serializers.SerializerMethodField()
+
     class Meta:
         model = Video
         fields = [
             "hls_master_playlist",
+            "hls_key_token",
         ]
+
+    def get_hls_key_token(self, obj: Video) -> str | None:
+        if settings.HLS_KEY_DELIVERY != "token" or not obj.encrypted:
+            return None
+        return HLSKeyService.issue_token(obj, self.context["request"].user)
+
+
+class PlaybackSessionSerializer(serializers.Serializer):
+    # CDN URL, readable with the CloudFront cookies set by the endpoint
+    hls_master_playlist = serializers.CharField()
+    expires = serializers.DateTimeField()
+    # For players that can't send cookies, appended to every playlist, segment and key URL
+    cloudfront_query = serializers.SerializerMethodField()
+    hls_key_token = serializers.CharField(allow_null=True)
+
+    def get_cloudfront_query(self, obj) -> str:
+        return urlencode({
+            name.removeprefix("CloudFront-"): value
+            for name, value in obj.cookies.items()
+        })
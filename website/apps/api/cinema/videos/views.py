@@ -1,11 +1,15 @@
 from functools import partial
 
+from django.conf import settings
 from django.db import transaction
+from django.http import HttpResponse
 from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
 from django.utils.translation import gettext_lazy as _
 from library.aws.client.s3 import S3StorageClient
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import RetrieveAPIView, get_object_or_404
 from rest_framework.permissions import DjangoModelPermissions, IsAdminUser
 from rest_framework.response import Response
@@ -17,10 +21,14 @@ from apps.api.cinema.audio_tracks.v1.serializers import AudioTrackSerializer
 from apps.api.cinema.videos.filters import VideoFilterSet
 from apps.api.cinema.videos.models import Video
 from apps.api.cinema.videos.permissions import WatchPermission
+from apps.api.cinema.videos.services.hls_build_service import HLSBuildService
+from apps.api.cinema.videos.services.hls_key_service import HLSKeyService
+from apps.api.cinema.videos.services.playback_session_service import PlaybackSessionService
 from apps.api.cinema.videos.services.video_status_service import VideoStatusService
-from apps.api.cinema.videos.tasks import create_master_playlist
+from apps.api.cinema.videos.tasks import create_master_playlist, rebuild_audio_tracks
 from apps.api.cinema.videos.v1.serializers import (
     PlaybackSerializer,
+    PlaybackSessionSerializer,
     VideoCreateSerializer,
     VideoSerializer,
 )
@@ -31,7 +39,11 @@ class VideoViewSet(
     VersioningAPIViewMixin,
     ModelViewSet,
 ):
-    queryset = Video.objects.all()
+    queryset = (
+        Video.objects
+        .select_related("file", "original_language", "as_movie", "as_trailer", "as_episode")
+        .prefetch_related("resolutions", "languages")
+    )
     filterset_class = VideoFilterSet
     permission_classes = [IsAdminUser, DjangoModelPermissions]
     version_map = {
@@ -39,6 +51,13 @@ class VideoViewSet(
             "serializer_class": VideoSerializer
         }
     }
+    cursor_ordering = ("id",)
+    query_budget = {
+        "list": 6,
+        "retrieve": 5,
+        "playback": 5,
+        "playback_session": 5,
+    }
 
     def get_version_map(self):
         if self.action in ("create",):
@@ -84,7 +103,58 @@ class VideoViewSet(
         }
     )
     def playback(self, request, *args, **kwargs):
-        return self.retrieve(request, *args, **kwargs)
+        response = self.retrieve(request, *args, **kwargs)
+        self.set_key_token_cookie(response, kwargs["pk"], response.data.get("hls_key_token"))
+        return response
+
+    @action(
+        detail=True,
+        methods=["POST"],
+        url_path="playback-session",
+        permission_classes=[WatchPermission],
+        version_map={
+            "v1": {
+                "serializer_class": PlaybackSessionSerializer,
+            }
+        }
+    )
+    def playback_session(self, request, *args, **kwargs):
+        obj = self.get_object()
+
+        if not obj.completed or not obj.hls_master_playlist:
+            raise ValidationError({"video": _("Video is not ready for playback")})
+
+        session = PlaybackSessionService().start(obj, request.user)
+        response = Response(self.get_serializer(session).data)
+        for name, value in session.cookies.items():
+            # Sent by the player straight to the CDN for every file of the build
+            response.set_cookie(
+                name,
+                value,
+                expires=session.expires,
+                path=session.path,
+                domain=settings.AWS_CLOUDFRONT_COOKIE_DOMAIN,
+                secure=True,
+                httponly=True,
+                samesite="Lax",
+            )
+        self.set_key_token_cookie(response, kwargs["pk"], session.hls_key_token)
+        return response
+
+    @staticmethod
+    def set_key_token_cookie(response: Response, pk, token: str | None) -> None:
+        if not token:
+            return
+        # Browsers send it with key requests, other players append ?token= themselves
+        response.set_cookie(
+            HLSKeyService.TOKEN_COOKIE,
+            token,
+            max_age=settings.HLS_KEY_TOKEN_MAX_AGE,
+            path=reverse("api:cinema:videos:hls-key", kwargs={"pk": pk}),
+            secure=not settings.DEBUG,
+            httponly=True,
+            samesite="Lax",
+        )
 
     @action(
         detail=True,
@@ -110,6 +180,37 @@ class VideoViewSet(
         )
         return Response({"status": _("Master playlist rebuild scheduled")})
 
+    @action(
+        detail=True,
+        methods=["POST"],
+        permission_classes=[IsAdminUser],
+        url_path="rebuild-audio",
+        version_map=None,
+    )
+    def rebuild_audio(self, request, *args, **kwargs):
+        """
+        Encodes only new or replaced audio tracks into the current build and rewrites the master playlist
+        """
+        obj = self.get_object()
+
+        self.check_object_permissions(request, obj)
+
+        if obj.processing:
+            raise ValidationError({"video": _("Video is processing now")})
+
+        if not obj.audio_rebuild_available:
+            raise ValidationError({"video": _("Video has no build to add audio tracks to, full rebuild is required")})
+
+        if not obj.has_default_audio:
+            raise ValidationError({"audio_tracks": _("No default audio track found")})
+
+        base_url = request.build_absolute_uri("/")
+        rebuild_audio_tracks.delay(
+            base_url=base_url,
+            video_id=obj.id,
+        )
+        return Response({"status": _("Audio tracks rebuild scheduled")})
+
     @action(
         detail=True,
         methods=["GET"],
@@ -134,14 +235,48 @@ class HLSKeyAPIView(RetrieveAPIView):
     serializer_class = VideoSerializer
     permission_classes = [WatchPermission]
 
+    def perform_authentication(self, request):
+        # Lazy: a valid key token makes authentication unnecessary
+        pass
+
     def retrieve(self, request, *args, **kwargs):
+        # Playlists carry ?build=<build_id>: a retired build still gets its own key during the grace period
+        build_id = request.query_params.get("build")
+
+        if settings.HLS_KEY_DELIVERY == "token":
+            token = request.query_params.get("token") or request.COOKIES.get(HLSKeyService.TOKEN_COOKIE)
+            # The token was issued after WatchPermission, no need to check it again
+            if HLSKeyService.verify_token(token, kwargs["pk"]):
+                key_bytes = HLSKeyService.cached(kwargs["pk"], build_id)
+                if key_bytes is None:
+                    video = get_object_or_404(Video, pk=kwargs["pk"])
+                    key_bytes = HLSKeyService().load(video.pk, build_id, self.decrypt_key(video, build_id))
+                return self.key_response(key_bytes)
+
         video = self.get_object()
-        if not video.encrypted:
-            raise ValidationError({"hls_decrypt_key": _("This video is not encrypted")})
+        key = self.decrypt_key(video, build_id)
 
-        key = str(video.hls_decrypt_key)
+        if settings.HLS_KEY_DELIVERY == "token":
+            return self.key_response(HLSKeyService().load(video.pk, build_id, key))
 
         storage_client = S3StorageClient()
         url = storage_client.storage.url(key, expire=30)
 
-        return redirect(url, permanent=True)
+        # Temporary: the URL expires
+        return redirect(url)
+
+    @staticmethod
+    def decrypt_key(video: Video, build_id: str | None) -> str:
+        if not video.encrypted:
+            raise ValidationError({"hls_decrypt_key": _("This video is not encrypted")})
+
+        key = HLSBuildService.decrypt_key(video, build_id)
+        if key is None:
+            raise NotFound({"build": _("Build not found")})
+        return key
+
+    @staticmethod
+    def key_response(key_bytes: bytes) -> HttpResponse:
+        response = HttpResponse(key_bytes, content_type="application/octet-stream")
+        patch_cache_control(response, private=True, max_age=settings.HLS_KEY_TOKEN_MAX_AGE)
+        return response
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_user', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usersubscription',
+            index=models.Index(fields=['subscribed_at', 'id'], name='custom_user_subscri_4c38fb_idx'),
+        ),
+    ]
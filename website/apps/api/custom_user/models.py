@@ -137,6 +137,10 @@ class UserSubscription(PaymentProviderModel):
 
     class Meta(PaymentProviderModel.Meta):
         ordering = ["-subscribed_at"]
+        indexes = [
+            # Cursor pagination, see UserSubscriptionViewSet.cursor_ordering
+            models.Index(fields=["subscribed_at", "id"]),
+        ]
 
     def __str__(self):
         return _("%(user)s subscribed to %(subscription)s") % {
@@ -1,13 +1,17 @@
 from django.contrib.auth import get_user_model
 from django.db.models import Q, QuerySet
 
+from apps.core.services.search_service import SearchService
+
 User = get_user_model()
 
 
-class UserSearchService:
-    @staticmethod
-    def search(query: str, queryset: QuerySet[User]) -> QuerySet[User]:
-        queryset = queryset or User.objects.all()
+class UserSearchService(SearchService):
+    model = User
+
+    @classmethod
+    def search(cls, query: str, queryset: QuerySet[User] = None) -> QuerySet[User]:
+        queryset = cls.get_queryset(queryset)
 
         if not query:
             return queryset.none()
@@ -5,6 +5,7 @@ from django.contrib.auth.models import AbstractUser
 from django.db import IntegrityError, transaction
 from django.utils import timezone
 
+from apps.api.cinema.entitlements.services.entitlement_service import EntitlementService
 from apps.api.custom_user.exceptions import AlreadySubscribedError, SubscriptionDisabledError
 from apps.api.custom_user.models import UserSubscription
 from apps.api.payments.orders.models import Order
@@ -37,6 +38,7 @@ class UserSubscriptionService:
                 order=order,
             )
             user.groups.add(subscription.group)
+            EntitlementService.refresh_user(user)
 
         except IntegrityError as e:
             # User already subscribed, use extend method
@@ -54,6 +56,7 @@ class UserSubscriptionService:
         timestamp = int(expire_date.astimezone(UTC).timestamp())
         user_subscription.expires = expire_date
         user_subscription.save()
+        EntitlementService.refresh_user(user_subscription.user)
 
         if merchant_update:
             if user_subscription.payment_provider == PaymentProviderType.STRIPE:
@@ -69,6 +72,7 @@ class UserSubscriptionService:
         user_subscription.canceled = True
         user_subscription.canceled_at = timezone.now()
         user_subscription.save()
+        EntitlementService.refresh_user(user_subscription.user)
 
         if merchant_update:
             if user_subscription.payment_provider == PaymentProviderType.STRIPE:
@@ -83,3 +87,4 @@ class UserSubscriptionService:
             cls.cancel(user_subscription, merchant_update)
         user_subscription.save()
         user_subscription.user.groups.remove(user_subscription.subscription.group)
+        EntitlementService.refresh_user(user_subscription.user)
@@ -37,13 +37,18 @@ class UserViewSet(VersioningAPIViewMixin, ModelViewSet):
             "serializer_class": UserSerializer
         }
     }
+    query_budget = {
+        "my_orders": 4,
+        "my_transactions": 4,
+        "my_subscriptions": 4,
+    }
 
     def get_queryset(self):
         if self.action == "my_orders":
-            return self.request.user.orders.all()
+            return self.request.user.orders.with_totals()
 
         if self.action == "my_subscriptions":
-            return self.request.user.subscriptions.all()
+            return self.request.user.subscriptions.select_related("subscription")
 
         if self.action == "my_transactions":
             return self.request.user.transactions.all()
@@ -154,6 +159,7 @@ class UserSubscriptionViewSet(
             "serializer_class": UserSubscriptionSerializer
         }
     }
+    cursor_ordering = ("-subscribed_at", "-id")
 
     def get_version_map(self):
         if self.request.user.is_staff and self.action in ("create", "retrieve", "list"):
@@ -169,7 +175,7 @@ class UserSubscriptionViewSet(
             self.action in ("retrieve", "cancel") and
             not self.request.user.is_staff
         ):
-            return self.request.user.subscriptions.all()
+            return self.request.user.subscriptions.select_related("subscription")
         return super().get_queryset()
 
     def get_permissions(self):
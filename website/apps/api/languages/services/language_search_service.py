@@ -1,12 +1,14 @@
 from django.db.models import Q, QuerySet
 
 from apps.core.models import Language
+from apps.core.services.search_service import SearchService
 
 
-class LanguageSearchService:
-    @staticmethod
-    def search(value: str, queryset: QuerySet[Language] = None) -> QuerySet[Language]:
-        queryset = queryset or Language.objects.all()
-        return queryset.filter(
+class LanguageSearchService(SearchService):
+    model = Language
+
+    @classmethod
+    def search(cls, value: str, queryset: QuerySet[Language] = None) -> QuerySet[Language]:
+        return cls.get_queryset(queryset).filter(
             Q(code__icontains=value) | Q(name__icontains=value)
         )
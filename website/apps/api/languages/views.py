@@ -2,11 +2,11 @@ from rest_framework.viewsets import ModelViewSet
 
 from apps.api.languages.filters import LanguageFilterSet
 from apps.api.languages.v1.serializers import LanguageSerializer
-from apps.api.mixins import VersioningAPIViewMixin
+from apps.api.mixins import CachedResponseMixin, VersioningAPIViewMixin
 from apps.core.models import Language
 
 
-class LanguageViewSet(VersioningAPIViewMixin, ModelViewSet):
+class LanguageViewSet(VersioningAPIViewMixin, CachedResponseMixin, ModelViewSet):
     queryset = Language.objects.all()
     filterset_class = LanguageFilterSet
     lookup_field = "code"
@@ -16,3 +16,4 @@ class LanguageViewSet(VersioningAPIViewMixin, ModelViewSet):
             "serializer_class": LanguageSerializer,
         }
     }
+    cache_tags = ("language",)
@@ -1,4 +1,11 @@
+import functools
+
 from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from apps.core.services.response_cache_service import ResponseCacheService
 
 
 class VersioningAPIViewMixin:
@@ -29,3 +36,85 @@ class VersioningAPIViewMixin:
         version = self.request.version
         return self.get_versioned_serializer_class(version)
 
+
+
+class CachedResponseMixin:
+    """
+    Caches list and retrieve responses for non-staff users and answers conditional
+    requests, see ResponseCacheService. Responses are invalidated by tags.
+
+    Only handlers the view has are wrapped, a view without ListModelMixin gets no
+    list route. Other actions call cached_response themselves.
+
+    cache_tags = ('title', 'genre')
+    """
+    cache_tags = ()
+    # Requests with these params get user specific responses
+    cache_bypass_params = ()
+    cached_actions = ("list", "retrieve")
+    # Shared caches keep a response per version and per authenticated client
+    cache_vary_headers = ("Accept", "Authorization")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for action in cls.cached_actions:
+            handler = getattr(cls, action, None)
+            if handler is None or getattr(handler, "cached", False):
+                continue
+            setattr(cls, action, cls.cached_handler(handler))
+
+    @staticmethod
+    def cached_handler(handler):
+        @functools.wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            return self.cached_response(functools.partial(handler, self), request, *args, **kwargs)
+
+        wrapper.cached = True
+        return wrapper
+
+    def is_cacheable(self, request) -> bool:
+        return (
+            request.method == "GET" and
+            not getattr(request.user, "is_staff", False) and
+            request.accepted_renderer.format == "json" and
+            not any(param in request.GET for param in self.cache_bypass_params)
+        )
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        if not self.is_cacheable(request):
+            response = handler(request, *args, **kwargs)
+            patch_vary_headers(response, self.cache_vary_headers)
+            return response
+
+        key = ResponseCacheService.key(
+            request,
+            self.cache_tags,
+            self.__class__.__name__,
+            self.action,
+            request.version,
+        )
+        entry = ResponseCacheService.get(key)
+        if entry is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                patch_vary_headers(response, self.cache_vary_headers)
+                return response
+            # Rendered here instead of in finalize_response to cache the bytes
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = self.get_renderer_context()
+            response.render()
+            entry = ResponseCacheService.set(key, response)
+
+        etag = quote_etag(entry["etag"])
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(entry["last_modified"])
+        # Before the conditional check, 304 responses keep Vary
+        patch_vary_headers(response, self.cache_vary_headers)
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=entry["last_modified"],
+            response=response,
+        )
@@ -0,0 +1,66 @@
+from rest_framework import pagination
+from rest_framework.request import Request
+
+
+class CursorPagination(pagination.CursorPagination):
+    """
+    Orders by the cursor_ordering of the view.
+    The first field should be unique or nearly unique and indexed.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+
+class PageNumberOrCursorPagination(pagination.PageNumberPagination):
+    """
+    Page numbers by default, ?pagination=cursor switches views that declare
+    cursor_ordering to keyset pagination: no COUNT(*) and no OFFSET scans on deep pages.
+    Cursor pages follow cursor_ordering, ordering of filters (e.g. search rank) is ignored.
+
+    cursor_ordering = ('-created_at', '-id')
+    """
+    pagination_query_param = "pagination"
+    cursor_pagination_class = CursorPagination
+
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request: Request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request, view):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if not getattr(view, "cursor_ordering", None):
+            return parameters
+        return [
+            *parameters,
+            {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'cursor' for cursor pagination, page is ignored then.",
+                "schema": {
+                    "type": "string",
+                    "enum": ["cursor"],
+                },
+            },
+            *self.cursor_pagination_class().get_schema_operation_parameters(view),
+        ]
+
+    def use_cursor(self, request: Request, view) -> bool:
+        return (
+            request.query_params.get(self.pagination_query_param) == "cursor" and
+            bool(getattr(view, "cursor_ordering", None))
+        )
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:34
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+import apps.core.operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='orderitem',
+            name='orderitem_gin_search_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_gin_search_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='subscription_gin_search_idx',
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, serialize=False),
+        ),
+        migrations.AddField(
+            model_name='subscription',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, serialize=False),
+        ),
+        apps.core.operations.SearchVectorTrigger(
+            model_name='orderitem',
+        ),
+        apps.core.operations.SearchVectorTrigger(
+            model_name='product',
+        ),
+        apps.core.operations.SearchVectorTrigger(
+            model_name='subscription',
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='orderitem_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='product_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subscription',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='subscription_search_vector_idx'),
+        ),
+    ]
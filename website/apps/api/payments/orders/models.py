@@ -4,7 +4,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models import Q, Sum
+from django.db.models import Count, Q, Sum
 from django.utils.translation import gettext_lazy as _
 from djmoney.money import Money
 
@@ -12,6 +12,14 @@ from apps.api.payments.products.models import Product, ProductTypeModel
 from apps.core.models import DescriptiveModel, PayableModel, TimestampModel
 
 
+class OrderQuerySet(models.QuerySet):
+    def with_totals(self):
+        return self.annotate(
+            items_total=Sum("items__final_price"),
+            items_count=Count("items"),
+        )
+
+
 class Order(TimestampModel):
     class Status(models.TextChoices):
         CANCELED = 'canceled'
@@ -31,6 +39,14 @@ class Order(TimestampModel):
     status = models.CharField(choices=Status.choices, default=Status.PENDING, max_length=20)
     paid = models.BooleanField(default=False)
 
+    objects = OrderQuerySet.as_manager()
+
+    class Meta(TimestampModel.Meta):
+        indexes = [
+            # Cursor pagination, see OrderViewSet.cursor_ordering
+            models.Index(fields=["created_at", "id"]),
+        ]
+
     def __str__(self):
         return _("Order ID: %(id)s") % { "id": self.id}
 
@@ -41,7 +57,11 @@ class Order(TimestampModel):
         Current functionality doesn't support multi currencies.
         Rewrite the logic if needed
         """
-        total: Decimal | None = self.items.aggregate(total=Sum("final_price")).get("total", None)
+        if hasattr(self, "items_total"):
+            # Annotated, see OrderQuerySet.with_totals
+            total: Decimal | None = self.items_total
+        else:
+            total = self.items.aggregate(total=Sum("final_price")).get("total", None)
 
         if total is None:
             return None
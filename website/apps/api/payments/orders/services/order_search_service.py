@@ -1,12 +1,15 @@
 from django.db.models import QuerySet
 
 from apps.api.payments.orders.models import Order
+from apps.core.services.search_service import SearchService
 
 
-class OrderSearchService:
-    @staticmethod
-    def search(query: str, queryset: QuerySet[Order]) -> QuerySet[Order]:
-        queryset = queryset or Order.objects.all()
+class OrderSearchService(SearchService):
+    model = Order
+
+    @classmethod
+    def search(cls, query: str, queryset: QuerySet[Order] = None) -> QuerySet[Order]:
+        queryset = cls.get_queryset(queryset)
         if not query:
             return queryset.none()
         return queryset.filter(id__iexact=query)
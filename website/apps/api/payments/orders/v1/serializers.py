@@ -149,8 +149,13 @@ class OrderSerializer(serializers.ModelSerializer):
         source="total_price.currency.code",
         read_only=True, allow_null=True,
     )
-    total_items = serializers.IntegerField(source="items.count", read_only=True)
+    total_items = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
         fields = "__all__"
+
+    def get_total_items(self, obj: Order) -> int:
+        # Annotated by order views, see OrderQuerySet.with_totals
+        count = getattr(obj, "items_count", None)
+        return obj.items.count() if count is None else count
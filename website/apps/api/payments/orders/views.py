@@ -56,7 +56,7 @@ class CheckoutAPIView(VersioningAPIViewMixin, GenericAPIView):
 
 
 class OrderViewSet(VersioningAPIViewMixin, ModelViewSet):
-    queryset = Order.objects.all()
+    queryset = Order.objects.with_totals()
     permission_classes = [DjangoModelPermissions, IsAdminUser]
     filterset_class = OrderFilterSet
     version_map = {
@@ -64,6 +64,12 @@ class OrderViewSet(VersioningAPIViewMixin, ModelViewSet):
             "serializer_class": OrderSerializer
         }
     }
+    cursor_ordering = ("-created_at", "-id")
+    query_budget = {
+        "list": 4,
+        "retrieve": 4,
+        "order_items": 5,
+    }
 
     def get_permissions(self):
         if self.action == "retrieve":
@@ -75,7 +81,7 @@ class OrderViewSet(VersioningAPIViewMixin, ModelViewSet):
 
         if not self.request.user.is_staff:
             if self.action == "retrieve":
-                return self.request.user.orders.all()
+                return self.request.user.orders.with_totals()
 
             if self.action == "order_items":
                 return OrderItem.objects.filter(order=pk, order__user=self.request.user)
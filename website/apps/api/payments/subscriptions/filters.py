@@ -12,6 +12,7 @@ class SubscriptionFilterSet(filters.FilterSet):
         exclude = [
             "name",
             "description",
+            "search_vector",
         ]
 
     def filter_search(self, queryset, _, value):
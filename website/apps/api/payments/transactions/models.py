@@ -30,7 +30,10 @@ class Transaction(TimestampModel, PaymentProviderModel):
     paid = models.BooleanField(default=False)
 
     class Meta(TimestampModel.Meta, PaymentProviderModel.Meta):
-        pass
+        indexes = [
+            # Cursor pagination, see TransactionViewSet.cursor_ordering
+            models.Index(fields=["created_at", "id"]),
+        ]
 
     def __str__(self):
         return _("Transaction ID: %(id)s") % { "id": self.id }
@@ -1,12 +1,15 @@
 from django.db.models import Q, QuerySet
 
 from apps.api.payments.transactions.models import Transaction
+from apps.core.services.search_service import SearchService
 
 
-class TransactionSearchService:
-    @staticmethod
-    def search(query: str, queryset: QuerySet[Transaction]) -> QuerySet[Transaction]:
-        queryset = queryset or Transaction.objects.all()
+class TransactionSearchService(SearchService):
+    model = Transaction
+
+    @classmethod
+    def search(cls, query: str, queryset: QuerySet[Transaction] = None) -> QuerySet[Transaction]:
+        queryset = cls.get_queryset(queryset)
 
         if not query:
             return queryset.none()
@@ -17,6 +17,7 @@ class TransactionViewSet(VersioningAPIViewMixin, ModelViewSet):
             "serializer_class": TransactionStaffSerializer
         }
     }
+    cursor_ordering = ("-created_at", "-id")
 
     def get_version_map(self):
         if self.action == "retrieve":
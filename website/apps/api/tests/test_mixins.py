@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from django.urls import resolve, reverse
+from django.utils.cache import has_vary_header
+
+from apps.api.cinema.episodes.views import EpisodeViewSet
+from apps.api.cinema.search.views import CatalogueSearchViewSet
+from apps.api.cinema.seasons.views import SeasonViewSet
+from apps.api.cinema.titles.views import TitleViewSet
+
+
+class TestCachedHandlers:
+    @pytest.mark.parametrize("viewset", [SeasonViewSet, EpisodeViewSet])
+    def test_views_without_list_get_no_list_handler(self, viewset):
+        assert not hasattr(viewset, "list")
+        assert viewset.retrieve.cached
+
+    @pytest.mark.parametrize("basename", ["seasons", "episodes"])
+    def test_collection_routes_create_only(self, basename):
+        match = resolve(reverse(f"api:cinema:{basename}:{basename}-list"))
+
+        assert match.func.actions == {"post": "create"}
+
+    def test_own_list_is_wrapped_once(self):
+        assert CatalogueSearchViewSet.list.cached
+        assert "cached" not in CatalogueSearchViewSet.list.__wrapped__.__dict__
+
+    def test_inherited_handlers_are_wrapped(self):
+        assert TitleViewSet.list.cached
+        assert TitleViewSet.retrieve.cached
+
+
+@pytest.mark.django_db
+class TestCachedResponse:
+    def test_collection_get_without_list_is_not_allowed(self, api_client):
+        response = api_client.get(reverse("api:cinema:seasons:seasons-list"))
+
+        assert response.status_code == 405
+        assert response["Allow"] == "POST, OPTIONS"
+
+    def test_cached_response_varies(self, api_client, make_title):
+        title = make_title("Title")
+        url = reverse("api:cinema:titles:titles-detail", kwargs={"pk": title.pk})
+
+        miss = api_client.get(url)
+        hit = api_client.get(url)
+
+        for response in (miss, hit):
+            assert response.status_code == 200
+            assert has_vary_header(response, "Accept")
+            assert has_vary_header(response, "Authorization")
+        assert json.loads(hit.content) == json.loads(miss.content)
+
+    def test_not_modified_varies(self, api_client, make_title):
+        title = make_title("Title")
+        url = reverse("api:cinema:titles:titles-detail", kwargs={"pk": title.pk})
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert has_vary_header(response, "Accept")
+        assert has_vary_header(response, "Authorization")
+
+    def test_uncached_response_varies(self, staff_client, make_title):
+        title = make_title("Title")
+
+        response = staff_client.get(reverse("api:cinema:titles:titles-detail", kwargs={"pk": title.pk}))
+
+        assert response.status_code == 200
+        assert "ETag" not in response
+        assert has_vary_header(response, "Authorization")
+
+    def test_errors_are_not_cached(self, api_client, make_title):
+        make_title("Title")
+        url = reverse("api:cinema:titles:titles-detail", kwargs={"pk": 0})
+
+        response = api_client.get(url)
+
+        assert response.status_code == 404
+        assert "ETag" not in response
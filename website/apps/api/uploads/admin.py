@@ -5,4 +5,16 @@ from .models import LazyLoadFile
 
 @admin.register(LazyLoadFile)
 class LazyLoadFileAdmin(admin.ModelAdmin):
-    readonly_fields = ["id"]
+    list_display = ["name", "status", "file_extension", "duration", "width", "height", "video_codec", "audio_codec"]
+    list_filter = ["status", "file_extension", "video_codec", "audio_codec", "height"]
+    readonly_fields = [
+        "id",
+        "duration",
+        "bit_rate",
+        "width",
+        "height",
+        "video_codec",
+        "audio_codec",
+        "streams",
+        "probed_at",
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-17 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0002_lazyloadfile_media_metadata'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lazyloadfile',
+            index=models.Index(fields=['started_at', 'id'], name='uploads_laz_started_e51928_idx'),
+        ),
+    ]
@@ -51,9 +51,22 @@ class LazyLoadFile(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     finished_at = models.DateTimeField(null=True, editable=False)
     upload_id = models.CharField(max_length=255, editable=False)
+    # Media metadata, filled once by MediaProbeService after the upload is completed
+    duration = models.FloatField(null=True, editable=False)
+    bit_rate = models.PositiveBigIntegerField(null=True, editable=False)
+    width = models.PositiveIntegerField(null=True, editable=False)
+    height = models.PositiveIntegerField(null=True, editable=False)
+    video_codec = models.CharField(max_length=32, blank=True, editable=False)
+    audio_codec = models.CharField(max_length=32, blank=True, editable=False)
+    streams = models.JSONField(default=list, editable=False)
+    probed_at = models.DateTimeField(null=True, editable=False)
 
     class Meta:
         ordering = ["-finished_at"]
+        indexes = [
+            # Cursor pagination, see UploadViewSet.cursor_ordering
+            models.Index(fields=["started_at", "id"]),
+        ]
         constraints = [
             models.UniqueConstraint(
                 Lower("name"),
@@ -103,3 +116,11 @@ class LazyLoadFile(models.Model):
     @property
     def is_video(self) -> bool:
         return self.file_type == self.FileType.VIDEO
+
+    @property
+    def probed(self) -> bool:
+        return self.probed_at is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return bool(self.audio_codec)
@@ -1,33 +1,24 @@
-from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import QuerySet
 
 from apps.api.uploads.models import AUDIO_EXTENSIONS, VIDEO_EXTENSIONS, LazyLoadFile
+from apps.core.services.search_service import SearchService
 
 
-class LazyFileSearchService:
-    @staticmethod
-    def search(value: str, queryset: QuerySet[LazyLoadFile] = None) -> QuerySet[LazyLoadFile]:
-        queryset = queryset or LazyLoadFile.objects.all()
-        return (
-            queryset
-            .annotate(similarity=TrigramSimilarity("name", value))
-            .order_by("-similarity")
-        )
+class LazyFileSearchService(SearchService):
+    model = LazyLoadFile
+
+    @classmethod
+    def search(cls, value: str, queryset: QuerySet[LazyLoadFile] = None) -> QuerySet[LazyLoadFile]:
+        return cls.trigram_search("name", value, queryset)
 
-    @staticmethod
-    def audios(queryset: QuerySet[LazyLoadFile] = None) -> QuerySet[LazyLoadFile]:
-        queryset = queryset or LazyLoadFile.objects.all()
-        print()
-        return queryset.filter(
+    @classmethod
+    def audios(cls, queryset: QuerySet[LazyLoadFile] = None) -> QuerySet[LazyLoadFile]:
+        return cls.get_queryset(queryset).filter(
             file_extension__in=AUDIO_EXTENSIONS,
         )
 
-    @staticmethod
-    def videos(queryset: QuerySet[LazyLoadFile] = None) -> QuerySet[LazyLoadFile]:
-        queryset = queryset or LazyLoadFile.objects.all()
-        return queryset.filter(
+    @classmethod
+    def videos(cls, queryset: QuerySet[LazyLoadFile] = None) -> QuerySet[LazyLoadFile]:
+        return cls.get_queryset(queryset).filter(
             file_extension__in=VIDEO_EXTENSIONS,
         )
-
-
-
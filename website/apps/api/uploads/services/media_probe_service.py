@@ -0,0 +1,110 @@
+import json
+import logging
+import subprocess
+from pathlib import Path
+
+from django.utils import timezone
+from library.aws.client.s3 import S3UploadClient
+
+from apps.api.uploads.models import LazyLoadFile
+
+# Enough for ffprobe to read the container headers
+PROBE_URL_EXPIRES = 60 * 10
+
+
+class MediaProbeService:
+    """
+    Probes an uploaded file once and stores its media metadata on LazyLoadFile,
+    so transcoding, serializers and admin don't need to download or reprobe the source.
+    """
+
+    def __init__(self, client: S3UploadClient = None):
+        self.client = client
+
+    @staticmethod
+    def ffprobe(src: Path | str) -> dict:
+        args = [
+            "ffprobe", "-v", "error",
+            "-print_format", "json",
+            "-show_format",
+            "-show_streams",
+            str(src),
+        ]
+        logging.debug("Run: %s", " ".join(args))
+        cp = subprocess.run(args, check=True, capture_output=True, text=True)
+        return json.loads(cp.stdout or "{}")
+
+    @staticmethod
+    def summarize(data: dict) -> dict:
+        """
+        Reduces raw ffprobe output to the fields stored on LazyLoadFile.
+        """
+        fmt = data.get("format", {})
+        streams = [
+            {
+                "index": st.get("index"),
+                "codec_type": st.get("codec_type"),
+                "codec_name": st.get("codec_name"),
+                "profile": st.get("profile"),
+                "width": st.get("width"),
+                "height": st.get("height"),
+                "bit_rate": _to_int(st.get("bit_rate")),
+                "channels": st.get("channels"),
+                "sample_rate": _to_int(st.get("sample_rate")),
+                "language": st.get("tags", {}).get("language"),
+            }
+            for st in data.get("streams", [])
+            if st.get("codec_type") in ("video", "audio")
+        ]
+        video = next((st for st in streams if st["codec_type"] == "video"), {})
+        audio = next((st for st in streams if st["codec_type"] == "audio"), {})
+        return {
+            "duration": _to_float(fmt.get("duration")),
+            "bit_rate": _to_int(fmt.get("bit_rate")),
+            "width": video.get("width"),
+            "height": video.get("height"),
+            "video_codec": video.get("codec_name") or "",
+            "audio_codec": audio.get("codec_name") or "",
+            "streams": streams,
+        }
+
+    def probe(self, file: LazyLoadFile) -> LazyLoadFile:
+        url = self.client.get_presigned_url(str(file.file), expires=PROBE_URL_EXPIRES)
+        summary = self.summarize(self.ffprobe(url))
+        for field, value in summary.items():
+            setattr(file, field, value)
+        file.probed_at = timezone.now()
+        file.save(update_fields=[*summary, "probed_at"])
+        return file
+
+    def ensure(self, file: LazyLoadFile) -> LazyLoadFile:
+        """
+        Probes the file only if it has no stored metadata yet (e.g. uploaded before probing existed).
+        """
+        if not file.probed:
+            return self.probe(file)
+        return file
+
+    @property
+    def client(self) -> S3UploadClient:
+        return self._client
+
+    @client.setter
+    def client(self, client: S3UploadClient = None):
+        if client is None:
+            client = S3UploadClient()
+        self._client = client
+
+
+def _to_int(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 
 from django.db import transaction
@@ -5,6 +6,7 @@ from django.utils import timezone
 from library.aws.client.s3 import PresignedMultipart, S3UploadClient
 
 from apps.api.uploads.models import LazyLoadFile, get_lazy_file_path
+from apps.api.uploads.tasks import probe_lazy_file
 
 
 class UploadFileService:
@@ -59,6 +61,11 @@ class UploadFileService:
             upload_id=file.upload_id,
             etags=etags,
         )
+        if file.file_type != LazyLoadFile.FileType.INVALID:
+            transaction.on_commit(partial(
+                probe_lazy_file.delay,
+                file_id=str(file.id),
+            ))
 
     @property
     def client(self) -> S3UploadClient:
@@ -1,6 +1,26 @@
+import logging
+
 from celery import shared_task
+from django.core.exceptions import ObjectDoesNotExist
+
+from apps.api.uploads.models import LazyLoadFile
+from apps.api.uploads.services.media_probe_service import MediaProbeService
 
 
 @shared_task
 def clean_up_uncompleted_files():
     pass
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def probe_lazy_file(self, file_id: str):
+    try:
+        file = LazyLoadFile.objects.get(id=file_id)
+    except ObjectDoesNotExist:
+        logging.error("LazyLoadFile %s does not exist in database", file_id)
+        return
+
+    try:
+        MediaProbeService().probe(file)
+    except Exception as exc:
+        raise self.retry(exc=exc) from exc
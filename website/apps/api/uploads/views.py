@@ -37,6 +37,8 @@ class UploadViewSet(
             "serializer_class": LazyLoadFileSerializer,
         }
     }
+    # finished_at is null while loading
+    cursor_ordering = ("-started_at", "-id")
     @action(
         detail=True,
         methods=["POST"],
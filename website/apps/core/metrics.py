@@ -0,0 +1,26 @@
+from prometheus_client import Counter, Histogram
+
+QUERY_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, float("inf"))
+
+view_queries = Histogram(
+    "django_view_queries",
+    "Database queries per request",
+    ["view", "action"],
+    buckets=QUERY_BUCKETS,
+)
+view_duplicate_queries = Histogram(
+    "django_view_duplicate_queries",
+    "Queries per request repeating an earlier one with other parameters",
+    ["view", "action"],
+    buckets=QUERY_BUCKETS,
+)
+view_query_seconds = Histogram(
+    "django_view_query_seconds",
+    "Time per request spent in database queries",
+    ["view", "action"],
+)
+view_query_budget_exceeded = Counter(
+    "django_view_query_budget_exceeded",
+    "Requests running more queries than the view action budget",
+    ["view", "action"],
+)
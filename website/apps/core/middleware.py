@@ -0,0 +1,56 @@
+import logging
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from apps.core import metrics
+from apps.core.services.query_budget_service import QueryBudgetService
+
+
+class QueryMetricsMiddleware:
+    """
+    Records queries, duplicated queries and query time of every view action
+    and checks them against the query_budget the view declares.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with QueryBudgetService.capture() as stats:
+            response = self.get_response(request)
+
+        view = getattr(request, "_query_metrics_view", None)
+        if view is None:
+            # Not resolved, 404 or handled by a middleware
+            return response
+        view, action = view
+        labels = {"view": getattr(view, "__name__", str(view)), "action": action}
+
+        metrics.view_queries.labels(**labels).observe(stats.count)
+        metrics.view_duplicate_queries.labels(**labels).observe(stats.duplicates)
+        metrics.view_query_seconds.labels(**labels).observe(stats.seconds)
+
+        if not QueryBudgetService.check(view, action, stats):
+            metrics.view_query_budget_exceeded.labels(**labels).inc()
+            logging.warning(
+                "%s.%s ran %s queries, budget %s",
+                labels["view"], action, stats.count, QueryBudgetService.budget_for(view, action),
+            )
+
+        most_duplicated = stats.most_duplicated()
+        if most_duplicated and most_duplicated[1] >= settings.QUERY_DUPLICATE_WARNING:
+            logging.warning(
+                "%s.%s repeated a query %s times, possible N+1: %s",
+                labels["view"], action, most_duplicated[1], most_duplicated[0],
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        method = request.method.lower()
+        # Viewsets map methods to actions, other class based views to handlers
+        view = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None) or view_func
+        actions = getattr(view_func, "actions", None) or {}
+        request._query_metrics_view = (view, actions.get(method, method))
@@ -1,9 +1,9 @@
-from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import UniqueConstraint
-from django.db.models.functions import Lower
+from django.db.models.functions import Lower, Upper
 from django.utils.translation import gettext_lazy as _
 
 
@@ -26,6 +26,8 @@ class UniqueNamedModel(models.Model):
 class DescriptiveModel(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
+    # Weighted name (A) and description (B), maintained by the SearchVectorTrigger migration operation
+    search_vector = SearchVectorField(null=True, editable=False, serialize=False)
 
     class Meta:
         abstract = True
@@ -36,10 +38,14 @@ class DescriptiveModel(models.Model):
                 name='%(class)s_trgm_search_idx',
             ),
             GinIndex(
-                SearchVector("name", config="simple"),
-                SearchVector("description", config="simple"),
-                name="%(class)s_gin_search_idx",
-            )
+                fields=['search_vector'],
+                name="%(class)s_search_vector_idx",
+            ),
+            # name__icontains compiles to UPPER(name) LIKE UPPER(...), see DescriptiveSearchService
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name="%(class)s_trgm_upper_idx",
+            ),
         ]
 
     def __str__(self):
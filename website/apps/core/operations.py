@@ -0,0 +1,63 @@
+from django.db import router
+from django.db.migrations.operations.base import Operation
+
+SEARCH_VECTOR_FUNCTION = "descriptive_search_vector_update"
+
+
+class SearchVectorTrigger(Operation):
+    """
+    Keeps DescriptiveModel.search_vector of the model in sync on INSERT / UPDATE,
+    including queryset updates and raw SQL, and fills it for the existing rows.
+    The vector matches SearchVector("name", weight="A") + SearchVector("description", weight="B")
+    with the simple config.
+    """
+    reversible = True
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql" or not router.allow_migrate(
+            schema_editor.connection.alias, app_label
+        ):
+            return
+        table = schema_editor.quote_name(to_state.apps.get_model(app_label, self.model_name)._meta.db_table)
+        schema_editor.execute(f"""
+            CREATE OR REPLACE FUNCTION {SEARCH_VECTOR_FUNCTION}() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('simple', COALESCE(NEW.name, '')), 'A') ||
+                    setweight(to_tsvector('simple', COALESCE(NEW.description, '')), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        schema_editor.execute(f"""
+            CREATE TRIGGER {self.trigger_name}
+            BEFORE INSERT OR UPDATE OF name, description, search_vector ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {SEARCH_VECTOR_FUNCTION}()
+        """)
+        schema_editor.execute(f"UPDATE {table} SET name = name")
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql" or not router.allow_migrate(
+            schema_editor.connection.alias, app_label
+        ):
+            return
+        table = schema_editor.quote_name(from_state.apps.get_model(app_label, self.model_name)._meta.db_table)
+        # The function is shared by every DescriptiveModel table, it stays
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {self.trigger_name} ON {table}")
+
+    @property
+    def trigger_name(self) -> str:
+        return f"{self.model_name.lower()}_search_vector_trigger"
+
+    def describe(self):
+        return f"Creates search vector trigger on {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"search_vector_trigger_{self.model_name.lower()}"
@@ -0,0 +1,50 @@
+"""
+Fails tests whose requests exceed the query_budget of a view action.
+Enabled in pytest.ini, requires QueryMetricsMiddleware.
+"""
+from contextlib import contextmanager
+
+import pytest
+
+from apps.core.services.query_budget_service import QueryBudgetService, query_budget_exceeded
+
+
+@pytest.fixture(autouse=True)
+def _query_budget_guard():
+    """
+    Yields the overruns seen so far, a test expecting one asserts and clears them.
+    """
+    exceeded = []
+
+    def receiver(sender, action, budget, stats, **kwargs):
+        exceeded.append(
+            f"{sender.__name__}.{action}: {stats.count} queries, budget {budget}, "
+            f"{stats.duplicates} duplicated"
+        )
+
+    query_budget_exceeded.connect(receiver)
+    yield exceeded
+    query_budget_exceeded.disconnect(receiver)
+    if exceeded:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(exceeded))
+
+
+@pytest.fixture
+def query_budget():
+    """
+    with query_budget(3):
+        client.get(...)
+    """
+
+    @contextmanager
+    def assert_budget(budget: int):
+        with QueryBudgetService.capture() as stats:
+            yield stats
+        if stats.count > budget:
+            most_duplicated = stats.most_duplicated()
+            pytest.fail(
+                f"{stats.count} queries, budget {budget}"
+                + (f", repeated {most_duplicated[1]} times: {most_duplicated[0]}" if most_duplicated else "")
+            )
+
+    return assert_budget
@@ -1,51 +1,108 @@
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
-from django.db.models import Case, FloatField, Q, QuerySet, Value, When
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
 from django.db.models.functions import Coalesce
 
 from apps.core.models import DescriptiveModel
 
+FUZZY_WEIGHT = 0.35
+PREFIX_BOOST = 0.4
+EXACT_BOOST = 1.0
+TRIGRAM_THRESHOLD = 0.25
+
 
 class DescriptiveSearchService:
-    @staticmethod
+    """
+    Matches and ranks against the stored DescriptiveModel.search_vector,
+    so vectors aren't rebuilt per row and @@ can use its GIN index.
+
+    Candidates are the UNION of full text matches (search_vector_idx), names similar through %
+    (trgm_search_idx) and names containing the query (trgm_upper_idx), only they are ranked.
+    % applies pg_trgm.similarity_threshold (0.3), so a trigram_threshold below it can't widen results.
+    """
+
+    @classmethod
     def search(
+        cls,
         query: str,
         queryset: QuerySet[DescriptiveModel],
-        fuzzy_weight: float = 0.35,
-        prefix_boost: float = 0.4,
-        exact_boost: float = 1.0,
-        trigram_threshold: float = 0.25,
+        fuzzy_weight: float = FUZZY_WEIGHT,
+        prefix_boost: float = PREFIX_BOOST,
+        exact_boost: float = EXACT_BOOST,
+        trigram_threshold: float = TRIGRAM_THRESHOLD,
     ) -> QuerySet[DescriptiveModel]:
 
         if not query:
             return queryset.none()
 
         search_query = SearchQuery(query, search_type="websearch", config="simple")
-        search_vector = (
-            SearchVector("name", weight="A", config="simple") +
-            SearchVector("description", weight="B", config="simple")
+
+        return cls._ranked(
+            # F(), a field name would be wrapped in SearchVector and parsed again
+            queryset.annotate(rank=SearchRank(F("search_vector"), search_query)),
+            query,
+            "name",
+            Q(search_vector=search_query),
+            fuzzy_weight,
+            prefix_boost,
+            exact_boost,
+            trigram_threshold,
         )
 
-        qs = (
-            queryset
-            .annotate(
-                rank=SearchRank(search_vector, search_query),
-                similarity=TrigramSimilarity("name", query),
-                exact_match=Case(
-                    When(name__iexact=query, then=Value(exact_boost)),
-                    default=Value(0.0),
-                    output_field=FloatField(),
-                ),
-                prefix_match=Case(
-                    When(name__istartswith=query, then=Value(prefix_boost)),
-                    default=Value(0.0),
-                    output_field=FloatField(),
-                ),
-            )
-            .filter(
-                Q(rank__gt=0.0) |
-                Q(similarity__gt=trigram_threshold) |
-                Q(name__icontains=query)
-            )
+    @classmethod
+    def name_search(
+        cls,
+        query: str,
+        queryset: QuerySet,
+        field: str = "name",
+        fuzzy_weight: float = FUZZY_WEIGHT,
+        prefix_boost: float = PREFIX_BOOST,
+        exact_boost: float = EXACT_BOOST,
+        trigram_threshold: float = TRIGRAM_THRESHOLD,
+    ) -> QuerySet:
+        """
+        The same scoring for models without search_vector (crew, genres), by one name field.
+        There is no full text rank, so scores compare with search() ones less the rank.
+        """
+
+        if not query:
+            return queryset.none()
+
+        return cls._ranked(
+            queryset.annotate(rank=Value(0.0, output_field=FloatField())),
+            query,
+            field,
+            Q(),
+            fuzzy_weight,
+            prefix_boost,
+            exact_boost,
+            trigram_threshold,
+        )
+
+    @classmethod
+    def scored(
+        cls,
+        queryset: QuerySet,
+        query: str,
+        field: str = "name",
+        fuzzy_weight: float = FUZZY_WEIGHT,
+        prefix_boost: float = PREFIX_BOOST,
+        exact_boost: float = EXACT_BOOST,
+    ) -> QuerySet:
+        """
+        Scores rows matched elsewhere (crew by CrewSearchService) like search() does,
+        the queryset must be annotated with rank and similarity already.
+        """
+        qs = queryset.annotate(
+            exact_match=Case(
+                When(**{f"{field}__iexact": query}, then=Value(exact_boost)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+            prefix_match=Case(
+                When(**{f"{field}__istartswith": query}, then=Value(prefix_boost)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
         )
 
         qs = qs.annotate(
@@ -61,3 +118,35 @@ class DescriptiveSearchService:
         ).order_by("-score", "-rank")
 
         return qs
+
+    @classmethod
+    def _ranked(
+        cls,
+        queryset: QuerySet,
+        query: str,
+        field: str,
+        match: Q,
+        fuzzy_weight: float,
+        prefix_boost: float,
+        exact_boost: float,
+        trigram_threshold: float,
+    ) -> QuerySet:
+        contains = Q(**{f"{field}__icontains": query})
+        candidates = [
+            Q(**{f"{field}__trigram_similar": query}),
+            contains,
+            *([match] if match else []),
+        ]
+        rows = queryset.model._default_manager
+        qs = (
+            queryset
+            # UNION instead of OR, so every side is read from its index
+            .filter(pk__in=(
+                rows.filter(candidates[0]).values("pk")
+                .union(*(rows.filter(candidate).values("pk") for candidate in candidates[1:]))
+            ))
+            .annotate(similarity=TrigramSimilarity(field, query))
+            .filter(match | Q(similarity__gt=trigram_threshold) | contains)
+        )
+
+        return cls.scored(qs, query, field, fuzzy_weight, prefix_boost, exact_boost)
@@ -0,0 +1,89 @@
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+
+from django.db import connections
+from django.dispatch import Signal
+
+# Sent with view, action, budget and stats when a view action runs more queries than declared
+query_budget_exceeded = Signal()
+
+# IN (%s, %s, ...) lists differ by size only
+IN_LIST_RE = re.compile(r"\((?:%s, )+%s\)")
+NUMBER_RE = re.compile(r"\b\d+\b")
+STRING_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    @property
+    def duplicates(self) -> int:
+        """
+        Queries repeating an earlier one with other parameters, N+1 shows up here.
+        """
+        return sum(count - 1 for count in self.fingerprints.values())
+
+    def most_duplicated(self) -> tuple[str, int] | None:
+        fingerprint, count = next(iter(self.fingerprints.most_common(1)), (None, 0))
+        return (fingerprint, count) if count > 1 else None
+
+
+class QueryBudgetService:
+    """
+    Views declare a budget per action:
+
+    query_budget = {
+        'list': 4,
+        'retrieve': 3,
+    }
+    """
+
+    @staticmethod
+    @contextmanager
+    def capture() -> Iterator[QueryStats]:
+        stats = QueryStats()
+
+        def wrapper(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                stats.count += 1
+                stats.seconds += time.perf_counter() - start
+                stats.fingerprints[QueryBudgetService.fingerprint(sql)] += 1
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(wrapper))
+            yield stats
+
+    @staticmethod
+    def fingerprint(sql: str) -> str:
+        sql = STRING_RE.sub("?", sql)
+        sql = NUMBER_RE.sub("?", sql)
+        return IN_LIST_RE.sub("(...)", sql)
+
+    @staticmethod
+    def budget_for(view, action: str | None) -> int | None:
+        budget = getattr(view, "query_budget", None) or {}
+        return budget.get(action)
+
+    @staticmethod
+    def check(view, action: str | None, stats: QueryStats) -> bool:
+        budget = QueryBudgetService.budget_for(view, action)
+        if budget is None or stats.count <= budget:
+            return True
+        query_budget_exceeded.send(
+            sender=view,
+            action=action,
+            budget=budget,
+            stats=stats,
+        )
+        return False
@@ -0,0 +1,82 @@
+import hashlib
+import time
+import uuid
+from collections.abc import Iterable
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+
+CACHE_PREFIX = "response"
+
+
+class ResponseCacheService:
+    """
+    Rendered responses cached under the versions of their tags. Invalidating a tag
+    bumps its version, so every response depending on it misses on the next request
+    and the stale entries expire on their own.
+    """
+
+    @classmethod
+    def key(cls, request: HttpRequest, tags: Iterable[str], *parts) -> str:
+        version_keys = [cls._version_key(tag) for tag in sorted(tags)]
+        versions = cache.get_many(version_keys)
+        request_hash = hashlib.md5(
+            "|".join([
+                *map(str, parts),
+                # Pagination links are absolute
+                request.scheme,
+                request.get_host(),
+                request.path,
+                cls.normalize_query(request),
+            ]).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        return ":".join([
+            CACHE_PREFIX,
+            *(str(versions.get(version_key, 0)) for version_key in version_keys),
+            request_hash,
+        ])
+
+    @staticmethod
+    def normalize_query(request: HttpRequest) -> str:
+        """
+        ?b=2&a=1&a=0&c= and ?a=0&a=1&b=2 are the same request.
+        """
+        return urlencode(sorted(
+            (name, value)
+            for name, values in request.GET.lists()
+            for value in values
+            if value != ""
+        ))
+
+    @staticmethod
+    def get(key: str) -> dict | None:
+        return cache.get(key)
+
+    @staticmethod
+    def set(key: str, response: HttpResponse) -> dict:
+        entry = {
+            "content": response.content,
+            "content_type": response["Content-Type"],
+            "etag": hashlib.md5(response.content, usedforsecurity=False).hexdigest(),
+            "last_modified": int(time.time()),
+        }
+        cache.set(key, entry, settings.RESPONSE_CACHE_SECONDS)
+        return entry
+
+    @classmethod
+    def invalidate(cls, *tags: str) -> None:
+        for tag in tags:
+            cls._bump(cls._version_key(tag))
+
+    @staticmethod
+    def _version_key(tag: str) -> str:
+        return ":".join([CACHE_PREFIX, "version", tag])
+
+    @staticmethod
+    def _bump(version_key: str) -> None:
+        # After commit, so a concurrent request can't cache the old state under the new version
+        transaction.on_commit(lambda: cache.set(version_key, uuid.uuid4().hex, None))
@@ -0,0 +1,35 @@
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import models
+from django.db.models import QuerySet
+
+
+class SearchService:
+    """
+    Base of the search services. Methods narrow the given queryset, or the whole table
+    when there is none, and return a new lazy one, so they chain and compose:
+
+    TitleSearchService.released(TitleSearchService.watchable(user, titles))
+
+    Never test a queryset for truth: `queryset or ...` runs the query, loads every row
+    and replaces an empty result with the whole table.
+
+    model = Title
+    """
+    model: type[models.Model] = None
+
+    @classmethod
+    def get_queryset(cls, queryset: QuerySet = None) -> QuerySet:
+        if queryset is None:
+            return cls.model._default_manager.all()
+        return queryset
+
+    @classmethod
+    def trigram_search(cls, field: str, value: str, queryset: QuerySet = None) -> QuerySet:
+        """
+        Most similar first, nothing is filtered out.
+        """
+        return (
+            cls.get_queryset(queryset)
+            .annotate(similarity=TrigramSimilarity(field, value))
+            .order_by("-similarity")
+        )
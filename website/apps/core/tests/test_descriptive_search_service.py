@@ -0,0 +1,58 @@
+import random
+import string
+
+import pytest
+from django.db import connection
+
+from apps.api.cinema.titles.models import Title
+from apps.core.services.descriptive_search_service import DescriptiveSearchService
+
+
+def names(queryset) -> list[str]:
+    return sorted(title.name for title in queryset)
+
+
+@pytest.mark.django_db
+class TestDescriptiveSearch:
+    @pytest.fixture
+    def titles(self, make_title):
+        for name in ("Alien", "Aliens", "Predator", "The Matrix", "Blade Runner"):
+            make_title(name)
+        make_title("Heat", description="Bank robbers in Los Angeles")
+
+    def test_full_text_matches_description(self, titles):
+        assert names(DescriptiveSearchService.search("robbers", Title.objects.all())) == ["Heat"]
+
+    def test_substring_matches(self, titles):
+        assert names(DescriptiveSearchService.search("lien", Title.objects.all())) == ["Alien", "Aliens"]
+
+    def test_typo_matches_by_similarity(self, titles):
+        assert names(DescriptiveSearchService.search("predatr", Title.objects.all())) == ["Predator"]
+
+    def test_narrows_given_queryset(self, titles):
+        queryset = Title.objects.exclude(name="Aliens")
+
+        assert names(DescriptiveSearchService.search("alien", queryset)) == ["Alien"]
+
+
+@pytest.mark.django_db
+def test_candidates_are_read_from_indexes():
+    rng = random.Random(21)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(500)]
+    Title.objects.bulk_create(
+        Title(name=" ".join(rng.choices(words, k=rng.randint(1, 4))), slug=f"title-{i}")
+        for i in range(2000)
+    )
+    with connection.cursor() as cursor:
+        # Rows inserted in the test transaction sit in the GIN pending lists, which the planner prices high
+        for index in ("title_search_vector_idx", "title_trgm_search_idx", "title_trgm_upper_idx"):
+            cursor.execute("SELECT gin_clean_pending_list(%s::regclass)", [index])
+        cursor.execute(f"ANALYZE {Title._meta.db_table}")
+        # A table this small is cheaper to scan, the planner still scans it when no index can serve a condition
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = DescriptiveSearchService.search(words[0], Title.objects.all()).explain()
+
+    for index in ("title_search_vector_idx", "title_trgm_search_idx", "title_trgm_upper_idx"):
+        assert index in plan
+    assert "Seq Scan" not in plan
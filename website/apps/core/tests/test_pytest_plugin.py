@@ -0,0 +1,100 @@
+import json
+import os
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.urls import reverse
+
+from apps.api.cinema.titles.views import TitleViewSet
+
+BUDGET_TESTS = """
+from apps.core.services.query_budget_service import QueryBudgetService, QueryStats
+
+
+class View:
+    query_budget = {"list": 2}
+
+
+def test_over_budget():
+    QueryBudgetService.check(View, "list", QueryStats(count=3))
+
+
+def test_within_budget():
+    QueryBudgetService.check(View, "list", QueryStats(count=2))
+
+
+def test_without_budget():
+    QueryBudgetService.check(View, "retrieve", QueryStats(count=100))
+"""
+
+
+def run_queries(count: int) -> None:
+    with connection.cursor() as cursor:
+        for _ in range(count):
+            cursor.execute("SELECT 1")
+
+
+@pytest.mark.django_db
+class TestQueryBudgetFixture:
+    def test_within_budget(self, query_budget):
+        with query_budget(2) as stats:
+            run_queries(2)
+
+        assert stats.count == 2
+
+    def test_over_budget_fails(self, query_budget):
+        with pytest.raises(pytest.fail.Exception, match="3 queries, budget 2, repeated 3 times"):
+            with query_budget(2):
+                run_queries(3)
+
+
+@pytest.mark.django_db
+class TestQueryBudgetGuard:
+    def test_view_within_budget(self, api_client, make_title, _query_budget_guard):
+        make_title("Title", genres=2, languages=2)
+
+        response = api_client.get(reverse("api:cinema:titles:titles-list"))
+
+        assert json.loads(response.content)["count"] == 1
+        assert _query_budget_guard == []
+
+    def test_view_over_budget_is_recorded(self, api_client, make_title, monkeypatch, _query_budget_guard):
+        monkeypatch.setattr(TitleViewSet, "query_budget", {"list": 1})
+        make_title("Title", genres=2, languages=2)
+
+        api_client.get(reverse("api:cinema:titles:titles-list"))
+
+        assert len(_query_budget_guard) == 1
+        assert _query_budget_guard[0].startswith("TitleViewSet.list: ")
+        assert _query_budget_guard[0].endswith(", budget 1, 0 duplicated")
+        # Recorded as expected, the guard shouldn't fail this test
+        _query_budget_guard.clear()
+
+
+class TestQueryBudgetPlugin:
+    @pytest.fixture(autouse=True)
+    def budget_tests(self, pytester, monkeypatch):
+        # The subprocess imports the plugin and settings from this tree
+        monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [
+            str(settings.BASE_DIR),
+            os.environ.get("PYTHONPATH"),
+        ])))
+        pytester.makepyfile(test_budget=BUDGET_TESTS)
+
+    def test_overrun_fails_the_run(self, pytester):
+        result = pytester.runpytest_subprocess("-p", "apps.core.pytest_plugin")
+
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        result.assert_outcomes(passed=3, errors=1)
+        result.stdout.fnmatch_lines([
+            "*ERROR at teardown of test_over_budget*",
+            "*Query budget exceeded:",
+            "*View.list: 3 queries, budget 2, 0 duplicated",
+        ])
+
+    def test_run_within_budget_passes(self, pytester):
+        result = pytester.runpytest_subprocess("-p", "apps.core.pytest_plugin", "-k", "not over_budget")
+
+        assert result.ret == pytest.ExitCode.OK
+        result.assert_outcomes(passed=2)
@@ -0,0 +1,141 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.utils import timezone
+
+from apps.api.cinema.crew.models import CrewMember
+from apps.api.cinema.crew.services.crew_search_service import CrewSearchService
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.genres.services.genre_search_service import GenreSearchService
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.titles.services.title_search_service import TitleSearchService
+from apps.api.cinema.videos.services.video_search_service import VideoSearchService
+from apps.api.custom_user.services.user_search_service import UserSearchService
+from apps.api.languages.services.language_search_service import LanguageSearchService
+from apps.api.payments.orders.services.order_search_service import OrderSearchService
+from apps.api.payments.transactions.services.transaction_search_service import TransactionSearchService
+from apps.api.uploads.services.lazy_file_search_service import LazyFileSearchService
+from apps.core.models import Language
+
+SEARCHES = {
+    "crew": (CrewSearchService.search, "keanu"),
+    "genres": (GenreSearchService.search, "drama"),
+    "videos": (VideoSearchService.search, "trailer"),
+    "lazy_files": (LazyFileSearchService.search, "movie.mp4"),
+    "audios": (LazyFileSearchService.audios,),
+    "file_videos": (LazyFileSearchService.videos,),
+    "languages": (LanguageSearchService.search, "en"),
+    "users": (UserSearchService.search, "user@example.com"),
+    "orders": (OrderSearchService.search, "1"),
+    "transactions": (TransactionSearchService.search, "1"),
+    "released": (TitleSearchService.released,),
+    "not_released": (TitleSearchService.not_released,),
+    "suggest": (TitleSearchService.suggest, "ma", 10),
+    "watchable": (TitleSearchService.watchable, AnonymousUser()),
+    "not_watchable": (TitleSearchService.not_watchable, AnonymousUser()),
+}
+
+
+def run_search(name: str, queryset=None):
+    method, *args = SEARCHES[name]
+    return method(*args, queryset)
+
+
+@pytest.mark.django_db
+class TestSearchServiceLaziness:
+    @pytest.mark.parametrize("name", SEARCHES)
+    def test_building_runs_no_queries(self, name, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            run_search(name)
+
+    @pytest.mark.parametrize("name", SEARCHES)
+    def test_given_queryset_is_not_evaluated(self, name, django_assert_num_queries):
+        method = SEARCHES[name][0]
+        queryset = method.__self__.model._default_manager.all()
+
+        with django_assert_num_queries(0):
+            run_search(name, queryset)
+
+        assert queryset._result_cache is None
+
+    @pytest.mark.parametrize("name", SEARCHES)
+    def test_empty_input_stays_empty(self, name, make_title):
+        # Rows that the unfiltered table would return for most searches
+        make_title("Matrix", release_year=2000, release_date=timezone.now().replace(year=2000))
+        Genre.objects.create(name="Drama", slug="drama")
+        model = SEARCHES[name][0].__self__.model
+
+        assert list(run_search(name, model._default_manager.filter(pk__isnull=True))) == []
+        assert list(run_search(name, model._default_manager.none())) == []
+
+    def test_watchable_costs_one_query_for_customers(self, django_assert_num_queries):
+        # Staff are not checked, customers' global grants are read up front to simplify the SQL
+        user = get_user_model().objects.create_user(email="user@example.com", password="user")
+        staff = get_user_model().objects.create_user(email="staff@example.com", password="staff", is_staff=True)
+
+        with django_assert_num_queries(0):
+            TitleSearchService.watchable(staff)
+        with django_assert_num_queries(1):
+            TitleSearchService.watchable(user)
+
+
+@pytest.mark.django_db
+class TestSearchServiceFetchesMatchesOnly:
+    def test_genres(self, django_assert_num_queries):
+        Genre.objects.bulk_create(Genre(name=f"Genre {i:04d}", slug=f"genre-{i}") for i in range(2000))
+        subset = Genre.objects.filter(name__startswith="Genre 01")
+
+        with django_assert_num_queries(1):
+            genres = list(GenreSearchService.search("genre 0123", subset))
+
+        assert len(genres) == 100
+        assert genres[0].name == "Genre 0123"
+
+    def test_released_titles(self, make_title, django_assert_num_queries):
+        released_at = timezone.now().replace(year=2000)
+        Title.objects.bulk_create(
+            Title(name=f"Title {i}", slug=f"title-{i}", type=Title.TitleType.MOVIE)
+            for i in range(2000)
+        )
+        for i in range(10):
+            make_title(f"Released {i}", release_year=2000, release_date=released_at)
+
+        with django_assert_num_queries(1):
+            released = list(TitleSearchService.released(Title.objects.filter(name__startswith="Released")))
+        with django_assert_num_queries(1):
+            count = TitleSearchService.not_released().count()
+
+        assert len(released) == 10
+        assert count == 2000
+
+    def test_suggest(self, django_assert_num_queries):
+        Title.objects.bulk_create(
+            Title(name=f"{prefix} {i}", slug=f"title-{prefix}-{i}", type=Title.TitleType.MOVIE)
+            for prefix in ("Alpha", "Beta")
+            for i in range(1000)
+        )
+
+        with django_assert_num_queries(1):
+            titles = list(TitleSearchService.suggest("beta 99", 20))
+
+        assert [title.name for title in titles] == ["Beta 99", *(f"Beta {i}" for i in range(990, 1000))]
+
+    def test_languages(self, django_assert_num_queries):
+        Language.objects.bulk_create(Language(name=f"Language {i}", code=f"x{i}") for i in range(1000))
+        Language.objects.create(name="Esperanto", code="eo")
+
+        with django_assert_num_queries(1):
+            languages = list(LanguageSearchService.search("esperanto"))
+
+        assert [language.code for language in languages] == ["eo"]
+
+    def test_crew(self, django_assert_num_queries):
+        CrewMember.objects.bulk_create(
+            CrewMember(full_name=f"Member {i}", slug=f"member-{i}") for i in range(2000)
+        )
+        CrewMember.objects.create(full_name="Keanu Reeves", slug="keanu-reeves")
+
+        with django_assert_num_queries(1):
+            crew = list(CrewSearchService.search("keanu reeves"))
+
+        assert [member.full_name for member in crew] == ["Keanu Reeves"]
@@ -0,0 +1,123 @@
+import uuid
+
+import pytest
+from apps.api.cinema.episodes.models import Episode
+from apps.api.cinema.genres.models import Genre
+from apps.api.cinema.seasons.models import Season
+from apps.api.cinema.titles.models import Title
+from apps.api.cinema.videos.models import Video
+from apps.api.uploads.models import LazyLoadFile
+from apps.core.models import Language
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.text import slugify
+from rest_framework.test import APIClient
+
+pytest_plugins = ["pytester"]
+
+
+@pytest.fixture(autouse=True)
+def _locmem_cache(settings):
+    # Response and permission caches without Redis, empty for every test
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    cache.clear()
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.fixture
+def staff_client(db) -> APIClient:
+    # force_authenticate, a login saves the user and queues a Stripe customer update
+    client = APIClient()
+    client.force_authenticate(
+        get_user_model().objects.create_user(
+            email="staff@example.com",
+            password="staff",
+            is_staff=True,
+        )
+    )
+    return client
+
+
+@pytest.fixture
+def make_title(db):
+    """
+    make_title("Alien", genres=2, languages=2, status=Title.Status.DRAFT)
+    """
+
+    def build(
+        name: str,
+        title_type: str = Title.TitleType.MOVIE,
+        genres: int = 0,
+        languages: int = 0,
+        **fields,
+    ) -> Title:
+        title = Title.objects.create(name=name, slug=slugify(name), type=title_type, **fields)
+        title.genres.set([
+            Genre.objects.get_or_create(name=f"Genre {i}", defaults={"slug": f"genre-{i}"})[0]
+            for i in range(genres)
+        ])
+        title.languages.set([
+            Language.objects.get_or_create(code=f"l{i}", defaults={"name": f"Language {i}"})[0]
+            for i in range(languages)
+        ])
+        return title
+
+    return build
+
+
+@pytest.fixture
+def make_show(make_title):
+    """
+    make_show("Lost", seasons=3, episodes=10) numbers seasons and episodes from 1.
+    """
+
+    def build(name: str, seasons: int = 1, episodes: int = 1, **fields) -> Title:
+        title = make_title(name, Title.TitleType.SHOW, **fields)
+        for season_number in range(1, seasons + 1):
+            season = Season.objects.create(
+                title=title,
+                ordering=season_number,
+                name=f"{name} season {season_number}",
+            )
+            Episode.objects.bulk_create(
+                Episode(season=season, ordering=episode_number, name=f"{name} episode {episode_number}")
+                for episode_number in range(1, episodes + 1)
+            )
+        return title
+
+    return build
+
+
+@pytest.fixture
+def make_upload(db):
+    """
+    make_upload("mp3") is a completed upload with a unique name
+    """
+
+    def build(extension: str = "mp4") -> LazyLoadFile:
+        name = uuid.uuid4().hex
+        return LazyLoadFile.objects.create(
+            name=name,
+            file=f"uploads/{name}.{extension}",
+            file_name=f"{name}.{extension}",
+            file_extension=extension,
+            status=LazyLoadFile.Status.COMPLETED,
+        )
+
+    return build
+
+
+@pytest.fixture
+def make_video(make_upload):
+    """
+    make_video(hls_master_playlist="hls/videos/<id>/<build_id>/master.m3u8") with an uploaded source file
+    """
+
+    def build(role: str = Video.Role.MOVIE, **fields) -> Video:
+        return Video.objects.create(file=make_upload(), role=role, **fields)
+
+    return build
@@ -1,9 +1,18 @@
+import base64
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 from botocore.client import BaseClient
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.core.files.storage import storages
+from django.utils.encoding import filepath_to_uri
 from storages.backends.s3 import S3Storage
 
 from .base_storage_client import StorageClientBase
@@ -22,22 +31,174 @@ class S3StorageClient(StorageClientBase[S3Storage, BaseClient]):
     def _client_from_storage(self, storage: S3Storage) -> BaseClient:
         return storage.connection.meta.client
 
-    def delete_prefix(self, prefix: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> None:
+    def iter_objects(self, prefix: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> Iterator[dict]:
         paginator = self.client.get_paginator("list_objects_v2")
         pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
-        to_delete = []
         for page in pages:
-            contents = page.get("Contents", [])
-            for obj in contents:
-                to_delete.append({"Key": obj["Key"]})
-                # пачками по 1000
-                if len(to_delete) == 1000:
-                    self.client.delete_objects(Bucket=bucket, Delete={"Objects": to_delete})
-                    to_delete.clear()
+            yield from page.get("Contents", [])
+
+    def list_sizes(self, prefix: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> dict[str, int]:
+        """Ключ -> размер для всех объектов под префиксом."""
+        return {obj["Key"]: obj["Size"] for obj in self.iter_objects(prefix, bucket)}
+
+    def delete(self, key: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> None:
+        self.client.delete_object(Bucket=bucket, Key=key)
+
+    def delete_prefix(self, prefix: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> None:
+        to_delete = []
+        for obj in self.iter_objects(prefix, bucket):
+            to_delete.append({"Key": obj["Key"]})
+            # пачками по 1000
+            if len(to_delete) == 1000:
+                self.client.delete_objects(Bucket=bucket, Delete={"Objects": to_delete})
+                to_delete.clear()
         if to_delete:
             self.client.delete_objects(Bucket=bucket, Delete={"Objects": to_delete})
 
-    def download_to(self, key: str, local_path: Path, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> None:
+    def get_presigned_url(
+        self,
+        key: str,
+        # Value in seconds
+        expires: int = 3600,
+        bucket: str = settings.AWS_STORAGE_BUCKET_NAME,
+    ) -> str:
+        return self.client.generate_presigned_url(
+            ClientMethod="get_object",
+            Params={
+                "Bucket": bucket,
+                "Key": key,
+            },
+            ExpiresIn=expires,
+        )
+
+    def cdn_url(self, key: str) -> str:
+        """URL объекта на CDN (AWS_S3_CUSTOM_DOMAIN) без подписи."""
+        if not self.storage.custom_domain:
+            raise ImproperlyConfigured("AWS_S3_CUSTOM_DOMAIN is not set")
+        return f"{self.storage.url_protocol}//{self.storage.custom_domain}/{filepath_to_uri(key)}"
+
+    def cloudfront_policy(self, prefix: str, expires_at: datetime) -> dict[str, str]:
+        """
+        Подписанная custom policy CloudFront на все объекты под префиксом.
+        Ключи - имена signed cookies, те же значения подходят как query-параметры
+        Policy / Signature / Key-Pair-Id для подписанных URL.
+        """
+        signer = self.storage.cloudfront_signer
+        if signer is None:
+            raise ImproperlyConfigured("AWS_CLOUDFRONT_KEY_ID and AWS_CLOUDFRONT_KEY are not set")
+        resource = self.cdn_url(prefix.rstrip("/") + "/") + "*"
+        policy = signer.build_policy(resource, expires_at).encode("utf-8")
+        return {
+            "CloudFront-Policy": _cloudfront_b64encode(policy),
+            "CloudFront-Signature": _cloudfront_b64encode(signer.rsa_signer(policy)),
+            "CloudFront-Key-Pair-Id": signer.key_id,
+        }
+
+    def get_etag(self, key: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> str:
+        return self.client.head_object(Bucket=bucket, Key=key)["ETag"].strip('"')
+
+    def copy(self, src_key: str, dst_key: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> None:
+        # Метаданные (ContentType, CacheControl) копируются вместе с объектом
+        self.client.copy_object(
+            Bucket=bucket,
+            Key=dst_key,
+            CopySource={"Bucket": bucket, "Key": src_key},
+        )
+
+    def copy_prefix(
+        self,
+        src_prefix: str,
+        dst_prefix: str,
+        bucket: str = settings.AWS_STORAGE_BUCKET_NAME,
+        max_workers: int = 8,
+    ) -> list[str]:
+        """
+        Серверное копирование всех объектов под префиксом, без скачивания.
+        Возвращаем ключи скопированных объектов.
+        """
+        src_prefix = src_prefix.rstrip("/") + "/"
+        dst_prefix = dst_prefix.rstrip("/") + "/"
+        pairs = [
+            (obj["Key"], dst_prefix + obj["Key"][len(src_prefix):])
+            for obj in self.iter_objects(src_prefix, bucket)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda pair: self.copy(*pair, bucket=bucket), pairs))
+        return [dst for _, dst in pairs]
+
+    def read(self, key: str, bucket: str = settings.AWS_STORAGE_BUCKET_NAME) -> bytes:
+        """Содержимое небольшого объекта целиком (плейлисты, ключи)."""
+        return self.client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+    def download_to(
+        self,
+        key: str,
+        local_path: Path,
+        bucket: str = settings.AWS_STORAGE_BUCKET_NAME,
+        part_size: int = settings.DOWNLOAD_PART_SIZE,
+        max_workers: int = settings.DOWNLOAD_CONCURRENCY,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """
+        Скачиваем объект в local_path.
+        Большие объекты качаются параллельно по byte-range частям: файл заранее
+        выделяется на нужный размер, каждая часть пишется на своё место через pwrite.
+        progress(downloaded, total) вызывается после каждой записанной порции.
+        """
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(local_path, "wb") as f:
-            self.client.download_fileobj(bucket, key, f)
+        head = self.client.head_object(Bucket=bucket, Key=key)
+        total = head["ContentLength"]
+        started = time.monotonic()
+
+        ranges = [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+        downloaded = 0
+        lock = threading.Lock()
+
+        def report(size: int) -> None:
+            nonlocal downloaded
+            with lock:
+                downloaded += size
+                if progress is not None:
+                    progress(downloaded, total)
+
+        fd = os.open(local_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, total)
+
+            def fetch(byte_range: tuple[int, int]) -> None:
+                start, end = byte_range
+                # IfMatch: если объект перезаписали во время скачивания — упадём, а не склеим две версии
+                obj = self.client.get_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Range=f"bytes={start}-{end}",
+                    IfMatch=head["ETag"],
+                )
+                offset = start
+                for chunk in obj["Body"].iter_chunks(1024 ** 2):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    report(len(chunk))
+                if offset != end + 1:
+                    raise OSError(f"Short read for {key} bytes={start}-{end}: got {offset - start} bytes")
+
+            if len(ranges) <= 1 or max_workers <= 1:
+                for byte_range in ranges:
+                    fetch(byte_range)
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+                    # list() пробрасывает первое исключение из частей
+                    list(executor.map(fetch, ranges))
+        finally:
+            os.close(fd)
+
+        elapsed = time.monotonic() - started
+        logging.info(
+            "Downloaded s3://%s/%s (%s bytes, %s parts) in %.1fs",
+            bucket, key, total, len(ranges), elapsed,
+        )
+
+
+def _cloudfront_b64encode(data: bytes) -> str:
+    # Base64 в варианте CloudFront: + = / заменяются на - _ ~
+    return base64.b64encode(data).replace(b"+", b"-").replace(b"=", b"_").replace(b"/", b"~").decode("ascii")
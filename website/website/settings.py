@@ -46,7 +46,7 @@ if DEBUG:
 
 INSTALLED_APPS = [
     "django.contrib.sites",
-    "django.contrib.postgres.search",
+    "django.contrib.postgres",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -83,6 +83,7 @@ SITE_ID = 1
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.middleware.QueryMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -287,6 +288,13 @@ STORAGES = {
     },
 }
 
+# Query metrics of views, see apps.core.middleware.QueryMetricsMiddleware
+QUERY_METRICS = is_true(os.getenv("QUERY_METRICS", "true"))
+# Log a possible N+1 when a request repeats a query this many times
+QUERY_DUPLICATE_WARNING = int(os.getenv("QUERY_DUPLICATE_WARNING", 10))
+# Bearer token of the Prometheus endpoint, the endpoint is disabled without it
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", None)
+
 # AWS S3 Credentials
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -297,12 +305,41 @@ AWS_S3_CUSTOM_DOMAIN = os.getenv("AWS_S3_CUSTOM_DOMAIN", None)
 # AWS CloudFront
 AWS_CLOUDFRONT_KEY_ID = os.getenv("AWS_CLOUDFRONT_KEY_ID").strip()
 AWS_CLOUDFRONT_KEY = os.getenv("AWS_CLOUDFRONT_KEY").encode("ascii").strip()
+# Parent domain of the API and the CDN (e.g. .example.com), playback session cookies are set on it
+AWS_CLOUDFRONT_COOKIE_DOMAIN = os.getenv("AWS_CLOUDFRONT_COOKIE_DOMAIN", None)
 # Default Chunk size in multi-part upload
 UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 50 * 1024 ** 2))
+# Ranged parallel download of S3 objects (source media for transcoding)
+DOWNLOAD_PART_SIZE = int(os.getenv("DOWNLOAD_PART_SIZE", 64 * 1024 ** 2))
+DOWNLOAD_CONCURRENCY = int(os.getenv("DOWNLOAD_CONCURRENCY", 8))
 # None means all
 value = os.getenv("ALLOWED_UPLOAD_FILE_EXTENSIONS")
 ALLOWED_UPLOAD_FILE_EXTENSIONS = split_with_comma(value) if value else None
 
+# HLS transcoding
+# Split create_master_playlist into a Celery chord: one task per rendition and per audio track
+HLS_PARALLEL_TRANSCODE = is_true(os.getenv("HLS_PARALLEL_TRANSCODE", "false"))
+# Parallel mode only: split each rendition into time chunks of N seconds (0 disables chunking).
+# Chunk tasks always read their range from a presigned S3 URL, whatever HLS_SOURCE_STREAMING says
+HLS_TRANSCODE_CHUNK_SECONDS = int(os.getenv("HLS_TRANSCODE_CHUNK_SECONDS", 0))
+# Threads uploading finished HLS segments to S3 while ffmpeg is still encoding
+HLS_UPLOAD_CONCURRENCY = int(os.getenv("HLS_UPLOAD_CONCURRENCY", 8))
+# Feed ffmpeg from a presigned S3 URL instead of downloading the source to a temp directory first
+HLS_SOURCE_STREAMING = is_true(os.getenv("HLS_SOURCE_STREAMING", "false"))
+# Cap rendition maxrate/bufsize at the source video bitrate (the ladder never upscales regardless)
+HLS_PER_TITLE_BITRATE = is_true(os.getenv("HLS_PER_TITLE_BITRATE", "true"))
+# Replaced builds stay in S3 this long for viewers still playing them
+HLS_BUILD_GRACE_HOURS = int(os.getenv("HLS_BUILD_GRACE_HOURS", 24))
+# Builds that never went live (failed or abandoned) are deleted after this long
+HLS_BUILD_STALE_HOURS = int(os.getenv("HLS_BUILD_STALE_HOURS", 48))
+# "redirect": every key request is authorized and redirected to a short-lived S3/CloudFront URL.
+# "token": the playback endpoint issues a signed token, key requests with it are served from the cache.
+HLS_KEY_DELIVERY = os.getenv("HLS_KEY_DELIVERY", "redirect")
+HLS_KEY_TOKEN_MAX_AGE = int(os.getenv("HLS_KEY_TOKEN_MAX_AGE", 60 * 60 * 4))
+HLS_KEY_CACHE_SECONDS = int(os.getenv("HLS_KEY_CACHE_SECONDS", 60 * 60 * 24))
+# CloudFront access to the build granted by the playback session endpoint
+HLS_PLAYBACK_SESSION_SECONDS = int(os.getenv("HLS_PLAYBACK_SESSION_SECONDS", 60 * 60 * 4))
+
 # Django money
 SERIALIZATION_MODULES = {"json": "djmoney.serializers"}
 DEFAULT_CURRENCY = "USD"
@@ -316,11 +353,24 @@ REDIS_PORT = os.getenv('REDIS_PORT')
 REDIS_DB = os.getenv('REDIS_DB')
 REDIS_URL = REDIS_HOST + ':' + REDIS_PORT + '/' + REDIS_DB
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+}
+
+# Watch permission decisions are cached per (user, video) and invalidated on changes,
+# the timeout only bounds how long an unnoticed change can live
+WATCH_PERMISSION_CACHE_SECONDS = int(os.getenv("WATCH_PERMISSION_CACHE_SECONDS", 60 * 10))
+# Catalogue responses are invalidated by tags on changes, see CachedResponseMixin
+RESPONSE_CACHE_SECONDS = int(os.getenv("RESPONSE_CACHE_SECONDS", 60 * 60))
+
 # Django Rest Framework configuration
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_VERSIONING_CLASS': 'rest_framework.versioning.AcceptHeaderVersioning',
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'apps.api.pagination.PageNumberOrCursorPagination',
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
     ],
@@ -372,6 +422,12 @@ SPECTACULAR_SETTINGS = {
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_IMPORTS = ["apps"]
+CELERY_BEAT_SCHEDULE = {
+    "sweep-hls-builds": {
+        "task": "apps.api.cinema.videos.tasks.sweep_hls_builds",
+        "schedule": 60 * 60,
+    },
+}
 
 # Stripe configuration
 STRIPE_PUBLISHABLE_KEY = os.getenv("STRIPE_PUBLISHABLE_KEY")
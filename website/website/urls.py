@@ -14,6 +14,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from apps.core.views import metrics
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
@@ -25,6 +26,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/schema/", include("apps.api.documentation")),
     path("api/", include("apps.api.urls")),
+    path("metrics", metrics, name="metrics"),
 ]
 
 # Serve media files from MEDIA_ROOT. It will only work when DEBUG=True is set.